@@ -0,0 +1,265 @@
+"""
+Benchmarks of the SDK's client-side hot paths against the local mock servers.
+
+Measures requests per second and p50/p99 latency of the RPC client (single calls,
+batches and concurrent fan-out), notifications per second through the WS dispatch
+path, and JSON encode/decode cost of realistic payloads. Results are printed, or
+written with --output, as JSON so runs can be compared between releases.
+
+    python benchmarks/run.py --output bench.json
+    python benchmarks/run.py --quick
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sdk.rpc import RPC
+from sdk.rpc.helpers.bridge import BridgedRPC
+from sdk.rpc.helpers.templates import HotRequests
+from sdk.testing.mock_server import MockResponses, MockRPCServer
+from sdk.ws.recording import ReplayWS, StreamRecorder
+
+
+def summarize(latencies, elapsed):
+    """
+    Returns throughput and latency percentiles of a run.
+
+    Args:
+        latencies (list): Seconds taken by each operation.
+        elapsed (float): Wall-clock seconds of the whole run.
+
+    Returns:
+        dict: count, per_second, and p50/p99/max latency in milliseconds.
+    """
+    latencies = sorted(latencies)
+    count = len(latencies)
+    return {
+        "count": count,
+        "per_second": count / elapsed if elapsed else None,
+        "p50_ms": latencies[count // 2] * 1000 if count else None,
+        "p99_ms": (
+            latencies[min(count - 1, int(count * 0.99))] * 1000 if count else None
+        ),
+        "max_ms": latencies[-1] * 1000 if count else None,
+    }
+
+
+def timed(call):
+    started = time.perf_counter()
+    call()
+    return time.perf_counter() - started
+
+
+def bench_rpc(url, requests, batch_size, workers):
+    client = RPC(url)
+    call = lambda: client.account.get_account_info("11111111111111111111111111111111")
+
+    for _ in range(min(requests, 50)):
+        call()
+
+    started = time.perf_counter()
+    single = [timed(call) for _ in range(requests)]
+    single = summarize(single, time.perf_counter() - started)
+
+    hot = HotRequests(client, encoding="base58")
+    template_call = lambda: hot.get_account_info("11111111111111111111111111111111")
+    started = time.perf_counter()
+    template = [timed(template_call) for _ in range(requests)]
+    template = summarize(template, time.perf_counter() - started)
+
+    calls = [("getAccountInfo", ["11111111111111111111111111111111"])] * batch_size
+    started = time.perf_counter()
+    batches = [
+        timed(lambda: client.batch(calls)) for _ in range(requests // batch_size)
+    ]
+    batch = summarize(batches, time.perf_counter() - started)
+    batch["batch_size"] = batch_size
+    batch["calls_per_second"] = batch["per_second"] * batch_size
+
+    with ThreadPoolExecutor(workers) as executor:
+        started = time.perf_counter()
+        fan_out = list(executor.map(lambda _: timed(call), range(requests)))
+        fan_out = summarize(fan_out, time.perf_counter() - started)
+        fan_out["workers"] = workers
+
+    return {
+        "single": single,
+        "template": template,
+        "batch": batch,
+        "fan_out": fan_out,
+    }
+
+
+def bench_bridge(url, requests, workers):
+    client = BridgedRPC(url, max_connections=workers)
+    params = ["11111111111111111111111111111111"]
+    for _ in range(min(requests, 50)):
+        client.submit("getAccountInfo", params).result()
+
+    started = time.perf_counter()
+    submitted = [
+        (time.perf_counter(), client.submit("getAccountInfo", params))
+        for _ in range(requests)
+    ]
+    latencies = []
+    for at, future in submitted:
+        future.result()
+        latencies.append(time.perf_counter() - at)
+    fan_out = summarize(latencies, time.perf_counter() - started)
+    fan_out["connections"] = workers
+    client.close()
+    return {"fan_out": fan_out}
+
+
+def bench_ws(notifications, decode):
+    responses = MockResponses(seed=1)
+    params = ["TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA", {"encoding": "base64"}]
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "stream.rec")
+        with StreamRecorder(path, compresslevel=1) as recorder:
+            recorder.subscription("programSubscribe", params, 1)
+            for _ in range(notifications):
+                method, result = responses.notification("programSubscribe", params)
+                recorder.message(
+                    json.dumps(
+                        {
+                            "jsonrpc": "2.0",
+                            "method": method,
+                            "params": {"result": result, "subscription": 1},
+                        },
+                        separators=(",", ":"),
+                    )
+                )
+
+        async def run():
+            client = ReplayWS(path, speed=None, decode_notifications=decode)
+            await client.program_subscribe(*params)
+            received = 0
+
+            async def handle(data):
+                nonlocal received
+                received += 1
+
+            client.play()
+            started = time.perf_counter()
+            await client.handle_notifications(handle)
+            return received, time.perf_counter() - started
+
+        received, elapsed = asyncio.run(run())
+
+    return {
+        "count": received,
+        "per_second": received / elapsed if elapsed else None,
+        "decode_notifications": decode,
+    }
+
+
+def bench_json(repeat):
+    responses = MockResponses(seed=1, program_accounts=1000, block_transactions=200)
+    payloads = {
+        "getBlock": {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "result": responses.block(responses.slot),
+        },
+        "getProgramAccounts": {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "result": responses.result("getProgramAccounts", ["PROGRAM"]),
+        },
+        "programNotification": {
+            "jsonrpc": "2.0",
+            "method": "programNotification",
+            "params": {
+                "result": responses.notification("programSubscribe", [])[1],
+                "subscription": 1,
+            },
+        },
+    }
+
+    results = {}
+    for name, payload in payloads.items():
+        text = json.dumps(payload)
+        count = max(1, repeat * 1000 // len(text))
+
+        started = time.perf_counter()
+        for _ in range(count):
+            json.dumps(payload)
+        encode = (time.perf_counter() - started) / count
+
+        started = time.perf_counter()
+        for _ in range(count):
+            json.loads(text)
+        decode = (time.perf_counter() - started) / count
+
+        results[name] = {
+            "bytes": len(text),
+            "encode_ms": encode * 1000,
+            "decode_ms": decode * 1000,
+            "decode_mb_per_second": len(text) / decode / 1e6,
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--requests", type=int, default=2000, help="RPC calls per scenario"
+    )
+    parser.add_argument("--batch-size", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=8, help="threads of the fan-out")
+    parser.add_argument("--notifications", type=int, default=50000)
+    parser.add_argument(
+        "--json-repeat", type=int, default=20000, help="KB of JSON per payload"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="mock server latency (s)"
+    )
+    parser.add_argument(
+        "--quick", action="store_true", help="small run for smoke testing"
+    )
+    parser.add_argument("--output", help="write the results to this file")
+    args = parser.parse_args()
+
+    if args.quick:
+        args.requests, args.notifications, args.json_repeat = 200, 5000, 2000
+
+    results = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "time": time.time(),
+    }
+
+    with MockRPCServer(latency=args.latency) as server:
+        results["rpc"] = bench_rpc(
+            server.url, args.requests, args.batch_size, args.workers
+        )
+        try:
+            results["bridge"] = bench_bridge(server.url, args.requests, args.workers)
+        except Exception as e:  # aiohttp is optional
+            results["bridge"] = {"error": str(e)}
+    results["ws"] = {
+        "decoded": bench_ws(args.notifications, decode=True),
+        "raw": bench_ws(args.notifications, decode=False),
+    }
+    results["json"] = bench_json(args.json_repeat)
+
+    report = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(report)
+    print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,10 +6,20 @@ from sdk.rpc.wrappers.transaction import TransactionAPI
 from sdk.rpc.wrappers.staking import StakingAPI
 from sdk.rpc.wrappers.performance import PerformanceAPI
 from sdk.rpc.helpers.session import SessionManager
+from sdk.rpc.helpers.connect_timer import pop_connect_time
+from sdk.rpc.helpers.compression import (
+    ACCEPT_ENCODING,
+    COMPRESSED_METHODS,
+    read_body,
+    wire_size,
+)
+from sdk.tracing import RequestTrace, run_hooks
 
+import json
+import time
 import requests
 
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
 
 
 class RPC:
@@ -28,9 +38,9 @@ class RPC:
             rpc_url (str): RPC URL (containing the API key)
         """
         self.url = rpc_url
-        self.headers = headers = {
+        self.headers = {
             "accept": "*/*",
-            "accept-encoding": "gzip, deflate, br, zstd",
+            "accept-encoding": ACCEPT_ENCODING,
             "accept-language": "en-US,en;q=0.6",
             "content-type": "application/json",
             "origin": "https://pump.fun",
@@ -47,6 +57,10 @@ class RPC:
             "user-agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/134.0.0.0 Safari/537.36",
         }
 
+        # Methods whose responses are requested compressed; other (small) responses
+        # are requested uncompressed.
+        self.compressed_methods = set(COMPRESSED_METHODS)
+
         self.account = AccountAPI(self)
         self.block = BlockAPI(self)
         self.cluster = ClusterAPI(self)
@@ -55,8 +69,44 @@ class RPC:
         self.staking = StakingAPI(self)
         self.performance = PerformanceAPI(self)
 
+        # Set to a SlotClock to fill in minContextSlot where it is accepted.
+        self.slot_clock = None
+
+        # Callables receiving a RequestTrace (sdk.tracing) before each request is sent
+        # and after its response is decoded (or the request failed).
+        self.before_request_hooks = []
+        self.after_response_hooks = []
+
+        self.session = self._create_session()
+
+        # compressed -> (PreparedRequest, send settings) for pre-encoded requests
+        self._prepared = {}
+
+    def _create_session(self):
+        """Returns the requests session used to send requests (warmed up)."""
         session_manager = SessionManager()
-        self.session = session_manager.create_session("", self.url)
+        return session_manager.create_session("", self.url)
+
+    def _request_headers(self, compressed: bool) -> Dict:
+        """
+        Returns the headers of a request, built from the current `headers`.
+
+        Args:
+            compressed (bool): Whether to accept a compressed response
+
+        Returns:
+            Dict: The headers to send
+        """
+        if compressed:
+            return self.headers
+        return {**self.headers, "accept-encoding": "identity"}
+
+    def prepare_headers(self):
+        """
+        Drop the prepared requests used for pre-encoded (templated) calls, so they are
+        prepared again from the current `headers`. Call after changing the headers.
+        """
+        self._prepared = {}
 
     def _make_request(self, method: str, params: Any = None) -> Dict:
         """
@@ -74,7 +124,165 @@ class RPC:
         if params is not None:
             payload["params"] = params
 
-        response = self.session.post(self.url, headers=self.headers, json=payload)
-        print(response.elapsed.total_seconds())
+        compressed = method in self.compressed_methods
+        if self.before_request_hooks or self.after_response_hooks:
+            return self._traced_post(method, payload, compressed)
+
+        return self._post(payload, compressed)
+
+    def _post(self, payload: Any, compressed: bool) -> Any:
+        """
+        Send a request and decode its response.
+
+        Args:
+            payload (Any): The JSON-RPC request or batch
+            compressed (bool): Whether to accept a compressed response
+
+        Returns:
+            Any: The decoded JSON response
+        """
+        response = self.session.post(
+            self.url,
+            headers=self._request_headers(compressed),
+            json=payload,
+            stream=True,
+        )
+        return json.loads(read_body(response))
+
+    def _post_encoded(self, method: str, body: bytes, compressed: bool) -> Any:
+        """
+        Send an already encoded request and decode its response.
+
+        The URL, merged headers and connection settings are prepared once and reused,
+        so only the body changes from call to call.
+
+        Args:
+            method (str): The RPC method reported in traces
+            body (bytes): The encoded JSON-RPC request
+            compressed (bool): Whether to accept a compressed response
+
+        Returns:
+            Any: The decoded JSON response
+        """
+        if self.before_request_hooks or self.after_response_hooks:
+            return self._traced_post(method, body, compressed)
+
+        prepared = self._prepared.get(compressed)
+        if prepared is None:
+            prepared = self._prepared[compressed] = self._prepare(compressed)
+        template, settings = prepared
+
+        request = template.copy()
+        request.body = body
+        request.headers["Content-Length"] = str(len(body))
+        response = self.session.send(request, **settings)
+        return json.loads(read_body(response))
+
+    def _prepare(self, compressed: bool) -> Tuple[requests.PreparedRequest, Dict]:
+        """
+        Prepare a POST to the RPC URL with the session and client headers merged in.
+
+        Args:
+            compressed (bool): Whether to accept a compressed response
+
+        Returns:
+            Tuple[requests.PreparedRequest, Dict]: The request (without body) and the
+            keyword arguments of `session.send`
+        """
+        request = requests.Request(
+            "POST",
+            self.url,
+            headers=self._request_headers(compressed),
+            data=b"{}",
+        )
+        prepared = self.session.prepare_request(request)
+        settings = self.session.merge_environment_settings(
+            prepared.url, {}, True, None, None
+        )
+        return prepared, settings
+
+    def _traced_post(
+        self, method: str, payload: Any, compressed: bool, queue_wait: float = 0.0
+    ) -> Any:
+        """
+        Send a request, timing each phase and running the tracing hooks around it.
+
+        Args:
+            method (str): The RPC method (or "batch") reported in the trace
+            payload (Any): The JSON-RPC request or batch, or its encoding
+            compressed (bool): Whether to accept a compressed response
+            queue_wait (float, optional): Seconds the call waited before being sent
+
+        Returns:
+            Any: The decoded JSON response
+        """
+        started = time.perf_counter()
+        body = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+        trace = RequestTrace(method, self.url, len(body))
+        trace.queue_wait = queue_wait
+        trace.encode = time.perf_counter() - started
+        run_hooks(self.before_request_hooks, trace)
+
+        pop_connect_time()
+        sent = time.perf_counter()
+        try:
+            response = self.session.post(
+                self.url,
+                headers=self._request_headers(compressed),
+                data=body,
+                stream=True,
+            )
+            received = time.perf_counter()
+            trace.status = response.status_code
+            trace.connect = pop_connect_time()
+            trace.ttfb = received - sent - trace.connect
+
+            content = read_body(response)
+            downloaded = time.perf_counter()
+            trace.download = downloaded - received
+            trace.response_bytes = len(content)
+            trace.wire_bytes = wire_size(response)
+
+            result = json.loads(content)
+            trace.decode = time.perf_counter() - downloaded
+            if isinstance(result, dict) and "error" in result:
+                trace.error = result["error"]
+            return result
+        except Exception as e:
+            trace.error = e
+            raise
+        finally:
+            trace.total = trace.encode + time.perf_counter() - sent
+            run_hooks(self.after_response_hooks, trace)
+
+    def batch(self, calls: List[Tuple[str, Any]]) -> List[Dict]:
+        """
+        Send several RPC calls in a single JSON-RPC batch request.
+
+        Args:
+            calls (List[Tuple[str, Any]]): (method, params) pairs
+
+        Returns:
+            List[Dict]: The JSON response of each call, in the order of `calls`
+        """
+        payload = []
+        for index, (method, params) in enumerate(calls):
+            request = {"jsonrpc": "2.0", "id": index, "method": method}
+            if params is not None:
+                request["params"] = params
+            payload.append(request)
+
+        compressed = any(method in self.compressed_methods for method, _ in calls)
+        if self.before_request_hooks or self.after_response_hooks:
+            responses = self._traced_post("batch", payload, compressed)
+        else:
+            responses = self._post(payload, compressed)
+        if not isinstance(responses, list):
+            # The whole batch was rejected (rate limited, malformed, ...).
+            return [responses] * len(calls)
 
-        return response.json()
+        ordered = [None] * len(calls)
+        for item in responses:
+            if isinstance(item.get("id"), int) and 0 <= item["id"] < len(calls):
+                ordered[item["id"]] = item
+        return ordered
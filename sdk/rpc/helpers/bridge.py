@@ -0,0 +1,305 @@
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any
+
+from sdk.rpc import RPC
+from sdk.tracing import RequestTrace, run_hooks
+
+_shared_loop = None
+_shared_loop_lock = threading.Lock()
+
+
+class EventLoopThread:
+    """
+    An asyncio event loop running in a daemon thread, accepting coroutines from any thread.
+    """
+
+    def __init__(self):
+        self.loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Start the loop thread, if it is not running yet."""
+        with self._lock:
+            if self._thread is not None:
+                return
+
+            self.loop = asyncio.new_event_loop()
+            running = threading.Event()
+            self.loop.call_soon(running.set)
+            self._thread = threading.Thread(
+                target=self.loop.run_forever, name="rpc-event-loop", daemon=True
+            )
+            self._thread.start()
+            running.wait()
+
+    def stop(self):
+        """Stop the loop and wait for its thread to exit."""
+        with self._lock:
+            if self._thread is None:
+                return
+
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join()
+            self.loop.close()
+            self.loop = None
+            self._thread = None
+
+    def submit(self, coroutine) -> Future:
+        """
+        Schedule a coroutine on the loop.
+
+        Args:
+            coroutine: The coroutine to run
+
+        Returns:
+            Future: A concurrent.futures.Future resolving to the coroutine's result
+        """
+        self.start()
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    def in_loop_thread(self) -> bool:
+        """Returns True when called from the loop's own thread."""
+        return self._thread is threading.current_thread()
+
+
+def shared_loop() -> EventLoopThread:
+    """
+    Returns the process-wide event loop thread used by bridged clients by default.
+
+    Returns:
+        EventLoopThread: The shared loop thread (started on first use)
+    """
+    global _shared_loop
+    with _shared_loop_lock:
+        if _shared_loop is None:
+            _shared_loop = EventLoopThread()
+        return _shared_loop
+
+
+async def _on_queued_start(session, context, params):
+    context.trace_request_ctx["queued"] = time.perf_counter()
+
+
+async def _on_queued_end(session, context, params):
+    timing = context.trace_request_ctx
+    timing["queue_wait"] = time.perf_counter() - timing.pop("queued")
+
+
+async def _on_connect_start(session, context, params):
+    context.trace_request_ctx["connecting"] = time.perf_counter()
+
+
+async def _on_connect_end(session, context, params):
+    timing = context.trace_request_ctx
+    timing["connect"] = time.perf_counter() - timing.pop("connecting")
+
+
+class BridgedRPC(RPC):
+    """
+    RPC client for synchronous code, sending its requests through an aiohttp connection
+    pool on a background event loop.
+
+    The API is the same as RPC's, and blocking calls can be made from any number of
+    threads: they all share one pool of keep-alive connections instead of one
+    connection per thread. `submit` returns a concurrent.futures.Future instead of
+    blocking, for fan-out from a single thread:
+
+        rpc = BridgedRPC(url, max_connections=64)
+        futures = [rpc.submit("getAccountInfo", [pubkey]) for pubkey in pubkeys]
+        accounts = [future.result() for future in futures]
+
+    Requests are encoded, and before-request hooks run, in the calling thread;
+    after-response hooks run on the loop thread. `queue_wait` in traces covers the wait
+    for the loop and for a free connection of the pool. Requires aiohttp.
+    """
+
+    def __init__(
+        self,
+        rpc_url: str,
+        max_connections: int = 100,
+        timeout: float = 30.0,
+        loop: EventLoopThread = None,
+    ):
+        """
+        Initialize the bridged client.
+
+        Args:
+            rpc_url (str): RPC URL (containing the API key)
+            max_connections (int, optional): Size of the connection pool
+            timeout (float, optional): Seconds before a request fails
+            loop (EventLoopThread, optional): The loop to run on, the shared loop by default
+        """
+        try:
+            import aiohttp
+        except ImportError:
+            raise Exception("BridgedRPC requires aiohttp: pip install aiohttp")
+
+        super().__init__(rpc_url)
+        self._aiohttp = aiohttp
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.loop_thread = loop or shared_loop()
+        self._session = None
+
+        # aiohttp advertises the encodings it can decode itself.
+        self.headers.pop("accept-encoding", None)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _create_session(self):
+        # Requests go through the aiohttp pool: no requests session or warm-up call.
+        return None
+
+    def close(self):
+        """Close the connection pool (the event loop keeps running)."""
+        if self._session is not None and self.loop_thread.loop is not None:
+            self.loop_thread.submit(self._close_session()).result()
+
+    def submit(self, method: str, params: Any = None) -> Future:
+        """
+        Send an RPC request without waiting for the response.
+
+        Args:
+            method (str): The RPC method to invoke
+            params (Any, optional): Parameters for the request
+
+        Returns:
+            Future: A concurrent.futures.Future resolving to the JSON response
+        """
+        payload = {"jsonrpc": "2.0", "id": 1, "method": method}
+
+        if params is not None:
+            payload["params"] = params
+
+        return self._submit(method, payload, method in self.compressed_methods)
+
+    def _post(self, payload: Any, compressed: bool) -> Any:
+        method = payload["method"] if isinstance(payload, dict) else "batch"
+        self._check_thread()
+        return self._submit(method, payload, compressed).result()
+
+    def _traced_post(
+        self, method: str, payload: Any, compressed: bool, queue_wait: float = 0.0
+    ) -> Any:
+        self._check_thread()
+        return self._submit(method, payload, compressed).result()
+
+    def _post_encoded(self, method: str, body: bytes, compressed: bool) -> Any:
+        self._check_thread()
+        return self._submit(method, body, compressed).result()
+
+    def _check_thread(self):
+        # Blocking the loop thread on its own future would never return.
+        if self.loop_thread.in_loop_thread():
+            raise Exception(
+                "Blocking BridgedRPC call on its own event loop; use submit() instead"
+            )
+
+    def _submit(self, method: str, payload: Any, compressed: bool) -> Future:
+        """
+        Encode a request and schedule it on the loop.
+
+        Args:
+            method (str): The RPC method (or "batch") reported in the trace
+            payload (Any): The JSON-RPC request or batch, or its encoding
+            compressed (bool): Whether to accept a compressed response
+
+        Returns:
+            Future: A concurrent.futures.Future resolving to the decoded JSON response
+        """
+        started = time.perf_counter()
+        body = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+        trace = None
+        if self.before_request_hooks or self.after_response_hooks:
+            trace = RequestTrace(method, self.url, len(body))
+            trace.encode = time.perf_counter() - started
+            run_hooks(self.before_request_hooks, trace)
+
+        return self.loop_thread.submit(
+            self._send(body, compressed, trace, time.perf_counter())
+        )
+
+    async def _send(
+        self, body: bytes, compressed: bool, trace: RequestTrace, submitted: float
+    ) -> Any:
+        """
+        Send an encoded request on the pool and decode the response.
+
+        Args:
+            body (bytes): The encoded request
+            compressed (bool): Whether to accept a compressed response
+            trace (RequestTrace): The trace to fill in, or None
+            submitted (float): `time.perf_counter()` when the request was submitted
+
+        Returns:
+            Any: The decoded JSON response
+        """
+        started = time.perf_counter()
+        timing = {}  # queue_wait and connect, filled in by the session's trace config
+        try:
+            async with self._get_session().post(
+                self.url,
+                data=body,
+                headers=self._request_headers(compressed),
+                trace_request_ctx=timing,
+            ) as response:
+                received = time.perf_counter()
+                content = await response.read()
+            downloaded = time.perf_counter()
+            result = json.loads(content)
+
+            if trace is not None:
+                trace.status = response.status
+                trace.queue_wait = started - submitted + timing.get("queue_wait", 0.0)
+                trace.connect = timing.get("connect", 0.0)
+                trace.ttfb = (
+                    received - started - trace.connect - timing.get("queue_wait", 0.0)
+                )
+                trace.download = downloaded - received
+                trace.response_bytes = len(content)
+                length = response.headers.get("Content-Length")
+                trace.wire_bytes = int(length) if length else None
+                trace.decode = time.perf_counter() - downloaded
+                if isinstance(result, dict) and "error" in result:
+                    trace.error = result["error"]
+            return result
+        except Exception as e:
+            if trace is not None:
+                trace.error = e
+            raise
+        finally:
+            if trace is not None:
+                trace.total = trace.encode + time.perf_counter() - submitted
+                run_hooks(self.after_response_hooks, trace)
+
+    def _get_session(self):
+        """
+        Returns the aiohttp session, creating it on first use (on the loop thread).
+        """
+        if self._session is None or self._session.closed:
+            aiohttp = self._aiohttp
+            trace_config = aiohttp.TraceConfig()
+            trace_config.on_connection_queued_start.append(_on_queued_start)
+            trace_config.on_connection_queued_end.append(_on_queued_end)
+            trace_config.on_connection_create_start.append(_on_connect_start)
+            trace_config.on_connection_create_end.append(_on_connect_end)
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                trace_configs=[trace_config],
+            )
+        return self._session
+
+    async def _close_session(self):
+        session, self._session = self._session, None
+        if session is not None:
+            await session.close()
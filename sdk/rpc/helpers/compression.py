@@ -0,0 +1,61 @@
+from requests.utils import DEFAULT_ACCEPT_ENCODING
+
+# The encodings urllib3 can decode in this environment: gzip and deflate always, br
+# with brotli (or brotlicffi) installed, zstd with zstandard installed.
+ACCEPT_ENCODING = DEFAULT_ACCEPT_ENCODING
+
+# Methods whose responses are usually large enough for compression to pay off.
+COMPRESSED_METHODS = frozenset(
+    (
+        "getBlock",
+        "getBlocks",
+        "getBlocksWithLimit",
+        "getClusterNodes",
+        "getInflationReward",
+        "getLargestAccounts",
+        "getLeaderSchedule",
+        "getMultipleAccounts",
+        "getProgramAccounts",
+        "getRecentPerformanceSamples",
+        "getSignaturesForAddress",
+        "getTokenAccountsByDelegate",
+        "getTokenAccountsByOwner",
+        "getTokenLargestAccounts",
+        "getTransaction",
+        "getVoteAccounts",
+    )
+)
+
+# Bytes of wire data read (and decompressed) at a time.
+CHUNK_SIZE = 65536
+
+
+def read_body(response, chunk_size=CHUNK_SIZE):
+    """
+    Read the body of a streamed response, decompressing it chunk by chunk.
+
+    Decompression keeps pace with the download instead of waiting for the compressed
+    body, and no copy of the compressed body is kept.
+
+    Args:
+        response (requests.Response): A response requested with `stream=True`.
+        chunk_size (int, optional): Bytes read from the connection at a time.
+
+    Returns:
+        bytes: The decompressed body.
+    """
+    return b"".join(response.raw.stream(chunk_size, decode_content=True))
+
+
+def wire_size(response):
+    """
+    Returns the number of (possibly compressed) body bytes read from the connection.
+
+    Args:
+        response (requests.Response): A response whose body has been read.
+
+    Returns:
+        int or None: The size, or None if the connection does not report it.
+    """
+    tell = getattr(response.raw, "tell", None)
+    return tell() if tell is not None else None
@@ -0,0 +1,70 @@
+import threading
+import time
+
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+# Seconds spent opening connections on this thread since the last `pop_connect_time`.
+_local = threading.local()
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _local.elapsed = (
+                getattr(_local, "elapsed", 0.0) + time.perf_counter() - started
+            )
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _local.elapsed = (
+                getattr(_local, "elapsed", 0.0) + time.perf_counter() - started
+            )
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+def install_connect_timer(session):
+    """
+    Make the connection pools of a requests session time new connections.
+
+    Existing pooled connections are dropped, so every later connection is timed.
+
+    Args:
+        session (requests.Session): The session.
+    """
+    for adapter in session.adapters.values():
+        poolmanager = adapter.poolmanager
+        if poolmanager.pool_classes_by_scheme.get("https") is _TimedHTTPSConnectionPool:
+            continue
+        poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+        poolmanager.clear()
+
+
+def pop_connect_time():
+    """
+    Returns the seconds this thread spent opening connections since the last call.
+
+    Returns:
+        float: Connect time in seconds.
+    """
+    elapsed = getattr(_local, "elapsed", 0.0)
+    _local.elapsed = 0.0
+    return elapsed
@@ -0,0 +1,29 @@
+from typing import Union
+
+B58_ALPHABET = b"123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+
+def b58encode(data: Union[bytes, bytearray, memoryview]) -> str:
+    """
+    Encode raw bytes (such as a 32 byte public key) as a base-58 string.
+
+    Args:
+        data (bytes): The bytes to encode
+
+    Returns:
+        str: The base-58 encoded string
+    """
+    data = bytes(data)
+    stripped = data.lstrip(b"\0")
+    leading_zeros = len(data) - len(stripped)
+
+    number = int.from_bytes(stripped, "big")
+    encoded = bytearray()
+    while number:
+        number, remainder = divmod(number, 58)
+        encoded.append(B58_ALPHABET[remainder])
+
+    encoded.extend(B58_ALPHABET[0:1] * leading_zeros)
+    encoded.reverse()
+
+    return encoded.decode("ascii")
@@ -0,0 +1,219 @@
+import threading
+from array import array
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sdk.rpc.helpers.rate_limit import RateLimiter
+
+MISSING = -1
+
+
+class RewardTable:
+    """
+    Address x epoch table of inflation rewards produced by InflationRewardHistory.
+
+    Values are stored row-major (one row per address, one column per epoch) in flat
+    typed arrays; cells without a reward hold MISSING.
+    """
+
+    __slots__ = (
+        "addresses",
+        "epochs",
+        "amounts",
+        "post_balances",
+        "errors",
+        "_rows",
+        "_columns",
+    )
+
+    def __init__(self, addresses: List[str], epochs: List[int]):
+        self.addresses = addresses
+        self.epochs = epochs
+        size = len(addresses) * len(epochs)
+        self.amounts = array("q", [MISSING]) * size
+        self.post_balances = array("q", [MISSING]) * size
+        # (epoch, address) -> error, for cells whose request failed
+        self.errors: Dict[Tuple[int, str], Any] = {}
+        self._rows = {address: i for i, address in enumerate(addresses)}
+        self._columns = {epoch: i for i, epoch in enumerate(epochs)}
+
+    def _set(self, address: str, epoch: int, reward: Optional[Dict]):
+        if reward is None:
+            return
+        i = self._rows[address] * len(self.epochs) + self._columns[epoch]
+        self.amounts[i] = reward["amount"]
+        self.post_balances[i] = reward["postBalance"]
+
+    def get(self, address: str, epoch: int) -> Optional[int]:
+        """
+        Returns the reward amount of an address for an epoch.
+
+        Args:
+            address (str): Address to look up
+            epoch (int): Epoch to look up
+
+        Returns:
+            Optional[int]: Reward in lamports, or None if there was no reward
+        """
+        amount = self.amounts[
+            self._rows[address] * len(self.epochs) + self._columns[epoch]
+        ]
+        return None if amount == MISSING else amount
+
+    def row(self, address: str) -> Dict[int, int]:
+        """
+        Returns every reward of an address.
+
+        Args:
+            address (str): Address to look up
+
+        Returns:
+            Dict[int, int]: Epoch -> reward amount, for epochs with a reward
+        """
+        start = self._rows[address] * len(self.epochs)
+        return {
+            epoch: amount
+            for epoch, amount in zip(
+                self.epochs, self.amounts[start : start + len(self.epochs)]
+            )
+            if amount != MISSING
+        }
+
+    def total(self, address: str) -> int:
+        """
+        Returns the sum of an address' rewards over all epochs in the table.
+
+        Args:
+            address (str): Address to look up
+
+        Returns:
+            int: Total reward in lamports
+        """
+        return sum(self.row(address).values())
+
+
+class InflationRewardHistory:
+    """
+    Bulk getInflationReward fetcher across many addresses and epochs.
+
+    Addresses are split into chunks and every (epoch, chunk) pair is fetched concurrently
+    under a request budget. Rewards are cached and never requested again by the same
+    instance once final: those of epochs ended at least two epochs ago, and rewards already
+    paid for the previous epoch (whose rewards are paid out during the current one).
+    """
+
+    def __init__(
+        self,
+        client,
+        chunk_size: int = 100,
+        max_workers: int = 8,
+        requests_per_second: float = None,
+        commitment: str = None,
+    ):
+        """
+        Initialize the reward history fetcher.
+
+        Args:
+            client: Parent RPC client instance
+            chunk_size (int, optional): Number of addresses per getInflationReward call
+            max_workers (int, optional): Number of requests in flight at once
+            requests_per_second (float, optional): Request budget shared by all workers
+            commitment (str, optional): Commitment level to use (confirmed or finalized)
+        """
+        self.client = client
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self.rate_limiter = (
+            RateLimiter(requests_per_second) if requests_per_second else None
+        )
+        self.commitment = commitment
+
+        # epoch -> address -> reward (None if the address earned nothing)
+        self._finalized: Dict[int, Dict[str, Optional[Dict]]] = {}
+        self._lock = threading.Lock()
+
+    def fetch(
+        self, addresses: Iterable[str], epochs: Iterable[int], current_epoch: int = None
+    ) -> RewardTable:
+        """
+        Fetch the rewards of every address for every epoch.
+
+        Args:
+            addresses (Iterable[str]): Stake or vote account addresses
+            epochs (Iterable[int]): Epochs to fetch
+            current_epoch (int, optional): The current epoch, fetched with getEpochInfo if
+                omitted. Decides which rewards are cached as final.
+
+        Returns:
+            RewardTable: Address x epoch reward table. Cells whose requests failed are listed
+                in `errors`.
+        """
+        addresses = list(dict.fromkeys(addresses))
+        epochs = sorted(set(epochs))
+        table = RewardTable(addresses, epochs)
+
+        if current_epoch is None:
+            response = self.client.cluster.get_epoch_info(commitment=self.commitment)
+            if "result" not in response:
+                raise Exception(f"Error fetching epoch info: {response.get('error')}")
+            current_epoch = response["result"]["epoch"]
+
+        tasks = []
+        for epoch in epochs:
+            cached = self._finalized.get(epoch, {})
+            missing = [address for address in addresses if address not in cached]
+            for address in addresses:
+                if address in cached:
+                    table._set(address, epoch, cached[address])
+            for start in range(0, len(missing), self.chunk_size):
+                tasks.append((epoch, missing[start : start + self.chunk_size]))
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self._fetch, chunk, epoch): (epoch, chunk)
+                for epoch, chunk in tasks
+            }
+
+            for future in as_completed(futures):
+                epoch, chunk = futures[future]
+                try:
+                    response = future.result()
+                except Exception as e:
+                    for address in chunk:
+                        table.errors[(epoch, address)] = str(e)
+                    continue
+
+                if "result" not in response:
+                    for address in chunk:
+                        table.errors[(epoch, address)] = response.get("error")
+                    continue
+
+                rewards = dict(zip(chunk, response["result"]))
+                for address, reward in rewards.items():
+                    table._set(address, epoch, reward)
+
+                if epoch == current_epoch - 1:
+                    # Still being paid out: a missing reward may only be late.
+                    rewards = {
+                        address: reward
+                        for address, reward in rewards.items()
+                        if reward is not None
+                    }
+                if epoch < current_epoch:
+                    with self._lock:
+                        self._finalized.setdefault(epoch, {}).update(rewards)
+
+        return table
+
+    def clear(self):
+        """Drop every cached reward."""
+        with self._lock:
+            self._finalized.clear()
+
+    def _fetch(self, addresses: List[str], epoch: int) -> Dict:
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+
+        return self.client.staking.get_inflation_reward(
+            addresses, epoch=epoch, commitment=self.commitment
+        )
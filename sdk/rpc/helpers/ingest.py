@@ -0,0 +1,354 @@
+import json
+import multiprocessing
+import os
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from sdk.rpc import RPC
+from sdk.rpc.helpers.rate_limit import RateLimiter
+
+# getBlocks accepts at most this many slots per call.
+MAX_GET_BLOCKS_RANGE = 500_000
+
+# getBlock errors meaning the slot has no block (skipped, or missing from long-term storage).
+SKIPPED_SLOT_ERRORS = (-32007, -32009)
+
+
+class BackfillRunner:
+    """
+    Fetches and decodes every block of a slot range in a pool of worker processes.
+
+    The range is split into shards of `shard_size` slots, handed out to `workers`
+    processes as they become free. Each worker has its own RPC client (and connection
+    pool), lists the blocks of a shard with getBlocks and fetches them with getBlock,
+    `concurrency` at a time, so JSON decoding runs on every core instead of one.
+
+    `transform(slot, block)` runs in the worker and should reduce the block to what the
+    caller needs: only its return value is sent back to the parent, through a bounded
+    queue that stalls the workers when the consumer falls behind. It must be picklable
+    (a module-level function). Workers are started with the spawn method by default, so
+    the calling script needs an `if __name__ == "__main__":` guard.
+
+    With a `checkpoint` path, the next slot of every shard is saved once the consumer
+    has taken the blocks before it, and a later run with the same range and shard size
+    resumes where this one stopped.
+    """
+
+    def __init__(
+        self,
+        rpc_url: str,
+        start_slot: int,
+        end_slot: int,
+        transform: Callable[[int, Dict], Any] = None,
+        workers: int = None,
+        shard_size: int = 10_000,
+        concurrency: int = 4,
+        queue_size: int = 256,
+        requests_per_second: float = None,
+        checkpoint: str = None,
+        checkpoint_interval: float = 5.0,
+        encoding: str = "json",
+        transaction_details: str = "full",
+        commitment: str = "finalized",
+        max_supported_transaction_version: int = 0,
+        retries: int = 3,
+        start_method: str = "spawn",
+    ):
+        """
+        Initialize the backfill runner.
+
+        Args:
+            rpc_url (str): RPC URL (containing the API key)
+            start_slot (int): First slot of the range
+            end_slot (int): Last slot of the range (inclusive)
+            transform (Callable[[int, Dict], Any], optional): Applied to (slot, block) in the
+                worker; the block itself is returned if omitted
+            workers (int, optional): Number of worker processes, one per core by default
+            shard_size (int, optional): Number of slots per shard
+            concurrency (int, optional): getBlock requests in flight per worker
+            queue_size (int, optional): Number of results buffered between workers and consumer
+            requests_per_second (float, optional): Request budget shared by all workers
+            checkpoint (str, optional): Path of the checkpoint file
+            checkpoint_interval (float, optional): Seconds between checkpoint writes
+            encoding (str, optional): Encoding of the fetched blocks
+            transaction_details (str, optional): Level of transaction detail to fetch
+            commitment (str, optional): Commitment level to use
+            max_supported_transaction_version (int, optional): The max transaction version to return
+            retries (int, optional): Retries of a failed request, with exponential backoff
+            start_method (str, optional): multiprocessing start method of the workers
+        """
+        if end_slot < start_slot:
+            raise ValueError("end_slot must not be lower than start_slot")
+
+        self.rpc_url = rpc_url
+        self.start_slot = start_slot
+        self.end_slot = end_slot
+        self.transform = transform
+        self.workers = workers or os.cpu_count() or 1
+        self.shard_size = shard_size
+        self.concurrency = concurrency
+        self.queue_size = queue_size
+        self.requests_per_second = requests_per_second
+        self.checkpoint = checkpoint
+        self.checkpoint_interval = checkpoint_interval
+        self.start_method = start_method
+        self.options = {
+            "encoding": encoding,
+            "transaction_details": transaction_details,
+            "commitment": commitment,
+            "max_supported_transaction_version": max_supported_transaction_version,
+            "retries": retries,
+        }
+
+        self.blocks = 0
+        self.skipped = 0
+        # slot -> error, for blocks that could not be fetched
+        self.errors: Dict[int, Any] = {}
+        self.failed_shards: Dict[int, str] = {}  # shard start slot -> error
+        # shard start slot -> next slot to deliver, None once the shard is done
+        self._progress: Dict[int, int] = {}
+        self._started = None
+
+    def shards(self) -> List[Tuple[int, int]]:
+        """
+        Returns the (first slot, last slot) of every shard of the range.
+
+        Returns:
+            List[Tuple[int, int]]: The shards
+        """
+        return [
+            (start, min(start + self.shard_size - 1, self.end_slot))
+            for start in range(self.start_slot, self.end_slot + 1, self.shard_size)
+        ]
+
+    def run(self) -> Iterator[Tuple[int, Any]]:
+        """
+        Run the backfill, yielding the transformed blocks as they arrive.
+
+        Blocks of one shard are yielded in slot order; shards are interleaved. Skipped
+        slots are not yielded, and blocks that still fail after the retries are recorded
+        in `errors`.
+
+        Yields:
+            Tuple[int, Any]: (slot, transformed block)
+        """
+        self._load_checkpoint()
+        pending = [
+            (start, self._progress.get(start, start), end)
+            for start, end in self.shards()
+            if self._progress.get(start, start) is not None
+        ]
+        for start, _, _ in pending:
+            self.failed_shards.pop(start, None)
+        if not pending:
+            return
+
+        context = multiprocessing.get_context(self.start_method)
+        tasks = context.Queue()
+        results = context.Queue(self.queue_size)
+        for task in pending:
+            tasks.put(task)
+
+        count = min(self.workers, len(pending))
+        rate = self.requests_per_second / count if self.requests_per_second else None
+        processes = [
+            context.Process(
+                target=_run_worker,
+                args=(
+                    self.rpc_url,
+                    tasks,
+                    results,
+                    self.transform,
+                    self.concurrency,
+                    rate,
+                    self.options,
+                ),
+                daemon=True,
+            )
+            for _ in range(count)
+        ]
+        for _ in processes:
+            tasks.put(None)
+        for process in processes:
+            process.start()
+
+        self._started = time.monotonic()
+        saved_at = time.monotonic()
+        remaining = len(pending)
+        try:
+            while remaining:
+                try:
+                    kind, shard, slot, value = results.get(timeout=1.0)
+                except queue.Empty:
+                    if not any(process.is_alive() for process in processes):
+                        raise Exception(
+                            f"Backfill workers exited with {remaining} shards unfinished"
+                        )
+                    continue
+
+                if kind == "block":
+                    yield slot, value
+                    self.blocks += 1
+                elif kind == "skipped":
+                    self.skipped += 1
+                elif kind == "error":
+                    self.errors[slot] = value
+                elif kind == "done":
+                    self._progress[shard] = None
+                    remaining -= 1
+                    continue
+                elif kind == "failed":
+                    # Progress is kept, so the shard resumes on the next run.
+                    self.failed_shards[shard] = value
+                    remaining -= 1
+                    continue
+                self._progress[shard] = slot + 1
+
+                if (
+                    self.checkpoint
+                    and time.monotonic() - saved_at >= self.checkpoint_interval
+                ):
+                    self._save_checkpoint()
+                    saved_at = time.monotonic()
+        finally:
+            self._save_checkpoint()
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+                process.join()
+
+    def stats(self) -> Dict:
+        """
+        Returns the progress of the backfill.
+
+        Returns:
+            Dict: blocks, skipped, errors, blocks_per_second, shards_done, shards_total, failed_shards
+        """
+        elapsed = time.monotonic() - self._started if self._started else 0
+        return {
+            "blocks": self.blocks,
+            "skipped": self.skipped,
+            "errors": len(self.errors),
+            "blocks_per_second": self.blocks / elapsed if elapsed else None,
+            "shards_done": sum(
+                1 for progress in self._progress.values() if progress is None
+            ),
+            "shards_total": len(self.shards()),
+            "failed_shards": len(self.failed_shards),
+        }
+
+    def _load_checkpoint(self):
+        if not self.checkpoint or not os.path.exists(self.checkpoint):
+            return
+
+        with open(self.checkpoint) as file:
+            state = json.load(file)
+
+        if (state["start_slot"], state["end_slot"], state["shard_size"]) != (
+            self.start_slot,
+            self.end_slot,
+            self.shard_size,
+        ):
+            raise Exception(
+                f"Checkpoint {self.checkpoint} belongs to another range or shard size"
+            )
+
+        self._progress = {int(start): slot for start, slot in state["shards"].items()}
+        self.errors = {int(slot): error for slot, error in state["errors"].items()}
+
+    def _save_checkpoint(self):
+        if not self.checkpoint:
+            return
+
+        state = {
+            "start_slot": self.start_slot,
+            "end_slot": self.end_slot,
+            "shard_size": self.shard_size,
+            "shards": self._progress,
+            "errors": self.errors,
+        }
+        temporary = f"{self.checkpoint}.tmp"
+        with open(temporary, "w") as file:
+            json.dump(state, file)
+        os.replace(temporary, self.checkpoint)
+
+
+def _run_worker(rpc_url, tasks, results, transform, concurrency, rate, options):
+    """
+    Worker process: fetch the blocks of shards from `tasks` until a None task arrives.
+    """
+    client = RPC(rpc_url)
+    rate_limiter = RateLimiter(rate) if rate else None
+    retries = options["retries"]
+
+    def call(request):
+        for attempt in range(retries + 1):
+            if rate_limiter:
+                rate_limiter.acquire()
+            try:
+                response = request()
+            except Exception as e:
+                response = {"error": {"message": str(e)}}
+            if "result" in response or attempt == retries:
+                return response
+            if response["error"].get("code") in SKIPPED_SLOT_ERRORS:
+                return response
+            time.sleep(0.5 * 2**attempt)
+
+    def fetch(slot):
+        response = call(
+            lambda: client.block.get_block(
+                slot,
+                options["encoding"],
+                options["transaction_details"],
+                options["commitment"],
+                options["max_supported_transaction_version"],
+            )
+        )
+        if "result" not in response:
+            if response["error"].get("code") in SKIPPED_SLOT_ERRORS:
+                return "skipped", None
+            return "error", response["error"]
+        if response["result"] is None:
+            return "skipped", None
+        if transform is None:
+            return "block", response["result"]
+        try:
+            return "block", transform(slot, response["result"])
+        except Exception as e:
+            return "error", {"message": f"Error in transform: {e}"}
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        while True:
+            task = tasks.get()
+            if task is None:
+                return
+            shard, first, last = task
+
+            try:
+                for start in range(first, last + 1, MAX_GET_BLOCKS_RANGE):
+                    end = min(start + MAX_GET_BLOCKS_RANGE - 1, last)
+                    response = call(
+                        lambda: client.block.get_blocks(
+                            start, end, options["commitment"]
+                        )
+                    )
+                    if "result" not in response:
+                        raise Exception(
+                            f"Error listing blocks {start}-{end}: {response['error']}"
+                        )
+
+                    # Fetch a few windows ahead only, so a slow consumer bounds memory.
+                    slots = response["result"]
+                    window = concurrency * 2
+                    for offset in range(0, len(slots), window):
+                        chunk = slots[offset : offset + window]
+                        for slot, (kind, value) in zip(
+                            chunk, executor.map(fetch, chunk)
+                        ):
+                            results.put((kind, shard, slot, value))
+                results.put(("done", shard, None, None))
+            except Exception as e:
+                results.put(("failed", shard, None, str(e)))
@@ -0,0 +1,267 @@
+import threading
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from sdk.rpc.helpers.rate_limit import RateLimiter
+
+MINIMUM_SLOTS_PER_EPOCH = 32
+MAX_SLOT_LEADERS_LIMIT = 5000
+
+
+class EpochLeaders:
+    """
+    Leader schedule of a single epoch.
+
+    Leaders are stored as an array of indices (one per slot offset) into a table of
+    distinct identities, so an epoch of 432,000 slots costs ~1.7MB instead of a list of
+    432,000 string references.
+    """
+
+    __slots__ = ("epoch", "first_slot", "identities", "indices")
+
+    def __init__(self, epoch: int, first_slot: int, leaders: List[str]):
+        self.epoch = epoch
+        self.first_slot = first_slot
+
+        positions: Dict[str, int] = {}
+        self.identities: List[str] = []
+        self.indices = array("I")
+        for leader in leaders:
+            position = positions.get(leader)
+            if position is None:
+                position = positions[leader] = len(self.identities)
+                self.identities.append(leader)
+            self.indices.append(position)
+
+    @property
+    def last_slot(self) -> int:
+        return self.first_slot + len(self.indices) - 1
+
+    def leader(self, slot: int) -> Optional[str]:
+        offset = slot - self.first_slot
+        if 0 <= offset < len(self.indices):
+            return self.identities[self.indices[offset]]
+        return None
+
+
+class LeaderScheduleCache:
+    """
+    Epoch-scoped cache of the slot leader schedule.
+
+    The schedule of the current epoch is fetched once with chunked getSlotLeaders calls,
+    and the next epoch's schedule is prefetched as the current one nears its end, so
+    leader lookups are memory reads instead of RPC calls.
+    """
+
+    def __init__(
+        self,
+        client,
+        max_workers: int = 4,
+        requests_per_second: float = None,
+        refresh_interval: float = 10.0,
+        prefetch_slots: int = 2000,
+        commitment: str = None,
+    ):
+        """
+        Initialize the leader schedule cache.
+
+        Args:
+            client: Parent RPC client instance
+            max_workers (int, optional): Number of getSlotLeaders chunks fetched at once
+            requests_per_second (float, optional): Request budget for schedule fetches
+            refresh_interval (float, optional): Seconds between epoch checks in the background thread
+            prefetch_slots (int, optional): Prefetch the next epoch once fewer slots than this remain
+            commitment (str, optional): Commitment level used for getEpochInfo
+        """
+        self.client = client
+        self.max_workers = max_workers
+        self.rate_limiter = (
+            RateLimiter(requests_per_second) if requests_per_second else None
+        )
+        self.refresh_interval = refresh_interval
+        self.prefetch_slots = prefetch_slots
+        self.commitment = commitment
+
+        self.epoch_schedule = None
+        self._epochs: Dict[int, EpochLeaders] = {}
+        self._current: Optional[EpochLeaders] = None
+        self._next: Optional[EpochLeaders] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def leader(self, slot: int) -> Optional[str]:
+        """
+        Returns the leader of a slot from the cached schedule.
+
+        Args:
+            slot (int): Absolute slot number
+
+        Returns:
+            Optional[str]: Leader identity, or None if the slot is outside the cached epochs
+        """
+        for epoch_leaders in (self._current, self._next):
+            if epoch_leaders is not None:
+                leader = epoch_leaders.leader(slot)
+                if leader is not None:
+                    return leader
+
+        for epoch_leaders in list(self._epochs.values()):
+            leader = epoch_leaders.leader(slot)
+            if leader is not None:
+                return leader
+
+        return None
+
+    def leaders(self, start_slot: int, limit: int) -> List[Optional[str]]:
+        """
+        Returns the cached leaders of a slot range, mirroring getSlotLeaders.
+
+        Args:
+            start_slot (int): Start slot
+            limit (int): Number of slots
+
+        Returns:
+            List[Optional[str]]: Leader identities (None for slots outside the cached epochs)
+        """
+        return [self.leader(slot) for slot in range(start_slot, start_slot + limit)]
+
+    def epoch_bounds(self, epoch: int):
+        """
+        Returns the first slot and the number of slots of an epoch.
+
+        Args:
+            epoch (int): Epoch number
+
+        Returns:
+            Tuple[int, int]: (first slot, slots in epoch)
+        """
+        schedule = self._get_epoch_schedule()
+        first_normal_epoch = schedule["firstNormalEpoch"]
+
+        if schedule.get("warmup") and epoch < first_normal_epoch:
+            slots_in_epoch = MINIMUM_SLOTS_PER_EPOCH << epoch
+            first_slot = slots_in_epoch - MINIMUM_SLOTS_PER_EPOCH
+        else:
+            slots_in_epoch = schedule["slotsPerEpoch"]
+            first_slot = (epoch - first_normal_epoch) * slots_in_epoch + schedule[
+                "firstNormalSlot"
+            ]
+
+        return first_slot, slots_in_epoch
+
+    def refresh(self):
+        """
+        Make sure the current epoch is cached, and prefetch the next one near the boundary.
+        """
+        epoch_info = self._unwrap(
+            self.client.cluster.get_epoch_info(commitment=self.commitment),
+            "fetching epoch info",
+        )
+        epoch = epoch_info["epoch"]
+
+        current = self._epochs.get(epoch)
+        if current is None:
+            current = self.load_epoch(
+                epoch,
+                epoch_info["absoluteSlot"] - epoch_info["slotIndex"],
+                epoch_info["slotsInEpoch"],
+            )
+
+        remaining = epoch_info["slotsInEpoch"] - epoch_info["slotIndex"]
+        next_leaders = self._epochs.get(epoch + 1)
+        if next_leaders is None and remaining <= self.prefetch_slots:
+            next_leaders = self.load_epoch(epoch + 1)
+
+        with self._lock:
+            self._current = current
+            self._next = next_leaders
+            self._epochs = {
+                number: leaders
+                for number, leaders in self._epochs.items()
+                if number >= epoch - 1
+            }
+
+    def load_epoch(
+        self, epoch: int, first_slot: int = None, slots_in_epoch: int = None
+    ) -> EpochLeaders:
+        """
+        Fetch and cache the full leader schedule of an epoch.
+
+        Args:
+            epoch (int): Epoch number
+            first_slot (int, optional): First slot of the epoch (derived from the epoch schedule if omitted)
+            slots_in_epoch (int, optional): Number of slots in the epoch (derived from the epoch schedule if omitted)
+
+        Returns:
+            EpochLeaders: The cached schedule
+        """
+        if first_slot is None or slots_in_epoch is None:
+            first_slot, slots_in_epoch = self.epoch_bounds(epoch)
+
+        chunks = [
+            (start, min(MAX_SLOT_LEADERS_LIMIT, first_slot + slots_in_epoch - start))
+            for start in range(
+                first_slot, first_slot + slots_in_epoch, MAX_SLOT_LEADERS_LIMIT
+            )
+        ]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(lambda chunk: self._fetch(*chunk), chunks))
+
+        leaders = [leader for chunk in results for leader in chunk]
+        epoch_leaders = EpochLeaders(epoch, first_slot, leaders)
+
+        with self._lock:
+            self._epochs[epoch] = epoch_leaders
+
+        return epoch_leaders
+
+    def start(self):
+        """
+        Load the current epoch and keep the cache fresh from a background thread.
+        """
+        if self._thread and self._thread.is_alive():
+            return
+
+        self.refresh()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background refresh thread."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.refresh_interval):
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"Error refreshing leader schedule: {e}")
+
+    def _fetch(self, start_slot: int, limit: int) -> List[str]:
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+
+        return self._unwrap(
+            self.client.cluster.get_slot_leaders(start_slot, limit),
+            f"fetching slot leaders at {start_slot}",
+        )
+
+    def _get_epoch_schedule(self) -> Dict:
+        if self.epoch_schedule is None:
+            self.epoch_schedule = self._unwrap(
+                self.client.cluster.get_epoch_schedule(), "fetching epoch schedule"
+            )
+        return self.epoch_schedule
+
+    @staticmethod
+    def _unwrap(response: Dict, action: str):
+        if "result" in response:
+            return response["result"]
+        raise Exception(f"Error {action}: {response.get('error')}")
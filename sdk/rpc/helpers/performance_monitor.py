@@ -0,0 +1,186 @@
+import threading
+import time
+from array import array
+from typing import Dict, List
+
+MAX_PERFORMANCE_SAMPLES = 720
+SAMPLE_PERIOD_SECS = 60
+
+
+class PerformanceMonitor:
+    """
+    Rolling window of getRecentPerformanceSamples results.
+
+    The first poll fetches the whole window; later polls only ask for the samples that
+    can have been produced since the previous one (one every ~60 seconds). Samples are
+    kept in a fixed-size ring buffer of typed arrays, and statistics are computed from
+    those arrays without touching the network.
+    """
+
+    def __init__(
+        self,
+        client,
+        capacity: int = MAX_PERFORMANCE_SAMPLES,
+        poll_interval: float = 30.0,
+    ):
+        """
+        Initialize the performance monitor.
+
+        Args:
+            client: Parent RPC client instance
+            capacity (int, optional): Number of samples kept in the ring buffer
+            poll_interval (float, optional): Seconds between polls in the background thread
+        """
+        self.client = client
+        self.capacity = capacity
+        self.poll_interval = poll_interval
+
+        self.slots = array("Q", bytes(8 * capacity))
+        self.num_transactions = array("Q", bytes(8 * capacity))
+        self.num_non_vote_transactions = array("Q", bytes(8 * capacity))
+        self.num_slots = array("Q", bytes(8 * capacity))
+        self.sample_period_secs = array("H", bytes(2 * capacity))
+
+        self._head = 0  # index of the next write
+        self._count = 0
+        self._last_slot = None
+        self._last_poll = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def poll(self) -> int:
+        """
+        Fetch the samples produced since the last poll and append them to the buffer.
+
+        Returns:
+            int: Number of new samples
+        """
+        if self._last_poll is None:
+            limit = self.capacity
+        else:
+            elapsed = time.monotonic() - self._last_poll
+            limit = min(self.capacity, int(elapsed // SAMPLE_PERIOD_SECS) + 2)
+
+        response = self.client.performance.get_recent_performance_samples(
+            min(limit, MAX_PERFORMANCE_SAMPLES)
+        )
+        if "result" not in response:
+            raise Exception(
+                f"Error fetching performance samples: {response.get('error')}"
+            )
+
+        self._last_poll = time.monotonic()
+
+        # Samples arrive newest first; keep the unseen ones in slot order.
+        samples = [
+            sample
+            for sample in reversed(response["result"])
+            if self._last_slot is None or sample["slot"] > self._last_slot
+        ]
+
+        with self._lock:
+            for sample in samples:
+                self._append(sample)
+
+        return len(samples)
+
+    def latest(self) -> Dict:
+        """
+        Returns the statistics of the most recent sample.
+
+        Returns:
+            Dict: tps, non_vote_tps and slot_time (seconds) of the latest sample
+        """
+        return self.stats(window=1)
+
+    def stats(self, window: int = None) -> Dict:
+        """
+        Returns aggregate statistics over the most recent samples.
+
+        Args:
+            window (int, optional): Number of most recent samples to aggregate (defaults to all)
+
+        Returns:
+            Dict: slot, samples, tps, non_vote_tps, slot_time (seconds), and min/max TPS
+        """
+        with self._lock:
+            indices = self._recent_indices(window)
+            if not indices:
+                return {
+                    "slot": None,
+                    "samples": 0,
+                    "tps": 0.0,
+                    "non_vote_tps": 0.0,
+                    "slot_time": 0.0,
+                    "min_tps": 0.0,
+                    "max_tps": 0.0,
+                }
+
+            transactions = non_vote = slots = seconds = 0
+            per_sample_tps = []
+            for i in indices:
+                period = self.sample_period_secs[i]
+                transactions += self.num_transactions[i]
+                non_vote += self.num_non_vote_transactions[i]
+                slots += self.num_slots[i]
+                seconds += period
+                if period:
+                    per_sample_tps.append(self.num_transactions[i] / period)
+
+            slot = self.slots[indices[-1]]
+
+        return {
+            "slot": slot,
+            "samples": len(indices),
+            "tps": transactions / seconds if seconds else 0.0,
+            "non_vote_tps": non_vote / seconds if seconds else 0.0,
+            "slot_time": seconds / slots if slots else 0.0,
+            "min_tps": min(per_sample_tps, default=0.0),
+            "max_tps": max(per_sample_tps, default=0.0),
+        }
+
+    def start(self):
+        """
+        Fill the buffer and keep polling for new samples from a background thread.
+        """
+        if self._thread and self._thread.is_alive():
+            return
+
+        self.poll()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background polling thread."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.poll()
+            except Exception as e:
+                print(f"Error polling performance samples: {e}")
+
+    def _append(self, sample: Dict):
+        i = self._head
+        self.slots[i] = sample["slot"]
+        self.num_transactions[i] = sample["numTransactions"]
+        self.num_non_vote_transactions[i] = sample.get("numNonVoteTransactions") or 0
+        self.num_slots[i] = sample["numSlots"]
+        self.sample_period_secs[i] = sample["samplePeriodSecs"]
+
+        self._head = (i + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+        self._last_slot = sample["slot"]
+
+    def _recent_indices(self, window: int = None) -> List[int]:
+        count = self._count if window is None else min(window, self._count)
+        return [(self._head - count + n) % self.capacity for n in range(count)]
@@ -0,0 +1,49 @@
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket used to keep fan-out helpers under a request budget.
+    """
+
+    def __init__(self, rate: float, burst: int = None):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            rate (float): Sustained number of requests allowed per second
+            burst (int, optional): Maximum number of requests that may be issued back to back.
+                Defaults to one second worth of requests.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+
+        self.rate = float(rate)
+        self.capacity = float(burst if burst is not None else max(1, int(rate)))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int = 1):
+        """
+        Block until the requested number of tokens is available and consume them.
+
+        Args:
+            tokens (int, optional): Number of tokens to consume
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+
+                wait = (tokens - self._tokens) / self.rate
+
+            time.sleep(wait)
@@ -1,6 +1,9 @@
 import requests
 from typing import Dict
 
+from sdk.rpc.helpers.connect_timer import install_connect_timer
+
+
 class SessionManager:
     _instance = None
     _sessions: Dict[str, requests.Session] = {}
@@ -16,6 +19,7 @@ class SessionManager:
             return self._sessions[session_name]
 
         session = requests.Session()
+        install_connect_timer(session)
         self._sessions[session_name] = session
         self._session_urls[session_name] = base_url
 
@@ -24,7 +28,7 @@ class SessionManager:
             session.post(
                 base_url,
                 headers={"Content-Type": "application/json"},
-                json={"jsonrpc": "2.0", "id": "1", "method": "getHealth"}
+                json={"jsonrpc": "2.0", "id": "1", "method": "getHealth"},
             )
         except Exception as e:
             print(f"Warm-up request failed: {str(e)}")
@@ -43,4 +47,4 @@ class SessionManager:
 
     def close_all(self):
         for name in list(self._sessions.keys()):
-            self.close_session(name)
\ No newline at end of file
+            self.close_session(name)
@@ -0,0 +1,232 @@
+import json
+from typing import Any, Callable, Dict, List
+
+# Stands in for a hole while a template is serialized.
+_MARKER = "__template_hole__"
+
+
+def _plain(value: str) -> bool:
+    # True for strings JSON encodes as is, such as base-58 and base-64 strings.
+    return (
+        value.isascii()
+        and value.isprintable()
+        and '"' not in value
+        and "\\" not in value
+    )
+
+
+def _encode_string(value: str) -> bytes:
+    if not _plain(value):
+        return json.dumps(value).encode()
+    return b'"' + value.encode("ascii") + b'"'
+
+
+def _encode_strings(values: List[str]) -> bytes:
+    if not values:
+        return b"[]"
+    if not all(_plain(value) for value in values):
+        return json.dumps(values, separators=(",", ":")).encode()
+    return b'["' + '","'.join(values).encode("ascii") + b'"]'
+
+
+def _encode_value(value: Any) -> bytes:
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+class Hole:
+    """A variable part of a RequestTemplate, with the function encoding its value."""
+
+    __slots__ = ("encode",)
+
+    def __init__(self, encode: Callable[[Any], bytes]):
+        self.encode = encode
+
+
+# A string (pubkey, signature, blockhash, transaction); base-58 and base-64 strings are
+# spliced in without escaping.
+STRING = Hole(_encode_string)
+# A list of strings, spliced in like STRING.
+STRINGS = Hole(_encode_strings)
+# Any JSON value.
+VALUE = Hole(_encode_value)
+
+
+class RequestTemplate:
+    """
+    A JSON-RPC request serialized once, with holes for its variable parts.
+
+    Rendering joins the pre-encoded bytes around the encoded values of the holes,
+    instead of building and serializing the whole payload on every call:
+
+        template = RequestTemplate("getBalance", [STRING, {"commitment": "confirmed"}])
+        body = template.render("PUB_KEY")
+    """
+
+    __slots__ = ("method", "_parts", "_encoders")
+
+    def __init__(self, method: str, params: List = None):
+        """
+        Serialize the request.
+
+        Args:
+            method (str): The RPC method
+            params (List, optional): Parameters, with STRING, STRINGS or VALUE in
+                place of the variable parts
+        """
+        holes = []
+
+        def mark(value):
+            if isinstance(value, Hole):
+                holes.append(value)
+                return _MARKER
+            raise TypeError(f"Cannot serialize {value!r} in a request template")
+
+        payload = {"jsonrpc": "2.0", "id": 1, "method": method}
+        if params is not None:
+            payload["params"] = params
+        text = json.dumps(payload, separators=(",", ":"), default=mark)
+
+        self.method = method
+        self._parts = [part.encode() for part in text.split(f'"{_MARKER}"')]
+        self._encoders = [hole.encode for hole in holes]
+
+    def render(self, *values) -> bytes:
+        """
+        Returns the encoded request with the values spliced into the holes.
+
+        Args:
+            *values: One value per hole, in order
+
+        Returns:
+            bytes: The encoded request
+        """
+        parts = self._parts
+        if len(values) != len(self._encoders):
+            raise ValueError(
+                f"{self.method} template takes {len(self._encoders)} values, got {len(values)}"
+            )
+        if not values:
+            return parts[0]
+
+        chunks = [parts[0]]
+        for encode, value, part in zip(self._encoders, values, parts[1:]):
+            chunks.append(encode(value))
+            chunks.append(part)
+        return b"".join(chunks)
+
+
+class HotRequests:
+    """
+    Pre-serialized requests for the hottest RPC methods, for tight send and quote loops.
+
+    Encoding, commitment and send options are fixed when the templates are built, so a
+    call only splices its pubkey, signatures or transaction into the request bytes. The
+    request itself (URL and merged headers) is also prepared once by the client, so
+    tracing hooks, compression settings and BridgedRPC all apply as for other calls.
+    A SlotClock attached to the client does not add minContextSlot to these calls.
+
+        hot = HotRequests(rpc, commitment="confirmed", send_options={"skipPreflight": True})
+        blockhash = hot.get_latest_blockhash()
+        hot.send_transaction(signed_transaction)
+    """
+
+    def __init__(
+        self,
+        client,
+        commitment: str = None,
+        encoding: str = "base64",
+        send_options: Dict = None,
+    ):
+        """
+        Build the templates.
+
+        Args:
+            client: Parent RPC client instance
+            commitment (str, optional): Commitment level of every call
+            encoding (str, optional): Encoding of account data and of sent transactions
+            send_options (Dict, optional): Options for sendTransaction (skipPreflight,
+                maxRetries, preflightCommitment, ...)
+        """
+        self.client = client
+        config = {"commitment": commitment} if commitment else {}
+
+        self.account_info = RequestTemplate(
+            "getAccountInfo", [STRING, {"encoding": encoding, **config}]
+        )
+        self.latest_blockhash = RequestTemplate(
+            "getLatestBlockhash", [config] if config else None
+        )
+        self.signature_statuses = RequestTemplate("getSignatureStatuses", [STRINGS])
+        self.signature_history = RequestTemplate(
+            "getSignatureStatuses", [STRINGS, {"searchTransactionHistory": True}]
+        )
+        self.send = RequestTemplate(
+            "sendTransaction", [STRING, {"encoding": encoding, **(send_options or {})}]
+        )
+
+    def request(self, template: RequestTemplate, *values) -> Dict:
+        """
+        Send a templated request.
+
+        Args:
+            template (RequestTemplate): The template
+            *values: One value per hole of the template
+
+        Returns:
+            Dict: The JSON response from the API
+        """
+        return self.client._post_encoded(
+            template.method,
+            template.render(*values),
+            template.method in self.client.compressed_methods,
+        )
+
+    def get_account_info(self, pubkey: str) -> Dict:
+        """
+        Returns all information associated with the account of provided Pubkey.
+
+        Args:
+            pubkey (str): Public key of the account to query
+
+        Returns:
+            Dict: Account information
+        """
+        return self.request(self.account_info, pubkey)
+
+    def get_latest_blockhash(self) -> Dict:
+        """
+        Returns the latest blockhash.
+
+        Returns:
+            Dict: Latest blockhash information
+        """
+        return self.request(self.latest_blockhash)
+
+    def get_signature_statuses(
+        self, signatures: List[str], search_transaction_history: bool = False
+    ) -> Dict:
+        """
+        Returns the statuses of a list of signatures.
+
+        Args:
+            signatures (List[str]): List of transaction signatures to query
+            search_transaction_history (bool, optional): If true, search past blocks as well
+
+        Returns:
+            Dict: Signature statuses
+        """
+        if search_transaction_history:
+            return self.request(self.signature_history, signatures)
+        return self.request(self.signature_statuses, signatures)
+
+    def send_transaction(self, transaction: str) -> Dict:
+        """
+        Submits a signed transaction to the cluster for processing.
+
+        Args:
+            transaction (str): Signed transaction, in the encoding of the templates
+
+        Returns:
+            Dict: Transaction signature
+        """
+        return self.request(self.send, transaction)
@@ -0,0 +1,166 @@
+import base64
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterable, List
+
+from sdk.rpc.helpers.encoding import b58encode
+from sdk.rpc.helpers.rate_limit import RateLimiter
+
+TOKEN_PROGRAM_ID = "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"
+TOKEN_2022_PROGRAM_ID = "TokenzQdBNbLqP5VEhdkAS5EjFpMh7m2Ru13NWQqoULB"
+
+# SPL token accounts (and the base layout of Token-2022 accounts) start with
+# mint (32 bytes), owner (32 bytes) and amount (u64, little endian).
+TOKEN_ACCOUNT_DATA_SLICE = {"offset": 0, "length": 72}
+
+
+class TokenHoldings:
+    """
+    Aggregated owner -> mint -> raw amount table produced by the TokenHoldingsScanner.
+
+    Mint addresses are interned, so each distinct mint string is stored once no matter
+    how many owners hold it. Amounts are raw integer base units (not divided by decimals).
+    """
+
+    __slots__ = ("balances", "errors")
+
+    def __init__(self):
+        self.balances: Dict[str, Dict[str, int]] = {}
+        self.errors: Dict[str, Any] = {}
+
+    def __getitem__(self, owner: str) -> Dict[str, int]:
+        return self.balances[owner]
+
+    def __contains__(self, owner: str) -> bool:
+        return owner in self.balances
+
+    def __len__(self) -> int:
+        return len(self.balances)
+
+    def get(self, owner: str, mint: str, default: int = 0) -> int:
+        """
+        Returns the aggregated raw amount of a mint held by an owner.
+
+        Args:
+            owner (str): Owner address
+            mint (str): Token mint address
+            default (int, optional): Value to return if the owner holds no such token
+
+        Returns:
+            int: Raw token amount
+        """
+        return self.balances.get(owner, {}).get(mint, default)
+
+    def mints(self) -> List[str]:
+        """
+        Returns every distinct mint held by at least one scanned owner.
+
+        Returns:
+            List[str]: Mint addresses
+        """
+        seen = set()
+        for holdings in self.balances.values():
+            seen.update(holdings)
+        return list(seen)
+
+
+class TokenHoldingsScanner:
+    """
+    Fetches the SPL token holdings of many owners concurrently under a request budget.
+
+    Each owner needs one getTokenAccountsByOwner call per token program. Accounts are
+    requested as base64 with a data slice covering only the mint and amount fields, and
+    balances are decoded from the raw bytes instead of relying on jsonParsed.
+    """
+
+    def __init__(
+        self,
+        client,
+        program_ids: Iterable[str] = (TOKEN_PROGRAM_ID, TOKEN_2022_PROGRAM_ID),
+        max_workers: int = 8,
+        requests_per_second: float = None,
+        commitment: str = None,
+        include_zero_balances: bool = False,
+    ):
+        """
+        Initialize the scanner.
+
+        Args:
+            client: Parent RPC client instance
+            program_ids (Iterable[str], optional): Token programs to scan for every owner
+            max_workers (int, optional): Number of requests in flight at once. Keep this at or
+                below the HTTP connection pool size of the client session (10 by default).
+            requests_per_second (float, optional): Request budget shared by all workers
+            commitment (str, optional): Commitment level to use
+            include_zero_balances (bool, optional): Keep token accounts with a zero balance
+        """
+        self.client = client
+        self.program_ids = list(program_ids)
+        self.max_workers = max_workers
+        self.rate_limiter = (
+            RateLimiter(requests_per_second) if requests_per_second else None
+        )
+        self.commitment = commitment
+        self.include_zero_balances = include_zero_balances
+
+    def scan(self, owners: Iterable[str]) -> TokenHoldings:
+        """
+        Scan the token holdings of every owner.
+
+        Args:
+            owners (Iterable[str]): Owner addresses to scan
+
+        Returns:
+            TokenHoldings: Aggregated owner -> mint -> amount table. Owners whose requests
+                failed are listed in `errors` instead of `balances`.
+        """
+        holdings = TokenHoldings()
+        owners = list(dict.fromkeys(owners))
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self._fetch, owner, program_id): owner
+                for owner in owners
+                for program_id in self.program_ids
+            }
+
+            for future in as_completed(futures):
+                owner = futures[future]
+                try:
+                    accounts = future.result()
+                except Exception as e:
+                    holdings.errors[owner] = str(e)
+                    continue
+
+                if "error" in accounts:
+                    holdings.errors[owner] = accounts["error"]
+                    continue
+
+                balances = holdings.balances.setdefault(owner, {})
+                for mint, amount in self._decode(accounts):
+                    balances[mint] = balances.get(mint, 0) + amount
+
+        for owner in holdings.errors:
+            holdings.balances.pop(owner, None)
+
+        return holdings
+
+    def _fetch(self, owner: str, program_id: str) -> Dict:
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+
+        return self.client.token.get_token_accounts_by_owner(
+            owner,
+            program_id=program_id,
+            encoding="base64",
+            commitment=self.commitment,
+            data_slice=TOKEN_ACCOUNT_DATA_SLICE,
+        )
+
+    def _decode(self, response: Dict):
+        for item in response.get("result", {}).get("value", []):
+            data = base64.b64decode(item["account"]["data"][0])
+            amount = int.from_bytes(data[64:72], "little")
+
+            if amount or self.include_zero_balances:
+                yield sys.intern(b58encode(data[:32])), amount
@@ -0,0 +1,277 @@
+import threading
+from array import array
+from typing import Dict, List, Optional
+
+
+class Validator:
+    """
+    A vote account joined with the gossip information of its node identity.
+    """
+
+    __slots__ = (
+        "identity",
+        "vote_pubkey",
+        "stake",
+        "commission",
+        "delinquent",
+        "last_vote",
+        "root_slot",
+        "gossip",
+        "tpu",
+        "tpu_quic",
+        "rpc",
+        "version",
+        "rank",
+    )
+
+    def __init__(self, identity: str):
+        self.identity = identity
+        self.vote_pubkey = None
+        self.stake = 0
+        self.commission = None
+        self.delinquent = False
+        self.last_vote = None
+        self.root_slot = None
+        self.gossip = None
+        self.tpu = None
+        self.tpu_quic = None
+        self.rpc = None
+        self.version = None
+        self.rank = None
+
+    def __repr__(self) -> str:
+        return (
+            f"Validator(identity={self.identity!r}, vote_pubkey={self.vote_pubkey!r}, "
+            f"stake={self.stake}, rank={self.rank})"
+        )
+
+
+class ValidatorIndex:
+    """
+    Epoch-scoped index joining getVoteAccounts and getClusterNodes by node identity.
+
+    Records are updated in place on refresh, and the stake ranking is only rebuilt when
+    the stake distribution actually changed (normally once per epoch), so repeated
+    refreshes mostly cost the two RPC calls.
+    """
+
+    def __init__(
+        self,
+        client,
+        commitment: str = None,
+        keep_unstaked_delinquents: bool = None,
+        refresh_interval: float = 60.0,
+    ):
+        """
+        Initialize the validator index.
+
+        Args:
+            client: Parent RPC client instance
+            commitment (str, optional): Commitment level to use
+            keep_unstaked_delinquents (bool, optional): Keep delinquent validators with no stake
+            refresh_interval (float, optional): Seconds between refreshes in the background thread
+        """
+        self.client = client
+        self.commitment = commitment
+        self.keep_unstaked_delinquents = keep_unstaked_delinquents
+        self.refresh_interval = refresh_interval
+
+        self.epoch = None
+        self.total_stake = 0
+        self.by_identity: Dict[str, Validator] = {}
+        self.by_vote_pubkey: Dict[str, Validator] = {}
+        self.ranking: List[Validator] = []
+        self.cumulative_stake = array("Q")
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __len__(self) -> int:
+        return len(self.by_identity)
+
+    def get(self, pubkey: str) -> Optional[Validator]:
+        """
+        Look up a validator by node identity or vote account pubkey.
+
+        Args:
+            pubkey (str): Node identity or vote account pubkey
+
+        Returns:
+            Optional[Validator]: The validator, or None if unknown
+        """
+        return self.by_identity.get(pubkey) or self.by_vote_pubkey.get(pubkey)
+
+    def top(self, n: int) -> List[Validator]:
+        """
+        Returns the n validators with the most activated stake.
+
+        Args:
+            n (int): Number of validators
+
+        Returns:
+            List[Validator]: Validators in descending stake order
+        """
+        return self.ranking[:n]
+
+    def stake_weight(self, pubkey: str) -> float:
+        """
+        Returns a validator's share of the total activated stake.
+
+        Args:
+            pubkey (str): Node identity or vote account pubkey
+
+        Returns:
+            float: Stake weight between 0 and 1
+        """
+        validator = self.get(pubkey)
+        if validator is None or not self.total_stake:
+            return 0.0
+        return validator.stake / self.total_stake
+
+    def validators_for_stake(self, fraction: float) -> List[Validator]:
+        """
+        Returns the smallest set of top-ranked validators holding at least a fraction of the stake.
+
+        Args:
+            fraction (float): Stake fraction between 0 and 1 (e.g. 1/3 for the superminority)
+
+        Returns:
+            List[Validator]: Validators in descending stake order
+        """
+        target = self.total_stake * fraction
+        for i, cumulative in enumerate(self.cumulative_stake):
+            if cumulative >= target:
+                return self.ranking[: i + 1]
+        return list(self.ranking)
+
+    def refresh(self, vote_accounts: bool = True, cluster_nodes: bool = True):
+        """
+        Refresh the index from the cluster.
+
+        Args:
+            vote_accounts (bool, optional): Refresh stake and vote account information
+            cluster_nodes (bool, optional): Refresh gossip, TPU and RPC addresses
+        """
+        epoch_info = self._unwrap(
+            self.client.cluster.get_epoch_info(commitment=self.commitment),
+            "fetching epoch info",
+        )
+        new_epoch = epoch_info["epoch"] != self.epoch
+
+        with self._lock:
+            if vote_accounts or new_epoch:
+                result = self._unwrap(
+                    self.client.staking.get_vote_accounts(
+                        commitment=self.commitment,
+                        keep_unstaked_delinquents=self.keep_unstaked_delinquents,
+                    ),
+                    "fetching vote accounts",
+                )
+                if self._apply_vote_accounts(result) or new_epoch:
+                    self._rank()
+
+            if cluster_nodes:
+                result = self._unwrap(
+                    self.client.cluster.get_cluster_nodes(), "fetching cluster nodes"
+                )
+                self._apply_cluster_nodes(result)
+
+            self.epoch = epoch_info["epoch"]
+
+    def start(self):
+        """
+        Build the index and keep it fresh from a background thread.
+        """
+        if self._thread and self._thread.is_alive():
+            return
+
+        self.refresh()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background refresh thread."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.refresh_interval):
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"Error refreshing validator index: {e}")
+
+    def _apply_vote_accounts(self, result: Dict) -> bool:
+        stakes_changed = False
+        seen = set()
+
+        for delinquent, accounts in (
+            (False, result.get("current", [])),
+            (True, result.get("delinquent", [])),
+        ):
+            for account in accounts:
+                identity = account["nodePubkey"]
+                seen.add(identity)
+
+                validator = self.by_identity.get(identity)
+                if validator is None:
+                    validator = self.by_identity[identity] = Validator(identity)
+                    stakes_changed = True
+
+                if validator.vote_pubkey != account["votePubkey"]:
+                    if validator.vote_pubkey is not None:
+                        self.by_vote_pubkey.pop(validator.vote_pubkey, None)
+                    validator.vote_pubkey = account["votePubkey"]
+                    self.by_vote_pubkey[validator.vote_pubkey] = validator
+
+                if validator.stake != account["activatedStake"]:
+                    validator.stake = account["activatedStake"]
+                    stakes_changed = True
+
+                validator.commission = account.get("commission")
+                validator.delinquent = delinquent
+                validator.last_vote = account.get("lastVote")
+                validator.root_slot = account.get("rootSlot")
+
+        for identity in [i for i in self.by_identity if i not in seen]:
+            validator = self.by_identity.pop(identity)
+            self.by_vote_pubkey.pop(validator.vote_pubkey, None)
+            stakes_changed = True
+
+        return stakes_changed
+
+    def _apply_cluster_nodes(self, nodes: List[Dict]):
+        for node in nodes:
+            validator = self.by_identity.get(node["pubkey"])
+            if validator is None:
+                continue
+
+            validator.gossip = node.get("gossip")
+            validator.tpu = node.get("tpu")
+            validator.tpu_quic = node.get("tpuQuic")
+            validator.rpc = node.get("rpc")
+            validator.version = node.get("version")
+
+    def _rank(self):
+        ranking = sorted(self.by_identity.values(), key=lambda v: v.stake, reverse=True)
+
+        cumulative_stake = array("Q")
+        total = 0
+        for rank, validator in enumerate(ranking, start=1):
+            validator.rank = rank
+            total += validator.stake
+            cumulative_stake.append(total)
+
+        self.ranking = ranking
+        self.cumulative_stake = cumulative_stake
+        self.total_stake = total
+
+    @staticmethod
+    def _unwrap(response: Dict, action: str):
+        if "result" in response:
+            return response["result"]
+        raise Exception(f"Error {action}: {response.get('error')}")
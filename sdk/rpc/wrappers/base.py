@@ -1,5 +1,29 @@
 from typing import Dict, Any
 
+# Methods accepting a minContextSlot in their (trailing) config object.
+MIN_CONTEXT_SLOT_METHODS = frozenset(
+    (
+        "getAccountInfo",
+        "getBalance",
+        "getBlockHeight",
+        "getEpochInfo",
+        "getFeeForMessage",
+        "getInflationReward",
+        "getLatestBlockhash",
+        "getMultipleAccounts",
+        "getProgramAccounts",
+        "getSignaturesForAddress",
+        "getSlot",
+        "getSlotLeader",
+        "getTokenAccountsByDelegate",
+        "getTokenAccountsByOwner",
+        "getTransactionCount",
+        "isBlockhashValid",
+        "sendTransaction",
+        "simulateTransaction",
+    )
+)
+
 
 class APIBase:
     """Base class for  API endpoints"""
@@ -24,4 +48,39 @@ class APIBase:
         Returns:
             Dict: The JSON response from the API
         """
+        if method in MIN_CONTEXT_SLOT_METHODS:
+            params = self._fill_min_context_slot(params)
         return self.client._make_request(method, params)
+
+    def _fill_min_context_slot(self, params: Any) -> Any:
+        """
+        Add a minContextSlot from the client's slot clock, if one is attached and the
+        caller did not set it.
+
+        The slot of the request's commitment level (finalized by default) is used, so
+        the request is not evaluated by a node lagging behind the clock.
+
+        Args:
+            params (Any): Parameters for the request
+
+        Returns:
+            Any: The parameters, with minContextSlot in the trailing config object
+        """
+        clock = getattr(self.client, "slot_clock", None)
+        if clock is None:
+            return params
+
+        params = list(params) if params else []
+        config = params[-1] if params and isinstance(params[-1], dict) else None
+        if config is not None and "minContextSlot" in config:
+            return params
+
+        slot = clock.slot((config or {}).get("commitment", "finalized"))
+        if slot is None:
+            return params
+
+        if config is None:
+            params.append({"minContextSlot": slot})
+        else:
+            params[-1] = dict(config, minContextSlot=slot)
+        return params
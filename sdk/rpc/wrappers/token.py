@@ -1,5 +1,11 @@
-from typing import Dict
+from typing import Dict, Iterable
 from .base import APIBase
+from sdk.rpc.helpers.token_scanner import (
+    TOKEN_PROGRAM_ID,
+    TOKEN_2022_PROGRAM_ID,
+    TokenHoldings,
+    TokenHoldingsScanner,
+)
 
 
 class TokenAPI(APIBase):
@@ -30,6 +36,7 @@ class TokenAPI(APIBase):
         program_id: str = None,
         encoding: str = "jsonParsed",
         commitment: str = None,
+        data_slice: Dict = None,
     ) -> Dict:
         """
         Returns all SPL Token accounts by approved Delegate.
@@ -40,6 +47,7 @@ class TokenAPI(APIBase):
             program_id (str, optional): The program ID to filter accounts by
             encoding (str, optional): Encoding format for the response
             commitment (str, optional): Commitment level to use
+            data_slice (Dict, optional): Limit the returned account data ({"offset": int, "length": int})
 
         Returns:
             Dict: Token accounts by delegate information
@@ -56,6 +64,8 @@ class TokenAPI(APIBase):
         config = {"encoding": encoding}
         if commitment:
             config["commitment"] = commitment
+        if data_slice:
+            config["dataSlice"] = data_slice
 
         params.append(config)
 
@@ -68,6 +78,7 @@ class TokenAPI(APIBase):
         program_id: str = None,
         encoding: str = "jsonParsed",
         commitment: str = None,
+        data_slice: Dict = None,
     ) -> Dict:
         """
         Returns all SPL Token accounts by token owner.
@@ -78,6 +89,7 @@ class TokenAPI(APIBase):
             program_id (str, optional): The program ID to filter accounts by
             encoding (str, optional): Encoding format for the response
             commitment (str, optional): Commitment level to use
+            data_slice (Dict, optional): Limit the returned account data ({"offset": int, "length": int})
 
         Returns:
             Dict: Token accounts by owner information
@@ -94,6 +106,8 @@ class TokenAPI(APIBase):
         config = {"encoding": encoding}
         if commitment:
             config["commitment"] = commitment
+        if data_slice:
+            config["dataSlice"] = data_slice
 
         params.append(config)
 
@@ -134,3 +148,33 @@ class TokenAPI(APIBase):
             params.append({"commitment": commitment})
 
         return self._make_request("getTokenSupply", params)
+
+    def scan_token_holdings(
+        self,
+        owners: Iterable[str],
+        program_ids: Iterable[str] = (TOKEN_PROGRAM_ID, TOKEN_2022_PROGRAM_ID),
+        max_workers: int = 8,
+        requests_per_second: float = None,
+        commitment: str = None,
+    ) -> TokenHoldings:
+        """
+        Returns the aggregated SPL token holdings of many owners, fetched concurrently.
+
+        Args:
+            owners (Iterable[str]): Owner addresses to scan
+            program_ids (Iterable[str], optional): Token programs to scan for every owner
+            max_workers (int, optional): Number of requests in flight at once
+            requests_per_second (float, optional): Request budget shared by all workers
+            commitment (str, optional): Commitment level to use
+
+        Returns:
+            TokenHoldings: Owner -> mint -> raw amount table
+        """
+        scanner = TokenHoldingsScanner(
+            self.client,
+            program_ids=program_ids,
+            max_workers=max_workers,
+            requests_per_second=requests_per_second,
+            commitment=commitment,
+        )
+        return scanner.scan(owners)
@@ -0,0 +1,845 @@
+import asyncio
+import base64
+import gzip
+import json
+import random
+import struct
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import websockets
+
+from sdk.rpc.helpers.encoding import b58encode
+
+API_VERSION = "2.0.15"
+SLOTS_PER_EPOCH = 432000
+LAMPORTS_PER_SIGNATURE = 5000
+
+# JSON-RPC error codes
+METHOD_NOT_FOUND = -32601
+INTERNAL_ERROR = -32603
+NODE_UNHEALTHY = -32005
+
+
+class MockResponses:
+    """
+    Generates deterministic, realistically shaped results for every RPC method and
+    subscription notification used by the SDK.
+
+    All randomness comes from a seeded RNG, so the same seed and the same sequence of
+    calls produce the same payloads. Payload sizes are configurable.
+    """
+
+    def __init__(
+        self,
+        seed=0,
+        start_slot=300_000_000,
+        account_data_size=165,
+        program_accounts=100,
+        block_transactions=50,
+        log_lines=8,
+        pubkeys=1024,
+    ):
+        """
+        Initialize the MockResponses.
+
+        Args:
+            seed (int, optional): Seed of the RNG.
+            start_slot (int, optional): Slot the mock cluster starts at.
+            account_data_size (int, optional): Bytes of data of generated accounts.
+            program_accounts (int, optional): Accounts returned by getProgramAccounts and
+                getTokenAccountsBy*.
+            block_transactions (int, optional): Transactions in generated blocks.
+            log_lines (int, optional): Log lines of generated transactions.
+            pubkeys (int, optional): Size of the pool of generated pubkeys.
+        """
+        self.rng = random.Random(seed)
+        self.slot = start_slot
+        self.account_data_size = account_data_size
+        self.program_accounts = program_accounts
+        self.block_transactions = block_transactions
+        self.log_lines = log_lines
+        self._pubkeys = [b58encode(self.rng.randbytes(32)) for _ in range(pubkeys)]
+        self._lock = threading.Lock()
+
+        self._methods = {
+            "getAccountInfo": lambda p: self._context(self.account()),
+            "getBalance": lambda p: self._context(self.rng.randrange(10**12)),
+            "getBlock": lambda p: self.block(p[0] if p else self.slot),
+            "getBlockCommitment": lambda p: {
+                "commitment": [0] * 31 + [self.rng.randrange(10**15)],
+                "totalStake": 400_000_000 * 10**9,
+            },
+            "getBlockHeight": lambda p: self.slot - 20_000_000,
+            "getBlockProduction": lambda p: self._context(
+                {
+                    "byIdentity": {pubkey: [4, 4] for pubkey in self._pubkeys[:16]},
+                    "range": {"firstSlot": self.slot - 1000, "lastSlot": self.slot},
+                }
+            ),
+            "getBlockTime": lambda p: 1_700_000_000 + (p[0] if p else self.slot) // 3,
+            "getBlocks": lambda p: list(
+                range(
+                    p[0],
+                    (p[1] if len(p) > 1 and isinstance(p[1], int) else self.slot) + 1,
+                )
+            ),
+            "getBlocksWithLimit": lambda p: list(range(p[0], p[0] + p[1])),
+            "getClusterNodes": lambda p: [
+                self.node(pubkey) for pubkey in self._pubkeys[:64]
+            ],
+            "getEpochInfo": lambda p: self.epoch_info(),
+            "getEpochSchedule": lambda p: {
+                "slotsPerEpoch": SLOTS_PER_EPOCH,
+                "leaderScheduleSlotOffset": SLOTS_PER_EPOCH,
+                "warmup": False,
+                "firstNormalEpoch": 0,
+                "firstNormalSlot": 0,
+            },
+            "getFeeForMessage": lambda p: self._context(LAMPORTS_PER_SIGNATURE),
+            "getFirstAvailableBlock": lambda p: 0,
+            "getGenesisHash": lambda p: "5eykt4UsFv8P8NJdTREpY1vzqKqZKvdpKuc147dw2N9d",
+            "getHealth": lambda p: "ok",
+            "getHighestSnapshotSlot": lambda p: {
+                "full": self.slot - 25_000,
+                "incremental": self.slot - 500,
+            },
+            "getIdentity": lambda p: {"identity": self._pubkeys[0]},
+            "getInflationGovernor": lambda p: {
+                "foundation": 0.0,
+                "foundationTerm": 0.0,
+                "initial": 0.08,
+                "taper": 0.15,
+                "terminal": 0.015,
+            },
+            "getInflationRate": lambda p: {
+                "epoch": self.slot // SLOTS_PER_EPOCH,
+                "foundation": 0.0,
+                "total": 0.045,
+                "validator": 0.045,
+            },
+            "getInflationReward": lambda p: [
+                self.inflation_reward(p[1].get("epoch") if len(p) > 1 else None)
+                for _ in p[0]
+            ],
+            "getLargestAccounts": lambda p: self._context(
+                [
+                    {"address": pubkey, "lamports": self.rng.randrange(10**15)}
+                    for pubkey in self._pubkeys[:20]
+                ]
+            ),
+            "getLatestBlockhash": lambda p: self._context(
+                {
+                    "blockhash": self.pubkey(),
+                    "lastValidBlockHeight": self.slot - 20_000_000 + 150,
+                }
+            ),
+            "getMaxRetransmitSlot": lambda p: self.slot,
+            "getMaxShredInsertSlot": lambda p: self.slot,
+            "getMinimumBalanceForRentExemption": lambda p: (p[0] + 128) * 6960,
+            "getMultipleAccounts": lambda p: self._context(
+                [self.account() for _ in p[0]]
+            ),
+            "getProgramAccounts": self._program_accounts,
+            "getRecentPerformanceSamples": lambda p: [
+                self.performance_sample(index) for index in range(p[0] if p else 720)
+            ],
+            "getRecentPrioritizationFees": lambda p: [
+                {
+                    "slot": self.slot - index,
+                    "prioritizationFee": self.rng.randrange(10**5),
+                }
+                for index in range(150)
+            ],
+            "getSignatureStatuses": lambda p: self._context(
+                [self.signature_status() for _ in p[0]]
+            ),
+            "getSignaturesForAddress": lambda p: [
+                self.signature_info()
+                for _ in range((p[1].get("limit") if len(p) > 1 else None) or 1000)
+            ],
+            "getSlot": lambda p: self.slot,
+            "getSlotLeader": lambda p: self._pubkeys[self.slot % 64],
+            "getSlotLeaders": lambda p: [
+                self._pubkeys[(p[0] + index) // 4 % 64] for index in range(p[1])
+            ],
+            "getStakeMinimumDelegation": lambda p: self._context(1_000_000_000),
+            "getSupply": lambda p: self._context(
+                {
+                    "circulating": 480 * 10**15,
+                    "nonCirculating": 110 * 10**15,
+                    "nonCirculatingAccounts": self._pubkeys[:8],
+                    "total": 590 * 10**15,
+                }
+            ),
+            "getTokenAccountBalance": lambda p: self._context(self.token_amount()),
+            "getTokenAccountsByDelegate": self._token_accounts,
+            "getTokenAccountsByOwner": self._token_accounts,
+            "getTokenLargestAccounts": lambda p: self._context(
+                [
+                    dict(self.token_amount(), address=pubkey)
+                    for pubkey in self._pubkeys[:20]
+                ]
+            ),
+            "getTokenSupply": lambda p: self._context(self.token_amount()),
+            "getTransaction": lambda p: self.transaction(self.slot),
+            "getTransactionCount": lambda p: 300_000_000_000 + self.slot,
+            "getVersion": lambda p: {
+                "solana-core": API_VERSION,
+                "feature-set": 3294202862,
+            },
+            "getVoteAccounts": lambda p: {
+                "current": [self.vote_account(pubkey) for pubkey in self._pubkeys[:64]],
+                "delinquent": [
+                    self.vote_account(pubkey) for pubkey in self._pubkeys[64:68]
+                ],
+            },
+            "isBlockhashValid": lambda p: self._context(True),
+            "minimumLedgerSlot": lambda p: self.slot - 1_000_000,
+            "requestAirdrop": lambda p: self.signature(),
+            "sendTransaction": lambda p: self.signature(),
+            "simulateTransaction": lambda p: self._context(
+                {
+                    "err": None,
+                    "logs": self.logs(),
+                    "accounts": None,
+                    "unitsConsumed": self.rng.randrange(200_000),
+                    "returnData": None,
+                }
+            ),
+        }
+
+    def result(self, method, params=None):
+        """
+        Returns the result of an RPC method.
+
+        Args:
+            method (str): The RPC method.
+            params (list, optional): Its parameters.
+
+        Returns:
+            The result.
+
+        Raises:
+            KeyError: If the method is not supported.
+        """
+        handler = self._methods[method]
+        with self._lock:
+            return handler(params or [])
+
+    def advance(self, slots=1):
+        """Move the mock cluster forward."""
+        with self._lock:
+            self.slot += slots
+
+    # Building blocks
+
+    def pubkey(self):
+        return self.rng.choice(self._pubkeys)
+
+    def signature(self):
+        return b58encode(self.rng.randbytes(64))
+
+    def _context(self, value):
+        return {
+            "context": {"apiVersion": API_VERSION, "slot": self.slot},
+            "value": value,
+        }
+
+    def account(self, data=None):
+        if data is None:
+            data = self.rng.randbytes(self.account_data_size)
+        return {
+            "data": [base64.b64encode(data).decode(), "base64"],
+            "executable": False,
+            "lamports": self.rng.randrange(10**12),
+            "owner": self.pubkey(),
+            "rentEpoch": 18446744073709551615,
+            "space": len(data),
+        }
+
+    def token_account(self):
+        data = (
+            self.rng.randbytes(32)  # mint
+            + self.rng.randbytes(32)  # owner
+            + struct.pack("<Q", self.rng.randrange(10**12))  # amount
+            + bytes(165 - 72)
+        )
+        return self.account(data)
+
+    def token_amount(self):
+        amount = self.rng.randrange(10**12)
+        return {
+            "amount": str(amount),
+            "decimals": 6,
+            "uiAmount": amount / 10**6,
+            "uiAmountString": str(amount / 10**6),
+        }
+
+    def _program_accounts(self, params):
+        accounts = [
+            {"pubkey": self.pubkey(), "account": self.account()}
+            for _ in range(self.program_accounts)
+        ]
+        config = params[1] if len(params) > 1 else {}
+        return self._context(accounts) if config.get("withContext") else accounts
+
+    def _token_accounts(self, params):
+        return self._context(
+            [
+                {"pubkey": self.pubkey(), "account": self.token_account()}
+                for _ in range(self.program_accounts)
+            ]
+        )
+
+    def logs(self):
+        program = self.pubkey()
+        lines = [f"Program {program} invoke [1]"]
+        lines += [
+            f"Program log: Instruction {index}" for index in range(self.log_lines)
+        ]
+        lines.append(
+            f"Program data: {base64.b64encode(self.rng.randbytes(48)).decode()}"
+        )
+        lines.append(
+            f"Program {program} consumed {self.rng.randrange(200_000)} of 200000 compute units"
+        )
+        lines.append(f"Program {program} success")
+        return lines
+
+    def transaction(self, slot):
+        keys = [self.pubkey() for _ in range(8)]
+        return {
+            "slot": slot,
+            "blockTime": 1_700_000_000 + slot // 3,
+            "meta": {
+                "computeUnitsConsumed": self.rng.randrange(200_000),
+                "err": None,
+                "fee": LAMPORTS_PER_SIGNATURE,
+                "innerInstructions": [],
+                "logMessages": self.logs(),
+                "postBalances": [self.rng.randrange(10**12) for _ in keys],
+                "postTokenBalances": [],
+                "preBalances": [self.rng.randrange(10**12) for _ in keys],
+                "preTokenBalances": [],
+                "rewards": [],
+                "status": {"Ok": None},
+            },
+            "transaction": {
+                "message": {
+                    "accountKeys": keys,
+                    "header": {
+                        "numReadonlySignedAccounts": 0,
+                        "numReadonlyUnsignedAccounts": 3,
+                        "numRequiredSignatures": 1,
+                    },
+                    "instructions": [
+                        {
+                            "accounts": [0, 1, 2, 3],
+                            "data": b58encode(self.rng.randbytes(24)),
+                            "programIdIndex": 7,
+                            "stackHeight": None,
+                        }
+                    ],
+                    "recentBlockhash": self.pubkey(),
+                },
+                "signatures": [self.signature()],
+            },
+            "version": "legacy",
+        }
+
+    def block(self, slot):
+        transactions = []
+        for _ in range(self.block_transactions):
+            transaction = self.transaction(slot)
+            del transaction["slot"], transaction["blockTime"]
+            transactions.append(transaction)
+        return {
+            "blockHeight": slot - 20_000_000,
+            "blockTime": 1_700_000_000 + slot // 3,
+            "blockhash": self.pubkey(),
+            "parentSlot": slot - 1,
+            "previousBlockhash": self.pubkey(),
+            "rewards": [],
+            "transactions": transactions,
+        }
+
+    def epoch_info(self):
+        return {
+            "absoluteSlot": self.slot,
+            "blockHeight": self.slot - 20_000_000,
+            "epoch": self.slot // SLOTS_PER_EPOCH,
+            "slotIndex": self.slot % SLOTS_PER_EPOCH,
+            "slotsInEpoch": SLOTS_PER_EPOCH,
+            "transactionCount": 300_000_000_000 + self.slot,
+        }
+
+    def inflation_reward(self, epoch=None):
+        epoch = self.slot // SLOTS_PER_EPOCH - 1 if epoch is None else epoch
+        return {
+            "amount": self.rng.randrange(10**9),
+            "commission": None,
+            "effectiveSlot": (epoch + 1) * SLOTS_PER_EPOCH,
+            "epoch": epoch,
+            "postBalance": self.rng.randrange(10**12),
+        }
+
+    def node(self, pubkey):
+        return {
+            "featureSet": 3294202862,
+            "gossip": "10.0.0.1:8001",
+            "pubkey": pubkey,
+            "rpc": None,
+            "shredVersion": 50093,
+            "tpu": "10.0.0.1:8003",
+            "version": API_VERSION,
+        }
+
+    def vote_account(self, pubkey):
+        return {
+            "activatedStake": self.rng.randrange(10**15),
+            "commission": 5,
+            "epochCredits": [],
+            "epochVoteAccount": True,
+            "lastVote": self.slot,
+            "nodePubkey": pubkey,
+            "rootSlot": self.slot - 32,
+            "votePubkey": self.pubkey(),
+        }
+
+    def performance_sample(self, index):
+        return {
+            "numNonVoteTransactions": self.rng.randrange(50_000, 100_000),
+            "numSlots": 150,
+            "numTransactions": self.rng.randrange(200_000, 300_000),
+            "samplePeriodSecs": 60,
+            "slot": self.slot - index * 150,
+        }
+
+    def signature_status(self):
+        return {
+            "confirmationStatus": "confirmed",
+            "confirmations": 10,
+            "err": None,
+            "slot": self.slot - 10,
+            "status": {"Ok": None},
+        }
+
+    def signature_info(self):
+        return {
+            "blockTime": 1_700_000_000 + self.slot // 3,
+            "confirmationStatus": "finalized",
+            "err": None,
+            "memo": None,
+            "signature": self.signature(),
+            "slot": self.slot - self.rng.randrange(1000),
+        }
+
+    def notification(self, method, params):
+        """
+        Returns the result of a notification for a subscription.
+
+        Args:
+            method (str): The subscribe method.
+            params (list): Its parameters.
+
+        Returns:
+            tuple: (notification method, result).
+        """
+        with self._lock:
+            if method == "accountSubscribe":
+                return "accountNotification", self._context(self.account())
+            if method == "programSubscribe":
+                return "programNotification", self._context(
+                    {"pubkey": self.pubkey(), "account": self.account()}
+                )
+            if method == "logsSubscribe":
+                return "logsNotification", self._context(
+                    {"signature": self.signature(), "err": None, "logs": self.logs()}
+                )
+            if method == "signatureSubscribe":
+                return "signatureNotification", self._context({"err": None})
+            if method == "slotSubscribe":
+                return "slotNotification", {
+                    "parent": self.slot - 1,
+                    "root": self.slot - 32,
+                    "slot": self.slot,
+                }
+            if method == "rootSubscribe":
+                return "rootNotification", self.slot - 32
+            if method == "blockSubscribe":
+                return "blockNotification", self._context(
+                    {"slot": self.slot, "block": self.block(self.slot), "err": None}
+                )
+            if method == "slotsUpdatesSubscribe":
+                return "slotsUpdatesNotification", {
+                    "slot": self.slot,
+                    "timestamp": int(time.time() * 1000),
+                    "type": "frozen",
+                }
+            if method == "voteSubscribe":
+                return "voteNotification", {
+                    "hash": self.pubkey(),
+                    "slots": [self.slot],
+                    "timestamp": None,
+                    "signature": self.signature(),
+                    "votePubkey": self.pubkey(),
+                }
+        raise KeyError(method)
+
+
+def _encode(message):
+    # Compact, like the server's serializer.
+    return json.dumps(message, separators=(",", ":"))
+
+
+class _Faults:
+    """Latency and failure injection shared by the mock servers."""
+
+    def __init__(self, latency, jitter, error_rate, rate_limit_rate, seed):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def draw(self):
+        """
+        Returns (delay in seconds, rate limited, failed) for the next request.
+        """
+        with self._lock:
+            delay = self.latency + (
+                self._rng.uniform(0, self.jitter) if self.jitter else 0
+            )
+            limited = self._rng.random() < self.rate_limit_rate
+            failed = self._rng.random() < self.error_rate
+        return delay, limited, failed
+
+
+class MockRPCServer:
+    """
+    Local JSON-RPC server answering the methods of the RPC wrappers.
+
+    Runs a threaded HTTP server on localhost in a background thread, with configurable
+    latency, error rate and share of 429 responses. Batch requests are supported.
+
+        with MockRPCServer(latency=0.002, error_rate=0.01) as server:
+            client = RPC(server.url)
+            client.cluster.get_slot()
+    """
+
+    def __init__(
+        self,
+        responses=None,
+        latency=0.0,
+        jitter=0.0,
+        error_rate=0.0,
+        rate_limit_rate=0.0,
+        seed=0,
+        host="127.0.0.1",
+        port=0,
+        compress_min_size=1024,
+    ):
+        """
+        Initialize the MockRPCServer.
+
+        Args:
+            responses (MockResponses, optional): The result generator.
+            latency (float, optional): Seconds added to every response.
+            jitter (float, optional): Upper bound of extra random latency in seconds.
+            error_rate (float, optional): Share of requests answered with a JSON-RPC error.
+            rate_limit_rate (float, optional): Share of requests answered with HTTP 429.
+            seed (int, optional): Seed of the fault injection RNG.
+            host (str, optional): Address to listen on.
+            port (int, optional): Port to listen on, 0 for any free port.
+            compress_min_size (int, optional): Responses of at least this many bytes are
+                gzipped for clients accepting gzip; None to never compress.
+        """
+        self.responses = responses or MockResponses(seed)
+        self.compress_min_size = compress_min_size
+        self.faults = _Faults(latency, jitter, error_rate, rate_limit_rate, seed)
+        self.requests = 0
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def start(self):
+        """Start serving in a background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._server.serve_forever, daemon=True
+            )
+            self._thread.start()
+
+    def stop(self):
+        """Stop serving."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def answer(self, request):
+        """
+        Returns the response to a single JSON-RPC request.
+
+        Args:
+            request (dict): The request.
+
+        Returns:
+            dict: The response.
+        """
+        self.requests += 1
+        response = {"jsonrpc": "2.0", "id": request.get("id")}
+        try:
+            response["result"] = self.responses.result(
+                request.get("method"), request.get("params")
+            )
+        except KeyError:
+            response["error"] = {
+                "code": METHOD_NOT_FOUND,
+                "message": "Method not found",
+            }
+        except Exception as e:
+            response["error"] = {"code": INTERNAL_ERROR, "message": str(e)}
+        return response
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body are written separately; don't let Nagle delay the body.
+            disable_nagle_algorithm = True
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                delay, limited, failed = server.faults.draw()
+                if delay:
+                    time.sleep(delay)
+
+                if limited:
+                    self._send(
+                        429,
+                        b'{"jsonrpc":"2.0","error":{"code":429,"message":"Too many requests"}}',
+                        {"Retry-After": "1"},
+                    )
+                    return
+
+                try:
+                    request = json.loads(body)
+                except ValueError:
+                    self._send(
+                        400,
+                        b'{"jsonrpc":"2.0","error":{"code":-32700,"message":"Parse error"},"id":null}',
+                    )
+                    return
+
+                if failed:
+                    error = {"code": NODE_UNHEALTHY, "message": "Node is unhealthy"}
+                    if isinstance(request, list):
+                        response = [
+                            {"jsonrpc": "2.0", "error": error, "id": item.get("id")}
+                            for item in request
+                        ]
+                    else:
+                        response = {
+                            "jsonrpc": "2.0",
+                            "error": error,
+                            "id": request.get("id"),
+                        }
+                elif isinstance(request, list):
+                    response = [server.answer(item) for item in request]
+                else:
+                    response = server.answer(request)
+
+                body = _encode(response).encode()
+                if (
+                    server.compress_min_size is not None
+                    and len(body) >= server.compress_min_size
+                    and "gzip" in self.headers.get("Accept-Encoding", "")
+                ):
+                    self._send(
+                        200,
+                        gzip.compress(body, compresslevel=1),
+                        {"Content-Encoding": "gzip"},
+                    )
+                    return
+                self._send(200, body)
+
+            def _send(self, status, body, headers=None):
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+class MockWSServer:
+    """
+    Local WebSocket server emitting the notifications of the WS subscriptions.
+
+    Every subscription receives a notification per tick (`interval` seconds, one slot),
+    except signature subscriptions, which are notified once and then cancelled.
+
+        server = MockWSServer(interval=0.01)
+        await server.start()
+        client = WS(server.url)
+    """
+
+    def __init__(
+        self,
+        responses=None,
+        interval=0.4,
+        latency=0.0,
+        error_rate=0.0,
+        seed=0,
+        host="127.0.0.1",
+        port=0,
+    ):
+        """
+        Initialize the MockWSServer.
+
+        Args:
+            responses (MockResponses, optional): The notification generator.
+            interval (float, optional): Seconds between notifications of a subscription.
+            latency (float, optional): Seconds before a request is answered.
+            error_rate (float, optional): Share of subscribe requests answered with an error.
+            seed (int, optional): Seed of the fault injection RNG.
+            host (str, optional): Address to listen on.
+            port (int, optional): Port to listen on, 0 for any free port.
+        """
+        self.responses = responses or MockResponses(seed)
+        self.interval = interval
+        self.faults = _Faults(latency, 0.0, error_rate, 0.0, seed)
+        self.host = host
+        self.port = port
+        self.notifications = 0
+        self._server = None
+        self._ticker = None
+        self._next_subscription_id = 1
+
+    @property
+    def url(self):
+        return f"ws://{self.host}:{self.port}"
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+
+    async def start(self):
+        """Start listening."""
+        self._server = await websockets.serve(self._serve, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._ticker = asyncio.create_task(self._tick())
+
+    async def stop(self):
+        """Close every connection and stop listening."""
+        if self._ticker is not None:
+            self._ticker.cancel()
+            self._ticker = None
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _serve(self, websocket, path=None):
+        subscriptions = {}  # subscription id -> notifier task
+        try:
+            async for message in websocket:
+                request = json.loads(message)
+                delay, _, failed = self.faults.draw()
+                if delay:
+                    await asyncio.sleep(delay)
+
+                method = request.get("method", "")
+                response = {"jsonrpc": "2.0", "id": request.get("id")}
+                if method.endswith("Unsubscribe"):
+                    task = subscriptions.pop((request.get("params") or [None])[0], None)
+                    if task is None:
+                        response["error"] = {
+                            "code": -32602,
+                            "message": "Invalid subscription id.",
+                        }
+                    else:
+                        task.cancel()
+                        response["result"] = True
+                elif method.endswith("Subscribe"):
+                    if failed:
+                        response["error"] = {
+                            "code": INTERNAL_ERROR,
+                            "message": "Internal error",
+                        }
+                    else:
+                        subscription_id = self._next_subscription_id
+                        self._next_subscription_id += 1
+                        subscriptions[subscription_id] = asyncio.create_task(
+                            self._notify(
+                                websocket,
+                                subscriptions,
+                                subscription_id,
+                                method,
+                                request.get("params") or [],
+                            )
+                        )
+                        response["result"] = subscription_id
+                else:
+                    response["error"] = {
+                        "code": METHOD_NOT_FOUND,
+                        "message": "Method not found",
+                    }
+
+                await websocket.send(_encode(response))
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            for task in subscriptions.values():
+                task.cancel()
+
+    async def _notify(self, websocket, subscriptions, subscription_id, method, params):
+        while True:
+            await asyncio.sleep(self.interval)
+            notification, result = self.responses.notification(method, params)
+            await websocket.send(
+                _encode(
+                    {
+                        "jsonrpc": "2.0",
+                        "method": notification,
+                        "params": {"result": result, "subscription": subscription_id},
+                    }
+                )
+            )
+            self.notifications += 1
+            if method == "signatureSubscribe":
+                subscriptions.pop(subscription_id, None)
+                return
+
+    async def _tick(self):
+        # One slot per interval, shared by every connection.
+        while True:
+            await asyncio.sleep(self.interval)
+            self.responses.advance()
@@ -0,0 +1,125 @@
+import time
+
+
+class RequestTrace:
+    """
+    Timing of a single request, passed to before-request and after-response hooks.
+
+    Before-request hooks see the method, endpoint and request size; after-response hooks
+    see the same object with the timings filled in. Hooks may keep per-request state
+    (such as an open tracing span) in `context`.
+
+    Timings are in seconds:
+        queue_wait: waiting before the request could be sent (e.g. in the async bridge)
+        encode: serializing the request
+        connect: opening a connection, TLS included (0 when one was reused)
+        ttfb: from sending the request to the response headers (WS: to the reply)
+        download: reading the response body
+        decode: parsing the response JSON
+        total: the whole call
+    """
+
+    __slots__ = (
+        "method",
+        "endpoint",
+        "started_at",
+        "request_bytes",
+        "response_bytes",
+        "wire_bytes",
+        "status",
+        "queue_wait",
+        "encode",
+        "connect",
+        "ttfb",
+        "download",
+        "decode",
+        "total",
+        "error",
+        "context",
+    )
+
+    def __init__(self, method, endpoint, request_bytes=None):
+        self.method = method
+        self.endpoint = endpoint
+        self.started_at = time.time()
+        self.request_bytes = request_bytes
+        self.response_bytes = None
+        self.wire_bytes = None  # response bytes on the wire, before decompression
+        self.status = None
+        self.queue_wait = 0.0
+        self.encode = None
+        self.connect = None
+        self.ttfb = None
+        self.download = None
+        self.decode = None
+        self.total = None
+        self.error = None  # the exception raised, or the JSON-RPC error object
+        self.context = {}
+
+    def __repr__(self):
+        return (
+            f"RequestTrace(method={self.method!r}, total={self.total!r}, "
+            f"error={self.error!r})"
+        )
+
+    def as_dict(self):
+        """
+        Returns the trace as a dict (without `context`).
+
+        Returns:
+            dict: The trace fields.
+        """
+        return {name: getattr(self, name) for name in self.__slots__[:-1]}
+
+
+class MessageTrace:
+    """
+    A message received on a WebSocket, passed to receive and dispatch hooks.
+
+    Receive hooks run as soon as the message is read, with its size and receive time.
+    Dispatch hooks run once it has been routed, with the method, subscription ID and
+    the time spent decoding and dispatching it (queueing included, so a consumer that
+    falls behind shows up as dispatch time).
+    """
+
+    __slots__ = (
+        "endpoint",
+        "received_at",
+        "size",
+        "method",
+        "subscription",
+        "decode",
+        "dispatch",
+        "context",
+    )
+
+    def __init__(self, endpoint, size):
+        self.endpoint = endpoint
+        self.received_at = time.time()
+        self.size = size
+        self.method = None
+        self.subscription = None
+        self.decode = None
+        self.dispatch = None
+        self.context = {}
+
+    def __repr__(self):
+        return (
+            f"MessageTrace(method={self.method!r}, size={self.size}, "
+            f"dispatch={self.dispatch!r})"
+        )
+
+
+def run_hooks(hooks, trace):
+    """
+    Call every hook with a trace; a failing hook does not affect the request.
+
+    Args:
+        hooks (list): The hooks.
+        trace (RequestTrace or MessageTrace): The trace.
+    """
+    for hook in hooks:
+        try:
+            hook(trace)
+        except Exception as e:
+            print(f"Error in tracing hook: {e}")
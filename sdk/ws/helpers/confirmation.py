@@ -0,0 +1,228 @@
+import asyncio
+import time
+
+from sdk.ws.wrappers.notification import RawNotification
+
+COMMITMENT_LEVELS = {"processed": 0, "confirmed": 1, "finalized": 2}
+
+
+class TransactionConfirmer:
+    """
+    Confirms transactions by racing a signatureSubscribe against RPC status polling.
+
+    Whichever source reports the signature at the requested commitment first wins; the
+    other one is cancelled, and the signature subscription is removed. With the
+    `lastValidBlockHeight` of the transaction's blockhash, the transaction is reported
+    as expired once the block height passes it without the signature being seen.
+
+        confirmer = TransactionConfirmer(ws, rpc)
+        result = await confirmer.confirm(signature, "confirmed", last_valid_block_height)
+        if result["status"] == "confirmed" and result["err"] is None:
+            ...
+    """
+
+    def __init__(self, ws, rpc, poll_interval=0.5, block_height_interval=2.0):
+        """
+        Initialize the TransactionConfirmer.
+
+        Args:
+            ws (WS): The WebSocket client used for signatureSubscribe.
+            rpc (RPC): The RPC client used for getSignatureStatuses and getBlockHeight.
+            poll_interval (float, optional): Seconds between signature status polls.
+            block_height_interval (float, optional): Seconds between block height checks.
+        """
+        self.ws = ws
+        self.rpc = rpc
+        self.poll_interval = poll_interval
+        self.block_height_interval = block_height_interval
+
+    async def confirm(
+        self,
+        signature,
+        commitment="confirmed",
+        last_valid_block_height=None,
+        timeout=None,
+    ):
+        """
+        Wait until a transaction reaches a commitment level, expires, or times out.
+
+        Args:
+            signature (str): The transaction signature as a base-58 encoded string.
+            commitment (str, optional): processed, confirmed or finalized.
+            last_valid_block_height (int, optional): lastValidBlockHeight of the blockhash
+                the transaction was signed with.
+            timeout (float, optional): Seconds to wait at most.
+
+        Returns:
+            dict: signature, status (confirmed, expired or timeout), err (the transaction
+                error, None if it succeeded), slot, source (websocket or rpc) and elapsed
+                seconds.
+        """
+        if commitment not in COMMITMENT_LEVELS:
+            raise ValueError(f"Unknown commitment: {commitment}")
+
+        started = time.monotonic()
+        tasks = [
+            asyncio.create_task(self._watch(signature, commitment)),
+            asyncio.create_task(self._poll(signature, commitment)),
+        ]
+        if last_valid_block_height is not None:
+            tasks.append(
+                asyncio.create_task(
+                    self._deadline(signature, commitment, last_valid_block_height)
+                )
+            )
+
+        pending = set(tasks)
+        error = None
+        try:
+            while pending:
+                remaining = None
+                if timeout is not None:
+                    remaining = timeout - (time.monotonic() - started)
+                    if remaining <= 0:
+                        break
+
+                done, pending = await asyncio.wait(
+                    pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is not None:
+                        # One source failing does not decide the race.
+                        error = task.exception()
+                        continue
+                    result = task.result()
+                    result["signature"] = signature
+                    result["elapsed"] = time.monotonic() - started
+                    return result
+
+            if not pending and error is not None:
+                raise error
+            return {
+                "status": "timeout",
+                "err": None,
+                "slot": None,
+                "source": None,
+                "signature": signature,
+                "elapsed": time.monotonic() - started,
+            }
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _watch(self, signature, commitment):
+        subscription = await self.ws.signature_subscribe(
+            signature, {"commitment": commitment}, handle=True
+        )
+        # Unsubscribes if cancelled; after the notification the subscription is gone.
+        async with subscription:
+            async for data in subscription:
+                if isinstance(data, RawNotification):
+                    data = data.decode()
+                if data.get("method") != "signatureNotification":
+                    continue
+
+                result = data["params"]["result"]
+                value = result.get("value")
+                if not isinstance(value, dict):
+                    continue
+                return {
+                    "status": "confirmed",
+                    "err": value.get("err"),
+                    "slot": result.get("context", {}).get("slot"),
+                    "source": "websocket",
+                }
+
+        raise ConnectionError("Signature subscription closed")
+
+    async def _status(self, signature, commitment):
+        """
+        Returns the status of a signature if it reached the commitment level, else None.
+        """
+        response = await asyncio.to_thread(
+            self.rpc.transaction.get_signature_statuses, [signature]
+        )
+        if "result" not in response:
+            raise Exception(
+                f"Error getting signature statuses: {response.get('error')}"
+            )
+
+        status = response["result"]["value"][0]
+        if status is None:
+            return None
+
+        level = COMMITMENT_LEVELS.get(status.get("confirmationStatus"), -1)
+        if status.get("confirmations") is None:
+            # Rooted: finalized on every node.
+            level = COMMITMENT_LEVELS["finalized"]
+        if level < COMMITMENT_LEVELS[commitment]:
+            return None
+
+        return {
+            "status": "confirmed",
+            "err": status.get("err"),
+            "slot": status.get("slot"),
+            "source": "rpc",
+        }
+
+    async def _poll(self, signature, commitment):
+        while True:
+            try:
+                result = await self._status(signature, commitment)
+                if result is not None:
+                    return result
+            except Exception as e:
+                print(f"Error polling signature status: {e}")
+            await asyncio.sleep(self.poll_interval)
+
+    async def _deadline(self, signature, commitment, last_valid_block_height):
+        while True:
+            try:
+                response = await asyncio.to_thread(
+                    self.rpc.block.get_block_height, commitment
+                )
+                block_height = response.get("result")
+            except Exception as e:
+                print(f"Error getting block height: {e}")
+                block_height = None
+
+            if block_height is not None and block_height > last_valid_block_height:
+                # It may have landed right before the blockhash expired.
+                result = await self._status(signature, commitment)
+                if result is not None:
+                    return result
+                return {
+                    "status": "expired",
+                    "err": None,
+                    "slot": None,
+                    "source": "rpc",
+                }
+            await asyncio.sleep(self.block_height_interval)
+
+
+async def confirm(
+    ws,
+    rpc,
+    signature,
+    commitment="confirmed",
+    last_valid_block_height=None,
+    timeout=None,
+):
+    """
+    Confirm a transaction with a one-off TransactionConfirmer (see `confirm` there).
+
+    Args:
+        ws (WS): The WebSocket client.
+        rpc (RPC): The RPC client.
+        signature (str): The transaction signature as a base-58 encoded string.
+        commitment (str, optional): processed, confirmed or finalized.
+        last_valid_block_height (int, optional): lastValidBlockHeight of the blockhash.
+        timeout (float, optional): Seconds to wait at most.
+
+    Returns:
+        dict: The confirmation result.
+    """
+    return await TransactionConfirmer(ws, rpc).confirm(
+        signature, commitment, last_valid_block_height, timeout
+    )
@@ -0,0 +1,206 @@
+from binascii import Error as Base64Error, a2b_base64
+from typing import Iterator, List, Optional
+
+# Every structured line starts with "Program "; the next four characters pick the kind.
+_PREFIX = "Program "
+_PREFIX_LEN = len(_PREFIX)
+_LOG = "log:"
+_DATA = "data"
+_RETURN = "retu"
+_CONSUMPTION = "cons"
+
+
+class Invocation:
+    """
+    A single program invocation and everything it logged.
+
+    Attributes:
+        program_id (str): The invoked program.
+        depth (int): Invocation depth, 1 for instructions of the transaction itself.
+        logs (list): "Program log:" messages, in order.
+        data (list): "Program data:" payloads decoded from base64 (one list of byte
+            strings per line, since a line may carry several space-separated payloads).
+        return_data (bytes): Data set with sol_set_return_data, if any.
+        compute_units (int): Compute units consumed, if reported.
+        compute_limit (int): Compute units available, if reported.
+        success (bool): True or False once the program finished, None if the logs end
+            (or are truncated) before that.
+        error (str): The failure message of a failed invocation.
+        children (list): Invocations made by this program through CPI.
+    """
+
+    __slots__ = (
+        "program_id",
+        "depth",
+        "logs",
+        "data",
+        "return_data",
+        "compute_units",
+        "compute_limit",
+        "success",
+        "error",
+        "children",
+    )
+
+    def __init__(self, program_id: str, depth: int):
+        self.program_id = program_id
+        self.depth = depth
+        self.logs = []
+        self.data = []
+        self.return_data = None
+        self.compute_units = None
+        self.compute_limit = None
+        self.success = None
+        self.error = None
+        self.children = []
+
+    def __repr__(self):
+        return (
+            f"Invocation(program_id={self.program_id!r}, depth={self.depth}, "
+            f"success={self.success!r}, children={len(self.children)})"
+        )
+
+    def walk(self) -> Iterator["Invocation"]:
+        """
+        Iterate over this invocation and all nested ones, depth first.
+
+        Yields:
+            Invocation: The invocations in execution order.
+        """
+        stack = [self]
+        while stack:
+            invocation = stack.pop()
+            yield invocation
+            stack.extend(reversed(invocation.children))
+
+
+class ParsedLogs:
+    """
+    The invocation tree of a transaction, built from a logsNotification.
+    """
+
+    __slots__ = ("signature", "err", "invocations", "truncated")
+
+    def __init__(self, signature, err, invocations, truncated):
+        self.signature = signature
+        self.err = err
+        self.invocations = invocations
+        self.truncated = truncated
+
+    def __repr__(self):
+        return (
+            f"ParsedLogs(signature={self.signature!r}, err={self.err!r}, "
+            f"invocations={len(self.invocations)})"
+        )
+
+    def walk(self) -> Iterator[Invocation]:
+        """
+        Iterate over every invocation of the transaction, depth first.
+
+        Yields:
+            Invocation: The invocations in execution order.
+        """
+        for invocation in self.invocations:
+            yield from invocation.walk()
+
+
+def _decode(payload: str) -> Optional[bytes]:
+    try:
+        return a2b_base64(payload)
+    except Base64Error:
+        return None
+
+
+def parse_logs(logs: List[str]) -> List[Invocation]:
+    """
+    Build the invocation tree of a transaction from its log lines.
+
+    Lines are dispatched on fixed prefixes and split on spaces, without regular
+    expressions. Lines that do not belong to an invocation are ignored.
+
+    Args:
+        logs (list): The log lines, as found in logsNotification or transaction meta.
+
+    Returns:
+        list: The top-level Invocations (one per instruction that logged).
+    """
+    invocations = []
+    stack = []
+
+    for line in logs:
+        if not line.startswith(_PREFIX):
+            continue
+
+        kind = line[_PREFIX_LEN : _PREFIX_LEN + 4]
+        if kind == _LOG:
+            if stack:
+                stack[-1].logs.append(line[_PREFIX_LEN + 5 :])
+            continue
+        if kind == _DATA and line.startswith("data: ", _PREFIX_LEN):
+            if stack:
+                stack[-1].data.append(
+                    [_decode(payload) for payload in line[_PREFIX_LEN + 6 :].split()]
+                )
+            continue
+        if kind == _RETURN and line.startswith("return: ", _PREFIX_LEN):
+            if stack:
+                parts = line[_PREFIX_LEN + 8 :].split(" ", 1)
+                if len(parts) == 2:
+                    stack[-1].return_data = _decode(parts[1])
+            continue
+        if kind == _CONSUMPTION and line.startswith("consumption: ", _PREFIX_LEN):
+            continue
+
+        # "Program <id> invoke [1]", "<id> success", "<id> failed: <error>",
+        # "<id> consumed <n> of <m> compute units"
+        parts = line[_PREFIX_LEN:].split(" ", 2)
+        if len(parts) < 2:
+            continue
+        program_id, verb = parts[0], parts[1]
+        rest = parts[2] if len(parts) == 3 else ""
+
+        if verb == "invoke":
+            try:
+                depth = int(rest.strip("[]"))
+            except ValueError:
+                depth = len(stack) + 1
+            invocation = Invocation(program_id, depth)
+            if stack:
+                stack[-1].children.append(invocation)
+            else:
+                invocations.append(invocation)
+            stack.append(invocation)
+        elif verb == "consumed":
+            if stack and stack[-1].program_id == program_id:
+                units = rest.split(" ", 3)
+                if len(units) >= 3 and units[1] == "of":
+                    stack[-1].compute_units = int(units[0])
+                    stack[-1].compute_limit = int(units[2])
+        elif verb == "success" or verb == "failed:":
+            if stack and stack[-1].program_id == program_id:
+                invocation = stack.pop()
+                invocation.success = verb == "success"
+                if not invocation.success:
+                    invocation.error = rest
+
+    return invocations
+
+
+def parse_logs_notification(data: dict) -> ParsedLogs:
+    """
+    Parse a logsNotification into the invocation tree of its transaction.
+
+    Args:
+        data (dict): The decoded logsNotification.
+
+    Returns:
+        ParsedLogs: The signature, error and invocation tree of the transaction.
+    """
+    value = data["params"]["result"]["value"]
+    logs = value.get("logs") or []
+    return ParsedLogs(
+        value.get("signature"),
+        value.get("err"),
+        parse_logs(logs),
+        bool(logs) and logs[-1] == "Log truncated",
+    )
@@ -0,0 +1,172 @@
+import asyncio
+import time
+
+from sdk.ws.wrappers.notification import RawNotification
+
+# slotsUpdatesNotification types that move each commitment level.
+_PROCESSED_UPDATES = ("frozen",)
+_CONFIRMED_UPDATES = ("optimisticConfirmation",)
+_FINALIZED_UPDATES = ("root",)
+
+
+class SlotClock:
+    """
+    Current processed, confirmed and finalized slots, kept up to date from a
+    WebSocket stream instead of getSlot/getBlockHeight round trips.
+
+    With `source="slot"` the clock follows slotNotification (processed slot and root);
+    with `source="slots_updates"` it follows slotsUpdatesNotification, which also carries
+    optimistic confirmations. When the stream stays silent for `stall_timeout` seconds,
+    the slots are polled over RPC until it resumes.
+
+    Attach the clock to an RPC client (`rpc.slot_clock = clock`) to have wrapper calls
+    that accept `minContextSlot` fill it in from the clock.
+
+        clock = SlotClock(ws, rpc)
+        await clock.start()
+        print(clock.processed, clock.confirmed, clock.finalized, clock.slot_time)
+    """
+
+    def __init__(
+        self,
+        ws,
+        rpc=None,
+        source="slot",
+        stall_timeout=2.0,
+        smoothing=0.1,
+    ):
+        """
+        Initialize the SlotClock.
+
+        Args:
+            ws (WS): The WebSocket client to subscribe with.
+            rpc (RPC, optional): RPC client polled while the stream is stalled.
+            source (str, optional): slot or slots_updates.
+            stall_timeout (float, optional): Seconds without a notification before the
+                slots are polled over RPC (and between polls while stalled).
+            smoothing (float, optional): Weight of the newest observation in the moving
+                average of the slot time.
+        """
+        if source not in ("slot", "slots_updates"):
+            raise ValueError(f"Unknown slot clock source: {source}")
+
+        self.ws = ws
+        self.rpc = rpc
+        self.source = source
+        self.stall_timeout = stall_timeout
+        self.smoothing = smoothing
+
+        self.processed = None
+        self.confirmed = None
+        self.finalized = None
+        self.slot_time = 0.4  # seconds per slot, refined as slots advance
+        self.updated_at = None  # monotonic time of the last processed slot change
+        self.stalls = 0
+        self._task = None
+
+    def slot(self, commitment="finalized"):
+        """
+        Returns the latest slot known for a commitment level.
+
+        Args:
+            commitment (str, optional): processed, confirmed or finalized.
+
+        Returns:
+            int or None: The slot, or None if it is not known yet.
+        """
+        return getattr(self, commitment, None)
+
+    def estimate(self, at=None):
+        """
+        Extrapolate the processed slot from the last observation and the slot time.
+
+        Args:
+            at (float, optional): A time.monotonic() timestamp, defaults to now.
+
+        Returns:
+            int or None: The estimated processed slot.
+        """
+        if self.processed is None:
+            return None
+        elapsed = (time.monotonic() if at is None else at) - self.updated_at
+        return self.processed + int(elapsed / self.slot_time)
+
+    async def start(self):
+        """Subscribe and start following the slots in the background."""
+        if self._task is None or self._task.done():
+            subscription = await getattr(self.ws, f"{self.source}_subscribe")(
+                handle=True
+            )
+            self._task = asyncio.create_task(self._run(subscription))
+
+    async def stop(self):
+        """Stop following the slots and cancel the subscription."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self, subscription):
+        async with subscription:
+            iterator = subscription.__aiter__()
+            while True:
+                try:
+                    data = await asyncio.wait_for(
+                        iterator.__anext__(), self.stall_timeout
+                    )
+                except asyncio.TimeoutError:
+                    self.stalls += 1
+                    await self.poll()
+                    continue
+                except StopAsyncIteration:
+                    return
+
+                if isinstance(data, RawNotification):
+                    data = data.decode()
+                result = data.get("params", {}).get("result")
+                if not isinstance(result, dict):
+                    continue
+                if data.get("method") == "slotNotification":
+                    self._update("processed", result.get("slot"))
+                    self._update("finalized", result.get("root"))
+                elif data.get("method") == "slotsUpdatesNotification":
+                    kind = result.get("type")
+                    if kind in _PROCESSED_UPDATES:
+                        self._update("processed", result.get("slot"))
+                    elif kind in _CONFIRMED_UPDATES:
+                        self._update("confirmed", result.get("slot"))
+                    elif kind in _FINALIZED_UPDATES:
+                        self._update("finalized", result.get("slot"))
+
+    async def poll(self):
+        """Fetch the slot of every commitment level over RPC."""
+        if self.rpc is None:
+            return
+
+        for commitment in ("processed", "confirmed", "finalized"):
+            try:
+                response = await asyncio.to_thread(
+                    self.rpc.cluster.get_slot, commitment
+                )
+            except Exception as e:
+                print(f"Error polling slot: {e}")
+                return
+            self._update(commitment, response.get("result"), measure=False)
+
+    def _update(self, commitment, slot, measure=True):
+        if slot is None:
+            return
+
+        current = getattr(self, commitment)
+        if current is not None and slot <= current:
+            return
+        setattr(self, commitment, slot)
+
+        if commitment != "processed":
+            return
+        now = time.monotonic()
+        if current is not None and measure:
+            # Polled slots may jump far ahead, only stream updates time single slots.
+            observed = (now - self.updated_at) / (slot - current)
+            self.slot_time += self.smoothing * (observed - self.slot_time)
+        self.updated_at = now
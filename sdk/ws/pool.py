@@ -0,0 +1,456 @@
+import asyncio
+import time
+
+from sdk.ws import WS
+from sdk.ws.wrappers.notification import (
+    RawNotification,
+    dispatch_offloaded,
+    notification_key,
+)
+from sdk.ws.wrappers.queues import BLOCK, NotificationQueue
+from sdk.ws.wrappers.subscription import _CLOSED
+
+
+class WSPool:
+    """
+    Spreads subscriptions over several WebSocket connections.
+
+    Each connection carries at most `max_subscriptions_per_connection` subscriptions, and
+    new subscriptions go to the least loaded connection. Notifications of every
+    connection are merged into a single stream, with subscription IDs rewritten to IDs
+    owned by the pool. Connections reconnect on their own; when one gives up, its
+    subscriptions are moved to the remaining connections and a `gapNotification` is
+    delivered for each of them.
+    """
+
+    def __init__(
+        self,
+        url,
+        api_key=None,
+        connections=4,
+        max_subscriptions_per_connection=1000,
+        max_reconnect_attempts=5,
+        **options,
+    ):
+        """
+        Initialize the WSPool instance.
+
+        Args:
+            url (str): The WebSocket URL (wss://mainnet.-rpc.com or wss://devnet.-rpc.com)
+            api_key (str, optional): The  API key.
+            connections (int, optional): Number of WebSocket connections.
+            max_subscriptions_per_connection (int, optional): Subscription cap of a single connection.
+            max_reconnect_attempts (int, optional): Failed reconnects after which a connection
+                is replaced and its subscriptions are moved.
+            **options: Extra keyword arguments passed to every WS connection.
+        """
+        self.url = url
+        self.api_key = api_key
+        self.max_subscriptions_per_connection = max_subscriptions_per_connection
+        self.options = dict(options, max_reconnect_attempts=max_reconnect_attempts)
+
+        self.clients = [self._new_client() for _ in range(connections)]
+        self.subscriptions = {}  # pool subscription id -> kind
+        # pool subscription id -> (client, client subscription id)
+        self._placements = {}
+        # pool subscription id -> (kind, args, kwargs)
+        self._requests = {}
+        # (client, client subscription id) -> pool subscription id
+        self._reverse = {}
+        self._counts = {client: 0 for client in self.clients}
+        self._next_subscription_id = 1
+        self._notifications = NotificationQueue(
+            options.get("queue_size", 1024), options.get("queue_policy", BLOCK)
+        )
+        self._pumps = {}
+        self._closing = False
+        # Notifications that beat the mapping of their subscription, while subscribe
+        # calls are in flight: (client, client subscription id) -> [notification]
+        self._early = {}
+        self._placing = 0
+
+    def _new_client(self):
+        return WS(self.url, self.api_key, **self.options)
+
+    async def connect(self):
+        """Connect every WebSocket and start merging their notifications."""
+        if self._closing:
+            # Consumers of the closed pool own the old queue and its close sentinel.
+            self._notifications = NotificationQueue(
+                self.options.get("queue_size", 1024),
+                self.options.get("queue_policy", BLOCK),
+            )
+        self._closing = False
+        await asyncio.gather(*(client.connect() for client in self.clients))
+        for client in self.clients:
+            self._start_pump(client)
+
+    async def disconnect(self):
+        """Disconnect every WebSocket."""
+        self._closing = True
+        await asyncio.gather(*(client.disconnect() for client in self.clients))
+        await asyncio.gather(*self._pumps.values(), return_exceptions=True)
+        self._pumps.clear()
+        self._early.clear()
+        self._placements.clear()
+        self._requests.clear()
+        self._reverse.clear()
+        self.subscriptions.clear()
+        self._counts = {client: 0 for client in self.clients}
+        self._notifications.put_nowait(_CLOSED)
+
+    async def subscribe(self, kind, *args, **kwargs):
+        """
+        Subscribe on the least loaded connection.
+
+        Args:
+            kind (str): The subscription type, matching a WS `<kind>_subscribe` method
+                (account, program, logs, signature, slot, root, ...).
+            *args: Positional arguments of the subscribe method.
+            **kwargs: Keyword arguments of the subscribe method.
+
+        Returns:
+            int: The pool subscription ID.
+        """
+        subscription_id = self._next_subscription_id
+        self._next_subscription_id += 1
+
+        await self._place(subscription_id, kind, args, kwargs)
+        self._requests[subscription_id] = (kind, args, kwargs)
+        self.subscriptions[subscription_id] = kind
+        return subscription_id
+
+    async def unsubscribe(self, subscription_id):
+        """
+        Cancel a subscription.
+
+        Args:
+            subscription_id (int): The pool subscription ID.
+
+        Returns:
+            bool: True if unsubscribe was successful, False otherwise.
+        """
+        placement = self._placements.get(subscription_id)
+        if placement is None:
+            return False
+
+        client, client_subscription_id = placement
+        kind = self._requests[subscription_id][0]
+        result = await getattr(client, f"{kind}_unsubscribe")(client_subscription_id)
+        if result:
+            self._unplace(subscription_id)
+            self._requests.pop(subscription_id, None)
+            self.subscriptions.pop(subscription_id, None)
+        return result
+
+    async def subscribe_many(self, kind, targets, config=None):
+        """
+        Subscribe to many targets at once, spread over the least loaded connections.
+
+        Each connection pipelines its share of the subscribe requests (see
+        `BaseWS.subscribe_many`), and the connections work concurrently.
+
+        Args:
+            kind (str): The subscription type: account, program, logs, signature or block.
+            targets (list): The subscription targets, one per subscription.
+            config (dict, optional): Configuration options shared by every subscription.
+
+        Returns:
+            list: For each target, the pool subscription ID, or the exception the
+                subscription failed with.
+        """
+        results = [None] * len(targets)
+        # client -> [(index, pool subscription id, target)]
+        batches = {}
+        for index, target in enumerate(targets):
+            client = min(self.clients, key=lambda c: self._counts[c])
+            if self._counts[client] >= self.max_subscriptions_per_connection:
+                results[index] = Exception(
+                    "Error subscribing: every pool connection is full"
+                )
+                continue
+
+            self._counts[client] += 1
+            subscription_id = self._next_subscription_id
+            self._next_subscription_id += 1
+            batches.setdefault(client, []).append((index, subscription_id, target))
+
+        async def run(client, batch):
+            try:
+                if client not in self._pumps:
+                    await client.connect()
+                    self._start_pump(client)
+                client_results = await client.subscribe_many(
+                    kind, [target for _, _, target in batch], config
+                )
+            except Exception as e:
+                client_results = [e] * len(batch)
+
+            for (index, subscription_id, target), result in zip(batch, client_results):
+                if isinstance(result, Exception):
+                    self._counts[client] -= 1
+                    results[index] = result
+                    continue
+
+                self._requests[subscription_id] = (kind, (target, config), {})
+                self.subscriptions[subscription_id] = kind
+                results[index] = subscription_id
+                await self._map(client, result, subscription_id)
+
+        self._placing += 1
+        try:
+            await asyncio.gather(
+                *(run(client, batch) for client, batch in batches.items())
+            )
+        finally:
+            self._placed()
+        return results
+
+    async def unsubscribe_many(self, subscription_ids):
+        """
+        Cancel many subscriptions at once.
+
+        Args:
+            subscription_ids (list): The pool subscription IDs.
+
+        Returns:
+            list: For each subscription, True if unsubscribe was successful, False
+                otherwise, or the exception it failed with.
+        """
+        results = [False] * len(subscription_ids)
+        # client -> [(index, pool subscription id, client subscription id)]
+        batches = {}
+        for index, subscription_id in enumerate(subscription_ids):
+            placement = self._placements.get(subscription_id)
+            if placement is not None:
+                client, client_subscription_id = placement
+                batches.setdefault(client, []).append(
+                    (index, subscription_id, client_subscription_id)
+                )
+
+        responses = await asyncio.gather(
+            *(
+                client.unsubscribe_many([item[2] for item in batch])
+                for client, batch in batches.items()
+            ),
+            return_exceptions=True,
+        )
+
+        for (client, batch), client_results in zip(batches.items(), responses):
+            if isinstance(client_results, Exception):
+                client_results = [client_results] * len(batch)
+            for (index, subscription_id, _), result in zip(batch, client_results):
+                if result is True:
+                    self._unplace(subscription_id)
+                    self._requests.pop(subscription_id, None)
+                    self.subscriptions.pop(subscription_id, None)
+                results[index] = result
+        return results
+
+    async def account_subscribe(self, pubkey, config=None):
+        """
+        Subscribe to an account on the least loaded connection.
+
+        Args:
+            pubkey (str): The account public key as a base-58 encoded string.
+            config (dict, optional): Configuration options.
+
+        Returns:
+            int: The pool subscription ID.
+        """
+        return await self.subscribe("account", pubkey, config)
+
+    async def program_subscribe(self, program_id, config=None):
+        """
+        Subscribe to a program on the least loaded connection.
+
+        Args:
+            program_id (str): The program ID as a base-58 encoded string.
+            config (dict, optional): Configuration options.
+
+        Returns:
+            int: The pool subscription ID.
+        """
+        return await self.subscribe("program", program_id, config)
+
+    async def handle_notifications(
+        self, callback, executor=None, key=notification_key, lanes=8
+    ):
+        """
+        Handle the merged notifications of every connection.
+
+        Args:
+            callback (callable): A function to call with each notification. With an
+                executor, a plain function run in the executor.
+            executor (concurrent.futures.Executor, optional): Thread or process pool to
+                run CPU-heavy callbacks in, keeping the order of notifications per `key`.
+            key (callable, optional): Returns the ordering key of a notification.
+            lanes (int, optional): Number of notifications handled concurrently by the executor.
+        """
+        if executor is not None:
+            await dispatch_offloaded(
+                self._notifications,
+                callback,
+                executor,
+                key,
+                lanes,
+                self.options.get("queue_size", 1024),
+            )
+            return
+
+        while True:
+            data = await self._notifications.get()
+            if data is _CLOSED:
+                break
+
+            try:
+                await callback(data)
+            except Exception as e:
+                print(f"Error handling notification: {e}")
+
+    async def _place(self, subscription_id, kind, args, kwargs):
+        client = min(self.clients, key=lambda c: self._counts[c])
+        if self._counts[client] >= self.max_subscriptions_per_connection:
+            raise Exception("Error subscribing: every pool connection is full")
+
+        # Reserve the slot before awaiting, so concurrent subscribes spread out.
+        self._counts[client] += 1
+        self._placing += 1
+        try:
+            if client not in self._pumps:
+                await client.connect()
+                self._start_pump(client)
+            client_subscription_id = await getattr(client, f"{kind}_subscribe")(
+                *args, **kwargs
+            )
+            await self._map(client, client_subscription_id, subscription_id)
+        except Exception:
+            self._counts[client] -= 1
+            raise
+        finally:
+            self._placed()
+
+    async def _map(self, client, client_subscription_id, subscription_id):
+        """
+        Record a placement, first forwarding the notifications that arrived before it.
+
+        Args:
+            client (WS): The connection carrying the subscription.
+            client_subscription_id (int): The subscription ID on that connection.
+            subscription_id (int): The pool subscription ID.
+        """
+        key = (client, client_subscription_id)
+        self._placements[subscription_id] = (client, client_subscription_id)
+        while True:
+            early = self._early.pop(key, None)
+            if not early:
+                break
+            for data in early:
+                await self._notifications.put(self._rewrite(data, subscription_id))
+        self._reverse[key] = subscription_id
+
+    def _placed(self):
+        self._placing -= 1
+        if not self._placing:
+            # Whatever is left belongs to subscriptions that were never placed.
+            self._early.clear()
+
+    @staticmethod
+    def _rewrite(data, subscription_id):
+        if isinstance(data, RawNotification):
+            return data.with_subscription(subscription_id)
+        data["params"]["subscription"] = subscription_id
+        return data
+
+    def _unplace(self, subscription_id):
+        client, client_subscription_id = self._placements.pop(subscription_id)
+        self._reverse.pop((client, client_subscription_id), None)
+        self._counts[client] -= 1
+
+    def _start_pump(self, client):
+        if client not in self._pumps:
+            self._pumps[client] = asyncio.create_task(self._pump(client))
+
+    async def _pump(self, client):
+        async def forward(data):
+            if isinstance(data, RawNotification):
+                key = (client, data.subscription)
+            else:
+                key = (client, data.get("params", {}).get("subscription"))
+            subscription_id = self._reverse.get(key)
+            if subscription_id is None:
+                if self._placing:
+                    # The subscribe call that placed it has not resumed yet.
+                    self._early.setdefault(key, []).append(data)
+                return
+
+            await self._notifications.put(self._rewrite(data, subscription_id))
+
+        # Consumed directly rather than through client.handle_notifications, so only
+        # the client's close sentinel can end the pump.
+        while True:
+            data = await client._notifications.get()
+            if data is _CLOSED:
+                break
+            try:
+                await forward(data)
+            except Exception as e:
+                print(f"Error forwarding notification: {e}")
+
+        if self._closing:
+            return
+        if client._gave_up:
+            await self._rebalance(client)
+        else:
+            # Disconnected on purpose: restarted when the client is used again.
+            self._pumps.pop(client, None)
+
+    async def _rebalance(self, failed):
+        """
+        Replace a connection that gave up reconnecting and move its subscriptions.
+
+        Args:
+            failed (WS): The failed connection.
+        """
+        disconnected_at = time.time()
+        moved = [
+            subscription_id
+            for subscription_id, (client, _) in self._placements.items()
+            if client is failed
+        ]
+        for subscription_id in moved:
+            self._unplace(subscription_id)
+
+        await failed.disconnect()
+        replacement = self._new_client()
+        self.clients[self.clients.index(failed)] = replacement
+        self._counts.pop(failed, None)
+        self._counts[replacement] = 0
+        self._pumps.pop(failed, None)
+
+        for subscription_id in moved:
+            kind, args, kwargs = self._requests[subscription_id]
+            # Signalled first, so the gap precedes notifications from the new connection.
+            await self._gap(subscription_id, disconnected_at)
+            try:
+                await self._place(subscription_id, kind, args, kwargs)
+            except Exception as e:
+                self._requests.pop(subscription_id, None)
+                self.subscriptions.pop(subscription_id, None)
+                await self._gap(subscription_id, disconnected_at, str(e))
+
+    async def _gap(self, subscription_id, disconnected_at, error=None):
+        await self._notifications.put(
+            {
+                "jsonrpc": "2.0",
+                "method": "gapNotification",
+                "params": {
+                    "result": {
+                        "disconnectedAt": disconnected_at,
+                        "reconnectedAt": time.time(),
+                        "error": error,
+                    },
+                    "subscription": subscription_id,
+                },
+            }
+        )
@@ -0,0 +1,287 @@
+import asyncio
+import gzip
+import json
+import struct
+import time
+
+from sdk.ws import WS
+from sdk.ws.wrappers.notification import RawNotification
+
+MAGIC = b"WSREC1\n"
+
+# Record types
+SUBSCRIPTION = 0  # payload: {"method", "params", "result"} of a confirmed subscription
+MESSAGE = 1  # payload: a message as received
+
+# type, receive time (time.time()), payload length
+_HEADER = struct.Struct("<BdI")
+
+
+class StreamRecorder:
+    """
+    Records the messages received by WS clients into a gzip-compressed file of
+    length-prefixed records, each with its receive timestamp.
+
+    Confirmed subscriptions are recorded too (method, params and server ID), so the
+    file can be replayed through the subscription API with ReplayWS.
+
+        with StreamRecorder("stream.rec") as recorder:
+            client.recorder = recorder
+            await client.account_subscribe(pubkey)
+            ...
+    """
+
+    def __init__(self, path, compresslevel=6):
+        """
+        Initialize the StreamRecorder.
+
+        Args:
+            path (str): The file to write.
+            compresslevel (int, optional): gzip compression level, 1 (fastest) to 9.
+        """
+        self.path = path
+        self.records = 0
+        self._file = gzip.open(path, "wb", compresslevel=compresslevel)
+        self._file.write(MAGIC)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def message(self, message):
+        """
+        Record a received message.
+
+        Args:
+            message (str or bytes): The message.
+        """
+        if isinstance(message, str):
+            message = message.encode()
+        self._write(MESSAGE, message)
+
+    def subscription(self, method, params, server_id):
+        """
+        Record a confirmed subscription.
+
+        Args:
+            method (str): The subscribe method name.
+            params (list): The parameters of the subscribe request.
+            server_id (int): The subscription ID assigned by the server.
+        """
+        self._write(
+            SUBSCRIPTION,
+            json.dumps(
+                {"method": method, "params": params, "result": server_id}
+            ).encode(),
+        )
+
+    def close(self):
+        """Flush and close the file."""
+        if not self._file.closed:
+            self._file.close()
+
+    def _write(self, kind, payload):
+        if self._file.closed:
+            return
+        self._file.write(_HEADER.pack(kind, time.time(), len(payload)))
+        self._file.write(payload)
+        self.records += 1
+
+
+def read_records(path):
+    """
+    Read the records of a recording.
+
+    Args:
+        path (str): The recording.
+
+    Yields:
+        tuple: (record type, receive time, payload as str).
+    """
+    with gzip.open(path, "rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"Not a stream recording: {path}")
+
+        while True:
+            header = file.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                return
+            kind, timestamp, length = _HEADER.unpack(header)
+            payload = file.read(length)
+            if len(payload) < length:
+                return
+            yield kind, timestamp, payload.decode()
+
+
+def _subscription_key(method, params):
+    return (method, json.dumps(params, sort_keys=True))
+
+
+class _ReplaySocket:
+    """
+    Stands in for a WebSocket connection: answers subscribe requests from the
+    recording and yields the recorded notifications of active subscriptions.
+    """
+
+    def __init__(self, recorded, messages, speed, buffer_size):
+        self.closed = False
+        self.transport = self
+        self._recorded = recorded  # subscription key -> [recorded server ids]
+        self._messages = messages  # [(receive time, message)]
+        self._speed = speed
+        self._active = {}  # recorded server id -> server id replied to the client
+        self._next_server_id = -1  # for subscriptions missing from the recording
+        self._inbox = asyncio.Queue(buffer_size)
+        self._player = None
+
+    async def send(self, frame):
+        request = json.loads(frame)
+        method = request["method"]
+        params = request.get("params")
+
+        if method.endswith("Unsubscribe"):
+            server_id = params[0]
+            removed = [
+                recorded
+                for recorded, replied in self._active.items()
+                if replied == server_id
+            ]
+            for recorded in removed:
+                del self._active[recorded]
+            result = bool(removed) or server_id < 0
+        else:
+            recorded = self._recorded.get(_subscription_key(method, params))
+            if recorded:
+                result = recorded[0]
+                # Resubscriptions in the recording map to the same subscription.
+                for server_id in recorded:
+                    self._active[server_id] = result
+            else:
+                result = self._next_server_id
+                self._next_server_id -= 1
+
+        await self._inbox.put(
+            json.dumps({"jsonrpc": "2.0", "result": result, "id": request["id"]})
+        )
+
+    async def ping(self):
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(None)
+        return future
+
+    async def close(self):
+        self.abort()
+
+    def abort(self):
+        if not self.closed:
+            self.closed = True
+            if self._player is not None:
+                self._player.cancel()
+            if not self._inbox.full():
+                # Wakes up the reader; a full inbox is drained until `closed` is seen.
+                self._inbox.put_nowait(None)
+
+    def play(self):
+        if self._player is None:
+            self._player = asyncio.create_task(self._play())
+
+    async def _play(self):
+        started = time.monotonic()
+        first = self._messages[0][0] if self._messages else 0.0
+
+        for timestamp, message in self._messages:
+            if self._speed:
+                delay = (timestamp - first) / self._speed - (time.monotonic() - started)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            raw = RawNotification.peek(message)
+            if raw is not None:
+                replied = self._active.get(raw.subscription)
+                if replied is None:
+                    continue
+                message = raw.with_subscription(replied).data
+            else:
+                data = json.loads(message)
+                params = data.get("params")
+                if "id" in data or not isinstance(params, dict):
+                    continue  # replies to the recorded requests
+                replied = self._active.get(params.get("subscription"))
+                if replied is None:
+                    continue
+                params["subscription"] = replied
+                message = json.dumps(data)
+
+            await self._inbox.put(message)
+
+        await self._inbox.put(None)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.closed:
+            raise StopAsyncIteration
+        message = await self._inbox.get()
+        if message is None:
+            self.closed = True
+            raise StopAsyncIteration
+        return message
+
+
+class ReplayWS(WS):
+    """
+    Replays a recording through the regular WS subscription API.
+
+    Subscribe as usual: each subscribe request is matched by method and params against
+    the subscriptions of the recording. Then call `play()` to start delivering their
+    recorded notifications through the normal dispatch path, at the recorded pace
+    (`speed=1.0`), scaled (`speed=10.0` for 10x) or as fast as they are consumed
+    (`speed=None`). The client disconnects at the end of the recording, which ends
+    `handle_notifications` and subscription iterators.
+
+        client = ReplayWS("stream.rec", speed=None)
+        await client.account_subscribe(pubkey)
+        client.play()
+        await client.handle_notifications(handler)
+    """
+
+    def __init__(self, path, speed=1.0, buffer_size=1024, **options):
+        """
+        Initialize the ReplayWS instance.
+
+        Args:
+            path (str): The recording to replay.
+            speed (float, optional): Playback speed relative to the recording, or None
+                for as fast as possible.
+            buffer_size (int, optional): Number of messages read ahead of the client.
+            **options: Extra keyword arguments of WS (queue_size, queue_policy,
+                decode_notifications, ...).
+        """
+        super().__init__(f"replay:{path}", auto_reconnect=False, **options)
+        self.path = path
+        self.speed = speed
+        self.buffer_size = buffer_size
+
+        self._recorded = {}
+        self._messages = []
+        for kind, timestamp, payload in read_records(path):
+            if kind == MESSAGE:
+                self._messages.append((timestamp, payload))
+            elif kind == SUBSCRIPTION:
+                subscription = json.loads(payload)
+                key = _subscription_key(subscription["method"], subscription["params"])
+                self._recorded.setdefault(key, []).append(subscription["result"])
+
+    async def _open(self):
+        return _ReplaySocket(
+            self._recorded, self._messages, self.speed, self.buffer_size
+        )
+
+    def play(self):
+        """Start delivering the recorded notifications of the current subscriptions."""
+        if self.websocket is None:
+            raise ConnectionError("Subscribe before starting the replay")
+        self.websocket.play()
@@ -0,0 +1,372 @@
+import asyncio
+from collections import OrderedDict
+
+from sdk.ws import WS
+from sdk.ws.wrappers.notification import (
+    RawNotification,
+    dispatch_offloaded,
+    notification_key,
+)
+from sdk.ws.wrappers.queues import BLOCK, NotificationQueue
+from sdk.ws.wrappers.subscription import _CLOSED
+
+
+def dedup_key(data):
+    """
+    Returns the key identifying the same update received from different sources.
+
+    Args:
+        data (dict): The notification, with `params.subscription` set to the group ID.
+
+    Returns:
+        tuple or None: The key, or None if the notification cannot be deduplicated.
+    """
+    method = data.get("method")
+    params = data.get("params", {})
+    group = params.get("subscription")
+    result = params.get("result")
+    if not isinstance(result, dict):
+        return (method, group, result)
+
+    if method == "accountNotification":
+        return (method, group, result.get("context", {}).get("slot"))
+    if method == "programNotification":
+        return (
+            method,
+            group,
+            result.get("value", {}).get("pubkey"),
+            result.get("context", {}).get("slot"),
+        )
+    if method == "logsNotification":
+        return (method, group, result.get("value", {}).get("signature"))
+    if method == "signatureNotification":
+        return (method, group, result.get("value") == "receivedSignature")
+    if method == "slotNotification":
+        return (method, group, result.get("slot"))
+    return None
+
+
+class RedundantWS:
+    """
+    Opens the same subscriptions on several connections and delivers whichever
+    notification arrives first.
+
+    Every subscription is created on every source. Notifications are deduplicated by
+    (pubkey, slot), signature or slot, depending on the subscription type, so each update
+    is delivered exactly once. Delivered notifications carry the index of the winning
+    source under "source", and `stats()` reports how often each source won.
+    """
+
+    def __init__(self, urls, api_key=None, dedup_window=65536, **options):
+        """
+        Initialize the RedundantWS instance.
+
+        Args:
+            urls (list): WebSocket URLs of the sources. Repeat a URL to open several
+                connections to the same endpoint.
+            api_key (str, optional): The  API key.
+            dedup_window (int, optional): Number of recent update keys remembered for deduplication.
+            **options: Extra keyword arguments passed to every WS connection.
+        """
+        self.sources = [WS(url, api_key, **options) for url in urls]
+        self.dedup_window = dedup_window
+        self.wins = [0] * len(self.sources)
+        self.duplicates = 0
+        self.subscriptions = {}  # group id -> kind
+
+        # group id -> (kind, {source index: source subscription id})
+        self._groups = {}
+        # (source index, source subscription id) -> group id
+        self._reverse = {}
+        self._seen = OrderedDict()
+        # (source index, source subscription id) -> notifications received before the
+        # subscribe reply was mapped
+        self._early = {}
+        self._placing = 0
+        self._next_subscription_id = 1
+        self._notifications = NotificationQueue(
+            options.get("queue_size", 1024), options.get("queue_policy", BLOCK)
+        )
+        self._queue_size = options.get("queue_size", 1024)
+        self._pumps = []
+        self._closed = False
+
+    async def connect(self):
+        """Connect every source and start racing their notifications."""
+        if self._closed:
+            # Consumers of the closed stream own the old queue and its close sentinel.
+            self._notifications = NotificationQueue(
+                self._queue_size, self._notifications.policy
+            )
+            self._closed = False
+
+        await asyncio.gather(*(source.connect() for source in self.sources))
+        # A pump ends with its source's connection; restart it once reconnected.
+        pumps = self._pumps or [None] * len(self.sources)
+        self._pumps = [
+            (
+                pump
+                if pump is not None and not pump.done()
+                else asyncio.create_task(self._pump(index, source))
+            )
+            for index, (source, pump) in enumerate(zip(self.sources, pumps))
+        ]
+
+    async def disconnect(self):
+        """Disconnect every source."""
+        await asyncio.gather(*(source.disconnect() for source in self.sources))
+        await asyncio.gather(*self._pumps, return_exceptions=True)
+        self._pumps = []
+        self._groups.clear()
+        self._reverse.clear()
+        self._early.clear()
+        self._seen.clear()
+        self.subscriptions.clear()
+        self._closed = True
+        self._notifications.put_nowait(_CLOSED)
+
+    async def subscribe(self, kind, *args, **kwargs):
+        """
+        Subscribe on every source.
+
+        Args:
+            kind (str): The subscription type, matching a WS `<kind>_subscribe` method
+                (account, program, logs, signature, slot, ...).
+            *args: Positional arguments of the subscribe method.
+            **kwargs: Keyword arguments of the subscribe method.
+
+        Returns:
+            int: The subscription ID shared by all sources.
+        """
+        await self.connect()
+
+        group = self._next_subscription_id
+        self._next_subscription_id += 1
+
+        # Each source is mapped as soon as its own reply arrives, so the fastest
+        # sources deliver while slower ones are still subscribing.
+        members = {}
+        self._groups[group] = (kind, members)
+        self.subscriptions[group] = kind
+
+        async def place(index, source):
+            result = await getattr(source, f"{kind}_subscribe")(*args, **kwargs)
+            members[index] = result
+            await self._map(index, result, group)
+            return result
+
+        self._placing += 1
+        try:
+            results = await asyncio.gather(
+                *(place(index, source) for index, source in enumerate(self.sources)),
+                return_exceptions=True,
+            )
+        finally:
+            self._placed()
+
+        if not members:
+            self._groups.pop(group, None)
+            self.subscriptions.pop(group, None)
+            raise Exception(
+                f"Error subscribing to {kind} on every source: {results[0]}"
+            )
+
+        return group
+
+    async def _map(self, index, source_subscription_id, group):
+        """
+        Record a source subscription, first delivering the notifications that arrived
+        before it.
+
+        Args:
+            index (int): The source index.
+            source_subscription_id (int): The subscription ID on that source.
+            group (int): The shared subscription ID.
+        """
+        key = (index, source_subscription_id)
+        while True:
+            early = self._early.pop(key, None)
+            if not early:
+                break
+            for data in early:
+                await self._deliver(index, data, group)
+        self._reverse[key] = group
+
+    def _placed(self):
+        self._placing -= 1
+        if not self._placing:
+            # Whatever is left belongs to subscriptions that were never mapped.
+            self._early.clear()
+
+    async def unsubscribe(self, subscription_id):
+        """
+        Cancel a subscription on every source.
+
+        Args:
+            subscription_id (int): The shared subscription ID.
+
+        Returns:
+            bool: True if unsubscribe was successful, False otherwise.
+        """
+        group = self._groups.pop(subscription_id, None)
+        if group is None:
+            return False
+
+        kind, members = group
+        self.subscriptions.pop(subscription_id, None)
+        for index, source_subscription_id in members.items():
+            self._reverse.pop((index, source_subscription_id), None)
+
+        results = await asyncio.gather(
+            *(
+                getattr(self.sources[index], f"{kind}_unsubscribe")(
+                    source_subscription_id
+                )
+                for index, source_subscription_id in members.items()
+            ),
+            return_exceptions=True,
+        )
+        return any(result is True for result in results)
+
+    async def account_subscribe(self, pubkey, config=None):
+        """
+        Subscribe to an account on every source.
+
+        Args:
+            pubkey (str): The account public key as a base-58 encoded string.
+            config (dict, optional): Configuration options.
+
+        Returns:
+            int: The shared subscription ID.
+        """
+        return await self.subscribe("account", pubkey, config)
+
+    async def program_subscribe(self, program_id, config=None):
+        """
+        Subscribe to a program on every source.
+
+        Args:
+            program_id (str): The program ID as a base-58 encoded string.
+            config (dict, optional): Configuration options.
+
+        Returns:
+            int: The shared subscription ID.
+        """
+        return await self.subscribe("program", program_id, config)
+
+    async def signature_subscribe(self, signature, config=None):
+        """
+        Subscribe to a transaction signature on every source.
+
+        Args:
+            signature (str): The transaction signature as a base-58 encoded string.
+            config (dict, optional): Configuration options.
+
+        Returns:
+            int: The shared subscription ID.
+        """
+        return await self.subscribe("signature", signature, config)
+
+    async def slot_subscribe(self):
+        """
+        Subscribe to slot notifications on every source.
+
+        Returns:
+            int: The shared subscription ID.
+        """
+        return await self.subscribe("slot")
+
+    def stats(self):
+        """
+        Returns how often each source delivered an update first.
+
+        Returns:
+            dict: Wins per source URL and the number of suppressed duplicates.
+        """
+        return {
+            "wins": {
+                f"{index}:{source.url}": wins
+                for index, (source, wins) in enumerate(zip(self.sources, self.wins))
+            },
+            "duplicates": self.duplicates,
+        }
+
+    async def handle_notifications(
+        self, callback, executor=None, key=notification_key, lanes=8
+    ):
+        """
+        Handle the deduplicated notifications of every source.
+
+        Args:
+            callback (callable): A function to call with each notification. With an
+                executor, a plain function run in the executor.
+            executor (concurrent.futures.Executor, optional): Thread or process pool to
+                run CPU-heavy callbacks in, keeping the order of notifications per `key`.
+            key (callable, optional): Returns the ordering key of a notification.
+            lanes (int, optional): Number of notifications handled concurrently by the executor.
+        """
+        if executor is not None:
+            await dispatch_offloaded(
+                self._notifications, callback, executor, key, lanes, self._queue_size
+            )
+            return
+
+        while True:
+            data = await self._notifications.get()
+            if data is _CLOSED:
+                break
+
+            try:
+                await callback(data)
+            except Exception as e:
+                print(f"Error handling notification: {e}")
+
+    async def _deliver(self, index, data, group):
+        """
+        Deliver a source's notification unless another source delivered it first.
+
+        Args:
+            index (int): The source index.
+            data (dict): The decoded notification.
+            group (int): The shared subscription ID.
+        """
+        data["params"]["subscription"] = group
+
+        if data.get("method") == "gapNotification":
+            # Only a gap if no other source kept delivering in the meantime.
+            if any(
+                other.websocket is not None and not other.websocket.closed
+                for position, other in enumerate(self.sources)
+                if position != index
+            ):
+                return
+        else:
+            update = dedup_key(data)
+            if update is not None:
+                if update in self._seen:
+                    self.duplicates += 1
+                    return
+                self._seen[update] = None
+                if len(self._seen) > self.dedup_window:
+                    self._seen.popitem(last=False)
+            self.wins[index] += 1
+
+        data["source"] = index
+        await self._notifications.put(data)
+
+    async def _pump(self, index, source):
+        async def forward(data):
+            if isinstance(data, RawNotification):
+                # Deduplication needs the slot or signature of the update.
+                data = data.decode()
+            key = (index, data.get("params", {}).get("subscription"))
+            group = self._reverse.get(key)
+            if group is None:
+                if self._placing:
+                    # The subscribe reply has not been mapped yet.
+                    self._early.setdefault(key, []).append(data)
+                return
+
+            await self._deliver(index, data, group)
+
+        await source.handle_notifications(forward)
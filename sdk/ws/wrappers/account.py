@@ -6,7 +6,7 @@ class AccountSubscriptionWS(BaseWS):
     Handles account-related subscriptions.
     """
 
-    async def account_subscribe(self, pubkey, config=None):
+    async def account_subscribe(self, pubkey, config=None, handle=False):
         """
         Subscribe to an account to receive notifications when the lamports or data changes.
 
@@ -15,38 +15,32 @@ class AccountSubscriptionWS(BaseWS):
             config (dict, optional): Configuration options.
                 - commitment (str, optional): Commitment level.
                 - encoding (str, optional): Data encoding format (base58, base64, base64+zstd, jsonParsed).
+            handle (bool, optional): Return a Subscription handle, an async iterator over the
+                notifications of this subscription only, instead of the subscription ID.
 
         Returns:
-            int: The subscription ID.
+            int or Subscription: The subscription ID, or a Subscription handle if `handle` is set.
         """
         params = [pubkey]
         if config:
             params.append(config)
 
-        response = await self._send_request("accountSubscribe", params)
-        if "result" in response:
-            subscription_id = response["result"]
-            self.subscriptions[subscription_id] = "account"
-            return subscription_id
-        else:
-            raise Exception(f"Error subscribing to account: {response.get('error')}")
+        return await self._subscribe(
+            "account",
+            "accountSubscribe",
+            params,
+            "accountUnsubscribe",
+            handle,
+        )
 
     async def account_unsubscribe(self, subscription_id):
         """
         Unsubscribe from account change notifications.
 
         Args:
-            subscription_id (int): The subscription ID to cancel.
+            subscription_id (int or Subscription): The subscription ID or handle to cancel.
 
         Returns:
             bool: True if unsubscribe was successful, False otherwise.
         """
-        response = await self._send_request("accountUnsubscribe", [subscription_id])
-        if "result" in response:
-            if response["result"]:
-                self.subscriptions.pop(subscription_id, None)
-            return response["result"]
-        else:
-            raise Exception(
-                f"Error unsubscribing from account: {response.get('error')}"
-            )
+        return await self._unsubscribe("account", "accountUnsubscribe", subscription_id)
@@ -1,6 +1,28 @@
 import json
+import time
+import random
 import asyncio
 import websockets
+from collections import deque
+
+from sdk.tracing import MessageTrace, RequestTrace, run_hooks
+
+from .notification import RawNotification, dispatch_offloaded, notification_key
+from .queues import BLOCK, NotificationQueue
+from .subscription import _CLOSED, Subscription
+
+# Subscriptions notified on (almost) every slot, which make a silent connection suspect.
+CADENCE_KINDS = ("slot", "root", "slots_updates", "block", "vote")
+
+# Subscription types taking a target (pubkey, program ID, filter, signature), which can
+# be created in bulk: kind -> (subscribe method, unsubscribe method).
+BULK_METHODS = {
+    "account": ("accountSubscribe", "accountUnsubscribe"),
+    "program": ("programSubscribe", "programUnsubscribe"),
+    "logs": ("logsSubscribe", "logsUnsubscribe"),
+    "signature": ("signatureSubscribe", "signatureUnsubscribe"),
+    "block": ("blockSubscribe", "blockUnsubscribe"),
+}
 
 
 class BaseWS:
@@ -9,15 +31,72 @@ class BaseWS:
 
     Provides core functionality for WebSocket connection management
     and request handling.
+
+    A single reader task owns `websocket.recv()`: replies are routed to the future of
+    the request with the matching `id`, and notifications are queued for
+    `handle_notifications`, so requests can be issued concurrently on a busy connection.
+    Notification queues are bounded; `queue_policy` decides whether a full queue makes
+    the reader wait or drops/coalesces notifications instead.
+
+    Every subscription records how it was created. When the connection drops, the client
+    reconnects with exponential backoff and resubscribes everything. Subscription IDs
+    handed out by the client stay stable across reconnects (notifications are rewritten
+    to carry them), and each subscription receives a `gapNotification` before its first
+    notification on the new connection:
+
+        {"jsonrpc": "2.0", "method": "gapNotification",
+         "params": {"result": {"disconnectedAt": float, "reconnectedAt": float, "error": None},
+                    "subscription": int}}
+
+    With `decode_notifications=False`, the reader only locates the method and
+    subscription ID of each notification in the raw text and queues a RawNotification;
+    decoding is left to the consumer, typically a worker pool passed to
+    `handle_notifications(..., executor=...)`.
+
+    `start_ping` runs a heartbeat that measures ping round-trip times and replaces the
+    connection (reconnecting and resubscribing) when a pong does not arrive within
+    `ping_timeout`, or when a slot-paced subscription has been silent for `stale_timeout`.
+
+    Tracing hooks (see sdk.tracing) can be appended to `before_request_hooks` and
+    `after_response_hooks` (RequestTrace per request) and to `receive_hooks` and
+    `dispatch_hooks` (MessageTrace per received message).
     """
 
-    def __init__(self, url, api_key=None):
+    def __init__(
+        self,
+        url,
+        api_key=None,
+        queue_size=1024,
+        queue_policy=BLOCK,
+        auto_reconnect=True,
+        reconnect_delay=0.5,
+        max_reconnect_delay=30.0,
+        max_reconnect_attempts=None,
+        decode_notifications=True,
+        ping_timeout=10.0,
+        stale_timeout=10.0,
+    ):
         """
         Initialize the BaseWS instance.
 
         Args:
             url (str): The WebSocket URL (wss://mainnet.-rpc.com or wss://devnet.-rpc.com)
             api_key (str, optional): The  API key.
+            queue_size (int, optional): Size of the shared notification queue and of the queue
+                of each subscription handle.
+            queue_policy (str, optional): What to do when a notification queue is full:
+                block, drop_oldest, drop_newest or coalesce (see NotificationQueue).
+            auto_reconnect (bool, optional): Reconnect and resubscribe when the connection drops.
+            reconnect_delay (float, optional): Initial delay in seconds between reconnect attempts.
+            max_reconnect_delay (float, optional): Upper bound of the exponential reconnect backoff.
+            max_reconnect_attempts (int, optional): Give up after this many failed attempts in a row.
+            decode_notifications (bool, optional): Decode notifications in the reader. When
+                off, notifications are queued as undecoded RawNotification objects.
+            ping_timeout (float, optional): Seconds to wait for a pong before the connection
+                is considered dead.
+            stale_timeout (float, optional): Seconds without any message, while slot-paced
+                subscriptions (slot, root, ...) are active, before the connection is
+                considered stale (~25 slots by default).
         """
         if api_key:
             self.url = f"{url}/?api-key={api_key}"
@@ -26,75 +105,876 @@ class BaseWS:
         self.websocket = None
         self.request_id = 1
         self.subscriptions = {}  # To keep track of subscriptions
+        self.queue_size = queue_size
+        self.queue_policy = queue_policy
+        self.auto_reconnect = auto_reconnect
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.max_reconnect_attempts = max_reconnect_attempts
+        self.decode_notifications = decode_notifications
+        self.reconnects = 0
+        self.ping_timeout = ping_timeout
+        self.stale_timeout = stale_timeout
+        self.stale_replacements = 0
+        self.last_message_at = None
+        self._rtts = deque(maxlen=64)
+        self._pings = 0
+        self._ping_timeouts = 0
+        self._handles = {}  # client subscription id -> Subscription
+        self._routes = {}  # server subscription id -> Subscription
+        # request id -> (future awaiting the reply, Subscription, connection sent on)
+        self._pending = {}
+        self._next_subscription_id = 1
+        self._notifications = NotificationQueue(queue_size, queue_policy)
+        self._reader = None
+        self._reconnect_task = None
+        self._closing = False
+        # Set once the close sentinel is queued, until the next connection.
+        self._closed = False
+        # Set when the connection was lost for good (not closed by `disconnect`).
+        self._gave_up = False
+        self._connect_lock = asyncio.Lock()
+        # A StreamRecorder (sdk.ws.recording) capturing received messages.
+        self.recorder = None
+        self.before_request_hooks = []
+        self.after_response_hooks = []
+        self.receive_hooks = []
+        self.dispatch_hooks = []
 
     async def connect(self):
         """Connect to the WebSocket."""
-        if self.websocket is None or self.websocket.closed:
-            self.websocket = await websockets.connect(self.url)
+        async with self._connect_lock:
+            if self.websocket is None or self.websocket.closed:
+                self._closing = False
+                if self._closed:
+                    # Consumers of the closed connection own the old queue and its
+                    # close sentinel.
+                    self._notifications = NotificationQueue(
+                        self.queue_size, self.queue_policy
+                    )
+                    self._closed = False
+                    self._gave_up = False
+                self.websocket = await self._open()
+                self.last_message_at = time.monotonic()
+                self._reader = asyncio.create_task(self._read_loop(self.websocket))
+
+    async def _open(self):
+        """
+        Open a new connection.
+
+        Returns:
+            The connection.
+        """
+        return await websockets.connect(self.url)
 
     async def disconnect(self):
         """Disconnect from the WebSocket."""
+        self._closing = True
+
+        if self._reconnect_task and not self._reconnect_task.done():
+            self._reconnect_task.cancel()
+            await asyncio.gather(self._reconnect_task, return_exceptions=True)
+        self._reconnect_task = None
+
         if self.websocket and not self.websocket.closed:
             await self.websocket.close()
             self.websocket = None
 
-    async def _send_request(self, method, params=None):
+        if self._reader:
+            await asyncio.gather(self._reader, return_exceptions=True)
+            self._reader = None
+
+        self._close_subscriptions()
+
+    async def _send_request(self, method, params=None, subscription=None):
         """
         Send a request to the WebSocket.
 
         Args:
             method (str): The method name.
             params (list, optional): The parameters for the method.
+            subscription (Subscription, optional): Subscription to register as soon as
+                the reply arrives, before any of its notifications are routed.
 
         Returns:
             dict: The response from the server.
         """
+        started = time.perf_counter()
         await self.connect()
+        connected = time.perf_counter()
+
+        request_id = self.request_id
+        self.request_id += 1
 
         request = {
             "jsonrpc": "2.0",
-            "id": self.request_id,
+            "id": request_id,
             "method": method,
         }
 
         if params is not None:
             request["params"] = params
 
-        await self.websocket.send(json.dumps(request))
-        self.request_id += 1
+        frame = json.dumps(request)
+        trace = None
+        if self.before_request_hooks or self.after_response_hooks:
+            trace = self._start_trace(method, frame, connected - started, connected)
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = (future, subscription, self.websocket)
+        if trace is not None:
+            future.add_done_callback(self._trace_callback(trace))
+        try:
+            await self.websocket.send(frame)
+            return await future
+        finally:
+            self._pending.pop(request_id, None)
+            if trace is not None and not future.done():
+                # Failed or cancelled before the reply arrived.
+                future.cancel()
+
+    async def _send_requests(self, requests):
+        """
+        Pipeline several requests: write them all, then await the replies concurrently.
+
+        Args:
+            requests (list): (method, params, subscription) tuples, as for `_send_request`.
+
+        Returns:
+            list: The response of each request, or the exception it failed with.
+        """
+        started = time.perf_counter()
+        await self.connect()
+        connect = time.perf_counter() - started
+        traced = self.before_request_hooks or self.after_response_hooks
+
+        loop = asyncio.get_running_loop()
+        websocket = self.websocket
+        pending = []
+        frames = []
+        for method, params, subscription in requests:
+            request_id = self.request_id
+            self.request_id += 1
+
+            request = {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "method": method,
+            }
+
+            if params is not None:
+                request["params"] = params
+
+            encoding = time.perf_counter()
+            frame = json.dumps(request)
+            future = loop.create_future()
+            self._pending[request_id] = (future, subscription, websocket)
+            pending.append((request_id, future))
+            frames.append(frame)
+            if traced:
+                trace = self._start_trace(method, frame, connect, encoding)
+                future.add_done_callback(self._trace_callback(trace))
+                connect = 0.0
+
+        try:
+            for index, frame in enumerate(frames):
+                try:
+                    await websocket.send(frame)
+                except Exception as e:
+                    # Requests already sent are failed by the reader when it notices.
+                    for _, future in pending[index:]:
+                        if not future.done():
+                            future.set_exception(e)
+                    break
+
+            return await asyncio.gather(
+                *(future for _, future in pending), return_exceptions=True
+            )
+        finally:
+            for request_id, future in pending:
+                self._pending.pop(request_id, None)
+                if traced and not future.done():
+                    future.cancel()
+
+    def _start_trace(self, method, frame, connect, encoding):
+        """
+        Create the trace of a request and run the before-request hooks.
+
+        Args:
+            method (str): The method name.
+            frame (str): The encoded request.
+            connect (float): Seconds spent connecting before the request.
+            encoding (float): `time.perf_counter()` when encoding started.
+
+        Returns:
+            RequestTrace: The trace.
+        """
+        now = time.perf_counter()
+        trace = RequestTrace(method, self.url, len(frame))
+        trace.connect = connect
+        trace.encode = now - encoding
+        run_hooks(self.before_request_hooks, trace)
+        # Hook time is left out of the timings.
+        trace.context["_sent"] = time.perf_counter()
+        return trace
+
+    def _trace_callback(self, trace):
+        """
+        Returns a future callback completing a trace with the reply (or failure) and
+        running the after-response hooks.
+
+        Args:
+            trace (RequestTrace): The trace of the request.
+
+        Returns:
+            callable: The callback.
+        """
+
+        def finish(future):
+            sent = trace.context.pop("_sent")
+            trace.ttfb = time.perf_counter() - sent
+            trace.total = trace.connect + trace.encode + trace.ttfb
+            if future.cancelled():
+                trace.error = asyncio.CancelledError()
+            elif future.exception() is not None:
+                trace.error = future.exception()
+            else:
+                response = future.result()
+                if "error" in response:
+                    trace.error = response["error"]
+            run_hooks(self.after_response_hooks, trace)
+
+        return finish
+
+    async def _read_loop(self, websocket):
+        """
+        Read every message from the connection and route it.
+
+        Args:
+            websocket: The connection to read from.
+        """
+        try:
+            async for message in websocket:
+                self.last_message_at = time.monotonic()
+                if self.recorder is not None:
+                    self.recorder.message(message)
+                if self.receive_hooks or self.dispatch_hooks:
+                    await self._dispatch_traced(message)
+                    continue
+                try:
+                    if not self.decode_notifications and isinstance(message, str):
+                        raw = RawNotification.peek(message)
+                        if raw is not None:
+                            await self._dispatch_raw(raw)
+                            continue
+                    await self._dispatch(json.loads(message))
+                except Exception as e:
+                    print(f"Error dispatching message: {e}")
+        except websockets.ConnectionClosed:
+            pass
+        except Exception as e:
+            print(f"Error reading from websocket: {e}")
+        finally:
+            self._connection_lost(websocket)
+
+    async def _dispatch_traced(self, message):
+        """
+        Route a message like `_read_loop` does, running the receive and dispatch hooks.
+
+        Args:
+            message (str or bytes): The raw message.
+        """
+        trace = MessageTrace(self.url, len(message))
+        run_hooks(self.receive_hooks, trace)
+        started = time.perf_counter()
+        try:
+            data = raw = None
+            if not self.decode_notifications and isinstance(message, str):
+                raw = RawNotification.peek(message)
+            if raw is not None:
+                trace.method = raw.method
+                server_id = raw.subscription
+            else:
+                data = json.loads(message)
+                trace.method = data.get("method")
+                server_id = data.get("params", {}).get("subscription")
+            decoded = time.perf_counter()
+            trace.decode = decoded - started
+
+            if trace.method is not None:
+                subscription = self._routes.get(server_id)
+                trace.subscription = (
+                    subscription.id if subscription is not None else server_id
+                )
+
+            if raw is not None:
+                await self._dispatch_raw(raw)
+            else:
+                await self._dispatch(data)
+            trace.dispatch = time.perf_counter() - decoded
+        except Exception as e:
+            print(f"Error dispatching message: {e}")
+        finally:
+            run_hooks(self.dispatch_hooks, trace)
+
+    async def _dispatch(self, data):
+        """
+        Route a decoded message to the request awaiting it or to its subscription.
+
+        Args:
+            data (dict): The decoded message.
+        """
+        if "id" in data:
+            future, subscription, _ = self._pending.get(data["id"], (None, None, None))
+            if future is None or future.done():
+                return
+            if subscription is not None and "result" in data:
+                self._register(subscription, data["result"])
+            future.set_result(data)
+        elif "method" in data and data["method"].endswith("Notification"):
+            params = data.get("params", {})
+            subscription = self._routes.get(params.get("subscription"))
+            if subscription is None:
+                await self._notifications.put(data)
+                return
+
+            params["subscription"] = subscription.id
+            await self._deliver(subscription, data)
+            if (
+                data["method"] == "signatureNotification"
+                and params.get("result", {}).get("value") != "receivedSignature"
+            ):
+                # The server cancels signature subscriptions once they fire.
+                self._forget(subscription)
+
+    async def _dispatch_raw(self, raw):
+        """
+        Route an undecoded notification to its subscription.
+
+        Args:
+            raw (RawNotification): The notification.
+        """
+        subscription = self._routes.get(raw.subscription)
+        if subscription is None:
+            await self._notifications.put(raw)
+            return
+
+        await self._deliver(subscription, raw.with_subscription(subscription.id))
+        if (
+            raw.method == "signatureNotification"
+            and '"receivedSignature"' not in raw.data
+        ):
+            # The server cancels signature subscriptions once they fire.
+            self._forget(subscription)
+
+    async def _deliver(self, subscription, data):
+        """
+        Queue a notification for the handle or for `handle_notifications`.
+
+        Args:
+            subscription (Subscription): The subscription the notification belongs to.
+            data (dict or RawNotification): The notification.
+        """
+        if subscription.gap is not None:
+            gap, subscription.gap = subscription.gap, None
+            await self._deliver(subscription, gap)
+
+        if subscription.queue is None:
+            await self._notifications.put(data)
+        elif not subscription.closed:
+            await subscription.queue.put(data)
+
+    async def _subscribe(self, kind, method, params, unsubscribe_method, handle=False):
+        """
+        Send a subscribe request and track the resulting subscription.
+
+        Args:
+            kind (str): The subscription type (account, program, logs, ...).
+            method (str): The subscribe method name.
+            params (list, optional): The parameters for the method.
+            unsubscribe_method (str): The matching unsubscribe method name.
+            handle (bool, optional): Return a Subscription handle instead of the ID.
+
+        Returns:
+            int or Subscription: The subscription ID, or a Subscription handle if `handle` is set.
+        """
+        subscription = Subscription(
+            self,
+            kind,
+            method,
+            params,
+            unsubscribe_method,
+            NotificationQueue(self.queue_size, self.queue_policy) if handle else None,
+        )
+
+        response = await self._send_request(method, params, subscription)
+        if "result" in response:
+            return subscription if handle else subscription.id
+        else:
+            raise Exception(
+                f"Error subscribing to {kind.replace('_', ' ')}: {response.get('error')}"
+            )
+
+    async def subscribe_many(self, kind, targets, config=None, handle=False):
+        """
+        Subscribe to many targets at once.
+
+        All subscribe requests are written back to back and their confirmations are
+        collected concurrently, instead of one round trip per subscription.
+
+        Args:
+            kind (str): The subscription type: account, program, logs, signature or block.
+            targets (list): Account pubkeys, program IDs, log filters, signatures or block
+                filters, one per subscription.
+            config (dict, optional): Configuration options shared by every subscription.
+            handle (bool, optional): Return Subscription handles instead of IDs.
+
+        Returns:
+            list: For each target, the subscription ID (or handle), or the exception the
+                subscription failed with.
+        """
+        if kind not in BULK_METHODS:
+            raise ValueError(f"Cannot subscribe to {kind} in bulk")
+        method, unsubscribe_method = BULK_METHODS[kind]
+
+        subscriptions = []
+        for target in targets:
+            params = [target]
+            if config:
+                params.append(config)
+            subscriptions.append(
+                Subscription(
+                    self,
+                    kind,
+                    method,
+                    params,
+                    unsubscribe_method,
+                    (
+                        NotificationQueue(self.queue_size, self.queue_policy)
+                        if handle
+                        else None
+                    ),
+                )
+            )
+
+        responses = await self._send_requests(
+            [
+                (subscription.method, subscription.params, subscription)
+                for subscription in subscriptions
+            ]
+        )
+
+        results = []
+        for subscription, response in zip(subscriptions, responses):
+            if isinstance(response, Exception):
+                results.append(response)
+            elif "result" in response:
+                results.append(subscription if handle else subscription.id)
+            else:
+                results.append(
+                    Exception(f"Error subscribing to {kind}: {response.get('error')}")
+                )
+        return results
+
+    async def unsubscribe_many(self, subscription_ids):
+        """
+        Cancel many subscriptions at once, pipelining the unsubscribe requests.
+
+        Args:
+            subscription_ids (list): Subscription IDs or handles, of any type.
+
+        Returns:
+            list: For each subscription, True if unsubscribe was successful, False
+                otherwise, or the exception it failed with.
+        """
+        results = [False] * len(subscription_ids)
+        sent = []
+        for index, subscription_id in enumerate(subscription_ids):
+            if isinstance(subscription_id, Subscription):
+                subscription_id = subscription_id.id
+
+            subscription = self._handles.get(subscription_id)
+            if subscription is None:
+                continue
+
+            subscription._close(discard=True)
+            if subscription.server_id is None:
+                self._forget(subscription)
+                results[index] = True
+            else:
+                sent.append((index, subscription))
+
+        if not sent:
+            return results
+
+        responses = await self._send_requests(
+            [
+                (subscription.unsubscribe_method, [subscription.server_id], None)
+                for _, subscription in sent
+            ]
+        )
+
+        for (index, subscription), response in zip(sent, responses):
+            if isinstance(response, (ConnectionError, websockets.ConnectionClosed)):
+                self._forget(subscription)
+                results[index] = True
+            elif isinstance(response, Exception):
+                results[index] = response
+            elif "result" in response:
+                if response["result"]:
+                    self._forget(subscription)
+                results[index] = response["result"]
+            else:
+                results[index] = Exception(
+                    f"Error unsubscribing from {subscription.kind.replace('_', ' ')}: "
+                    f"{response.get('error')}"
+                )
+        return results
+
+    async def _unsubscribe(self, kind, method, subscription_id):
+        """
+        Send an unsubscribe request and stop tracking the subscription.
+
+        Args:
+            kind (str): The subscription type (account, program, logs, ...).
+            method (str): The unsubscribe method name.
+            subscription_id (int or Subscription): The subscription ID or handle to cancel.
+
+        Returns:
+            bool: True if unsubscribe was successful, False otherwise.
+        """
+        if isinstance(subscription_id, Subscription):
+            subscription_id = subscription_id.id
+
+        subscription = self._handles.get(subscription_id)
+        if subscription is None:
+            return False
+
+        # The consumer is done with the handle: stop queueing its notifications so a
+        # full queue cannot keep the reader from receiving the unsubscribe reply.
+        subscription._close(discard=True)
 
-        response = await self.websocket.recv()
-        return json.loads(response)
+        if subscription.server_id is None:
+            # Not resubscribed since the last disconnect, nothing to cancel on the server.
+            self._forget(subscription)
+            return True
+
+        try:
+            response = await self._send_request(method, [subscription.server_id])
+        except (ConnectionError, websockets.ConnectionClosed):
+            # The server drops the subscriptions of a closed connection.
+            self._forget(subscription)
+            return True
+
+        if "result" in response:
+            if response["result"]:
+                self._forget(subscription)
+            return response["result"]
+        else:
+            raise Exception(
+                f"Error unsubscribing from {kind.replace('_', ' ')}: {response.get('error')}"
+            )
+
+    def _register(self, subscription, server_id):
+        """
+        Start routing the notifications of a confirmed subscription.
+
+        Args:
+            subscription (Subscription): The subscription.
+            server_id (int): The subscription ID assigned by the server.
+        """
+        if subscription.id is None:
+            subscription.id = self._next_subscription_id
+            self._next_subscription_id += 1
+            self._handles[subscription.id] = subscription
+            self.subscriptions[subscription.id] = subscription.kind
+
+        subscription.server_id = server_id
+        self._routes[server_id] = subscription
+        if self.recorder is not None:
+            self.recorder.subscription(
+                subscription.method, subscription.params, server_id
+            )
+
+    def _forget(self, subscription):
+        """
+        Stop tracking a subscription.
+
+        Args:
+            subscription (Subscription): The subscription.
+        """
+        self._handles.pop(subscription.id, None)
+        self._routes.pop(subscription.server_id, None)
+        self.subscriptions.pop(subscription.id, None)
+        subscription._close()
+
+    def _connection_lost(self, websocket):
+        """
+        Fail the requests still awaiting a reply and start reconnecting.
+
+        Args:
+            websocket: The connection that was lost.
+        """
+        for request_id, (future, _, sent_on) in list(self._pending.items()):
+            if sent_on is websocket:
+                del self._pending[request_id]
+                if not future.done():
+                    future.set_exception(ConnectionError("WebSocket connection closed"))
+
+        if self.websocket is not None and websocket is not self.websocket:
+            # A new connection is already up: its state is not ours to reset.
+            return
+
+        self._routes.clear()
+        for subscription in self._handles.values():
+            subscription.server_id = None
+
+        if self._closing or not self.auto_reconnect:
+            self._gave_up = not self._closing
+            self._close_subscriptions()
+        elif self._reconnect_task is None or self._reconnect_task.done():
+            self._reconnect_task = asyncio.create_task(self._reconnect(time.time()))
+
+    def _close_subscriptions(self):
+        """Close every subscription and wake up notification consumers."""
+        for subscription in self._handles.values():
+            subscription._close()
+        self._handles.clear()
+        self._routes.clear()
+        self.subscriptions.clear()
+        if not self._closed:
+            # Once per close, whether the reader or `disconnect` gets here first.
+            self._closed = True
+            self._notifications.put_nowait(_CLOSED)
+
+    async def _reconnect(self, disconnected_at):
+        """
+        Reconnect with exponential backoff and replay every subscription.
+
+        Args:
+            disconnected_at (float): Time at which the connection was lost.
+        """
+        delay = self.reconnect_delay
+        attempts = 0
+
+        while not self._closing:
+            try:
+                await self.connect()
+                await self._resubscribe(disconnected_at)
+                if self.websocket is not None and not self.websocket.closed:
+                    self.reconnects += 1
+                    return
+            except Exception as e:
+                attempts += 1
+                if (
+                    self.max_reconnect_attempts is not None
+                    and attempts >= self.max_reconnect_attempts
+                ):
+                    print(f"Giving up reconnecting to websocket: {e}")
+                    self._gave_up = True
+                    self._close_subscriptions()
+                    return
+                print(f"Error reconnecting to websocket: {e}")
+
+            await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    async def _resubscribe(self, disconnected_at):
+        """
+        Recreate every tracked subscription on the current connection.
+
+        Args:
+            disconnected_at (float): Time at which the connection was lost.
+        """
+        for subscription in list(self._handles.values()):
+            if subscription.closed:
+                # Unsubscribed while the connection was down.
+                self._forget(subscription)
+
+        pending = [
+            subscription
+            for subscription in self._handles.values()
+            if subscription.server_id is None
+        ]
+
+        for subscription in pending:
+            # Set before sending, so the gap precedes the first notification routed
+            # by the reader once the reply arrives.
+            subscription.gap = {
+                "jsonrpc": "2.0",
+                "method": "gapNotification",
+                "params": {
+                    "result": {
+                        "disconnectedAt": disconnected_at,
+                        "reconnectedAt": time.time(),
+                        "error": None,
+                    },
+                    "subscription": subscription.id,
+                },
+            }
+
+        responses = await self._send_requests(
+            [
+                (subscription.method, subscription.params, subscription)
+                for subscription in pending
+            ]
+        )
+        for response in responses:
+            if isinstance(response, Exception):
+                # The new connection failed as well: retried by `_reconnect`.
+                raise response
+
+        for subscription, response in zip(pending, responses):
+            if "result" not in response:
+                gap, subscription.gap = subscription.gap, None
+                gap["params"]["result"]["error"] = response.get("error")
+                await self._deliver(subscription, gap)
+                self._forget(subscription)
+
+        # Signal the gap right away to subscriptions that have not been notified since.
+        for subscription in list(self._handles.values()):
+            if subscription.gap is not None:
+                gap, subscription.gap = subscription.gap, None
+                await self._deliver(subscription, gap)
+
+    def notification_stats(self):
+        """
+        Returns the counters of every notification queue.
+
+        Returns:
+            dict: Queue stats (see NotificationQueue.stats) of the shared queue under
+                "shared", and of each subscription handle under its subscription ID.
+        """
+        stats = {"shared": self._notifications.stats()}
+        for subscription_id, subscription in self._handles.items():
+            if subscription.queue is not None:
+                stats[subscription_id] = subscription.queue.stats()
+        return stats
 
     async def start_ping(self, interval=30):
         """
-        Start sending ping messages to keep the connection alive.
+        Run the heartbeat until the client is disconnected.
+
+        Pings the server every `interval` seconds and records the round-trip time, and
+        checks for staleness in between. A connection that misses a pong or stays silent
+        past `stale_timeout` is replaced; the regular reconnect logic resubscribes and
+        delivers a gapNotification for every subscription.
 
         Args:
             interval (int): The interval in seconds between pings.
         """
-        while self.websocket and not self.websocket.closed:
+        tick = min(interval, self.stale_timeout / 4)
+        last_ping = 0.0
+
+        while not self._closing:
+            await asyncio.sleep(tick)
+            websocket = self.websocket
+            if websocket is None or websocket.closed:
+                # Not connected yet, or reconnecting.
+                continue
+
+            if self._is_stale():
+                self._replace_connection(websocket, "no messages")
+                continue
+
+            if time.monotonic() - last_ping < interval:
+                continue
+            last_ping = time.monotonic()
+
             try:
-                await self.websocket.ping()
-                print("Ping sent")
-                await asyncio.sleep(interval)
+                pong = await websocket.ping()
+                await asyncio.wait_for(pong, self.ping_timeout)
+            except asyncio.TimeoutError:
+                self._ping_timeouts += 1
+                self._replace_connection(websocket, "ping timeout")
+                continue
             except Exception as e:
                 print(f"Error sending ping: {e}")
-                break
+                continue
+
+            self._pings += 1
+            self._rtts.append(time.monotonic() - last_ping)
 
-    async def handle_notifications(self, callback):
+    def _is_stale(self):
+        """
+        Returns whether a slot-paced subscription has been silent for too long.
+
+        Returns:
+            bool: True if the connection should be replaced.
+        """
+        if time.monotonic() - self.last_message_at < self.stale_timeout:
+            return False
+        return any(
+            subscription.kind in CADENCE_KINDS and subscription.server_id is not None
+            for subscription in self._handles.values()
+        )
+
+    def _replace_connection(self, websocket, reason):
+        """
+        Drop a connection without a closing handshake, so the reader starts reconnecting.
+
+        Args:
+            websocket: The connection to drop.
+            reason (str): Why it is replaced.
+        """
+        print(f"Replacing websocket connection: {reason}")
+        self.stale_replacements += 1
+        websocket.transport.abort()
+
+    def heartbeat_stats(self):
+        """
+        Returns the heartbeat metrics.
+
+        Returns:
+            dict: rtt (last ping round-trip time), rtt_avg and rtt_max over recent pings,
+                pings, ping_timeouts, last_message_age (seconds since the last message),
+                stale_replacements and reconnects.
+        """
+        rtts = self._rtts
+        return {
+            "rtt": rtts[-1] if rtts else None,
+            "rtt_avg": sum(rtts) / len(rtts) if rtts else None,
+            "rtt_max": max(rtts) if rtts else None,
+            "pings": self._pings,
+            "ping_timeouts": self._ping_timeouts,
+            "last_message_age": (
+                time.monotonic() - self.last_message_at
+                if self.last_message_at is not None
+                else None
+            ),
+            "stale_replacements": self.stale_replacements,
+            "reconnects": self.reconnects,
+        }
+
+    async def handle_notifications(
+        self, callback, executor=None, key=notification_key, lanes=8
+    ):
         """
         Handle notifications from the WebSocket.
 
         Args:
-            callback (callable): A function to call with each notification.
+            callback (callable): A function to call with each notification. With an
+                executor, a plain function run in the executor (see `dispatch_offloaded`).
+            executor (concurrent.futures.Executor, optional): Thread or process pool to
+                run CPU-heavy callbacks in, keeping the order of notifications per `key`.
+            key (callable, optional): Returns the ordering key of a notification
+                (account pubkey for program notifications, subscription ID otherwise).
+            lanes (int, optional): Number of notifications handled concurrently by the executor.
         """
-        while self.websocket and not self.websocket.closed:
+        if executor is not None:
+            await dispatch_offloaded(
+                self._notifications, callback, executor, key, lanes, self.queue_size
+            )
+            return
+
+        while True:
+            data = await self._notifications.get()
+            if data is _CLOSED:
+                break
+
             try:
-                message = await self.websocket.recv()
-                data = json.loads(message)
-                if "method" in data and data["method"].endswith("Notification"):
-                    await callback(data)
+                await callback(data)
             except Exception as e:
+                # Keep consuming: a stalled consumer would fill the queue and block
+                # the socket reader.
                 print(f"Error handling notification: {e}")
-                break
@@ -6,73 +6,69 @@ class BlockchainStateWS(BaseWS):
     Handles blockchain state subscriptions like slots, roots, and blocks.
     """
 
-    async def slot_subscribe(self):
+    async def slot_subscribe(self, handle=False):
         """
         Subscribe to receive notification anytime a slot is processed by the validator.
 
+        Args:
+            handle (bool, optional): Return a Subscription handle, an async iterator over the
+                notifications of this subscription only, instead of the subscription ID.
+
         Returns:
-            int: The subscription ID.
+            int or Subscription: The subscription ID, or a Subscription handle if `handle` is set.
         """
-        response = await self._send_request("slotSubscribe")
-        if "result" in response:
-            subscription_id = response["result"]
-            self.subscriptions[subscription_id] = "slot"
-            return subscription_id
-        else:
-            raise Exception(f"Error subscribing to slot: {response.get('error')}")
+        return await self._subscribe(
+            "slot",
+            "slotSubscribe",
+            None,
+            "slotUnsubscribe",
+            handle,
+        )
 
     async def slot_unsubscribe(self, subscription_id):
         """
         Unsubscribe from slot notifications.
 
         Args:
-            subscription_id (int): The subscription ID to cancel.
+            subscription_id (int or Subscription): The subscription ID or handle to cancel.
 
         Returns:
             bool: True if unsubscribe was successful, False otherwise.
         """
-        response = await self._send_request("slotUnsubscribe", [subscription_id])
-        if "result" in response:
-            if response["result"]:
-                self.subscriptions.pop(subscription_id, None)
-            return response["result"]
-        else:
-            raise Exception(f"Error unsubscribing from slot: {response.get('error')}")
-
-    async def root_subscribe(self):
+        return await self._unsubscribe("slot", "slotUnsubscribe", subscription_id)
+
+    async def root_subscribe(self, handle=False):
         """
         Subscribe to receive notification anytime a new root is set by the validator.
 
+        Args:
+            handle (bool, optional): Return a Subscription handle, an async iterator over the
+                notifications of this subscription only, instead of the subscription ID.
+
         Returns:
-            int: The subscription ID.
+            int or Subscription: The subscription ID, or a Subscription handle if `handle` is set.
         """
-        response = await self._send_request("rootSubscribe")
-        if "result" in response:
-            subscription_id = response["result"]
-            self.subscriptions[subscription_id] = "root"
-            return subscription_id
-        else:
-            raise Exception(f"Error subscribing to root: {response.get('error')}")
+        return await self._subscribe(
+            "root",
+            "rootSubscribe",
+            None,
+            "rootUnsubscribe",
+            handle,
+        )
 
     async def root_unsubscribe(self, subscription_id):
         """
         Unsubscribe from root notifications.
 
         Args:
-            subscription_id (int): The subscription ID to cancel.
+            subscription_id (int or Subscription): The subscription ID or handle to cancel.
 
         Returns:
             bool: True if unsubscribe was successful, False otherwise.
         """
-        response = await self._send_request("rootUnsubscribe", [subscription_id])
-        if "result" in response:
-            if response["result"]:
-                self.subscriptions.pop(subscription_id, None)
-            return response["result"]
-        else:
-            raise Exception(f"Error unsubscribing from root: {response.get('error')}")
-
-    async def block_subscribe(self, filter_type, config=None):
+        return await self._unsubscribe("root", "rootUnsubscribe", subscription_id)
+
+    async def block_subscribe(self, filter_type, config=None, handle=False):
         """
         Subscribe to receive notification anytime a new block is confirmed or finalized.
         NOTE: This method is marked as unstable in Solana documentation and is not supported by .
@@ -80,37 +76,33 @@ class BlockchainStateWS(BaseWS):
         Args:
             filter_type (str or dict): The filter criteria ("all" or {"mentionsAccountOrProgram": "pubkey"}).
             config (dict, optional): Configuration options.
+            handle (bool, optional): Return a Subscription handle, an async iterator over the
+                notifications of this subscription only, instead of the subscription ID.
 
         Returns:
-            int: The subscription ID.
+            int or Subscription: The subscription ID, or a Subscription handle if `handle` is set.
         """
         print("WARNING: blockSubscribe is marked as unstable and is not supported by .")
         params = [filter_type]
         if config:
             params.append(config)
 
-        response = await self._send_request("blockSubscribe", params)
-        if "result" in response:
-            subscription_id = response["result"]
-            self.subscriptions[subscription_id] = "block"
-            return subscription_id
-        else:
-            raise Exception(f"Error subscribing to block: {response.get('error')}")
+        return await self._subscribe(
+            "block",
+            "blockSubscribe",
+            params,
+            "blockUnsubscribe",
+            handle,
+        )
 
     async def block_unsubscribe(self, subscription_id):
         """
         Unsubscribe from block notifications.
 
         Args:
-            subscription_id (int): The subscription ID to cancel.
+            subscription_id (int or Subscription): The subscription ID or handle to cancel.
 
         Returns:
             bool: True if unsubscribe was successful, False otherwise.
         """
-        response = await self._send_request("blockUnsubscribe", [subscription_id])
-        if "result" in response:
-            if response["result"]:
-                self.subscriptions.pop(subscription_id, None)
-            return response["result"]
-        else:
-            raise Exception(f"Error unsubscribing from block: {response.get('error')}")
+        return await self._unsubscribe("block", "blockUnsubscribe", subscription_id)
@@ -6,7 +6,7 @@ class LogsSubscriptionWS(BaseWS):
     Handles logs-related subscriptions.
     """
 
-    async def logs_subscribe(self, filter_type, config=None):
+    async def logs_subscribe(self, filter_type, config=None, handle=False):
         """
         Subscribe to transaction logging.
 
@@ -16,36 +16,32 @@ class LogsSubscriptionWS(BaseWS):
                 - "allWithVotes": Subscribe to all transactions, including simple vote transactions.
                 - {"mentions": ["pubkey"]}: Subscribe only to transactions mentioning this address.
             config (dict, optional): Configuration options, including commitment level.
+            handle (bool, optional): Return a Subscription handle, an async iterator over the
+                notifications of this subscription only, instead of the subscription ID.
 
         Returns:
-            int: The subscription ID.
+            int or Subscription: The subscription ID, or a Subscription handle if `handle` is set.
         """
         params = [filter_type]
         if config:
             params.append(config)
 
-        response = await self._send_request("logsSubscribe", params)
-        if "result" in response:
-            subscription_id = response["result"]
-            self.subscriptions[subscription_id] = "logs"
-            return subscription_id
-        else:
-            raise Exception(f"Error subscribing to logs: {response.get('error')}")
+        return await self._subscribe(
+            "logs",
+            "logsSubscribe",
+            params,
+            "logsUnsubscribe",
+            handle,
+        )
 
     async def logs_unsubscribe(self, subscription_id):
         """
         Unsubscribe from transaction logging.
 
         Args:
-            subscription_id (int): The subscription ID to cancel.
+            subscription_id (int or Subscription): The subscription ID or handle to cancel.
 
         Returns:
             bool: True if unsubscribe was successful, False otherwise.
         """
-        response = await self._send_request("logsUnsubscribe", [subscription_id])
-        if "result" in response:
-            if response["result"]:
-                self.subscriptions.pop(subscription_id, None)
-            return response["result"]
-        else:
-            raise Exception(f"Error unsubscribing from logs: {response.get('error')}")
+        return await self._unsubscribe("logs", "logsUnsubscribe", subscription_id)
@@ -0,0 +1,178 @@
+import json
+import asyncio
+
+from .subscription import _CLOSED
+
+_METHOD = '"method":"'
+_SUBSCRIPTION = '"subscription":'
+_PUBKEY = '"pubkey":"'
+
+
+class RawNotification:
+    """
+    An undecoded notification.
+
+    Produced by the socket reader when `decode_notifications` is off: only the method
+    and subscription ID are located in the raw JSON text, so full JSON decoding can
+    happen in the consumer, or in a worker process (see `dispatch_offloaded`).
+    """
+
+    __slots__ = ("data", "method", "subscription", "_start", "_end")
+
+    def __init__(self, data, method, subscription, start, end):
+        self.data = data
+        self.method = method
+        self.subscription = subscription
+        self._start = start
+        self._end = end
+
+    def __repr__(self):
+        return f"RawNotification(method={self.method!r}, subscription={self.subscription!r})"
+
+    @classmethod
+    def peek(cls, message):
+        """
+        Locate the method and subscription ID of a notification without decoding it.
+
+        Relies on the field order of the server's serializer (method first,
+        `"subscription":<id>}}` last) and returns None whenever the message does not
+        match, so the caller can fall back to a full decode.
+
+        Args:
+            message (str): The raw message.
+
+        Returns:
+            RawNotification or None: The notification, or None if it cannot be peeked.
+        """
+        start = message.find(_METHOD, 0, 64)
+        if start < 0:
+            return None
+        start += len(_METHOD)
+        end = message.find('"', start, start + 48)
+        if end < 0 or not message.endswith("Notification", start, end):
+            return None
+        method = message[start:end]
+
+        start = message.rfind(_SUBSCRIPTION)
+        if start < 0:
+            return None
+        start += len(_SUBSCRIPTION)
+        end = message.find("}", start)
+        if end < 0 or message[end:].rstrip() != "}}":
+            return None
+        try:
+            subscription = int(message[start:end])
+        except ValueError:
+            return None
+
+        return cls(message, method, subscription, start, end)
+
+    @property
+    def pubkey(self):
+        """The account pubkey of a programNotification, located without decoding."""
+        start = self.data.find(_PUBKEY)
+        if start < 0:
+            return None
+        start += len(_PUBKEY)
+        return self.data[start : self.data.find('"', start)]
+
+    def with_subscription(self, subscription):
+        """
+        Returns a copy of the notification carrying another subscription ID.
+
+        Args:
+            subscription (int): The subscription ID.
+
+        Returns:
+            RawNotification: The rewritten notification.
+        """
+        if subscription == self.subscription:
+            return self
+        data = f"{self.data[:self._start]}{subscription}{self.data[self._end:]}"
+        return RawNotification(
+            data,
+            self.method,
+            subscription,
+            self._start,
+            self._start + len(str(subscription)),
+        )
+
+    def decode(self):
+        """
+        Decode the notification.
+
+        Returns:
+            dict: The decoded notification.
+        """
+        return json.loads(self.data)
+
+
+def notification_key(data):
+    """
+    Returns the ordering key of a notification: the account pubkey for program
+    notifications, the subscription ID otherwise.
+
+    Args:
+        data (dict or RawNotification): The notification.
+
+    Returns:
+        The ordering key.
+    """
+    if isinstance(data, RawNotification):
+        if data.method == "programNotification":
+            return data.pubkey
+        return data.subscription
+
+    params = data.get("params", {})
+    if data.get("method") == "programNotification":
+        return params.get("result", {}).get("value", {}).get("pubkey")
+    return params.get("subscription")
+
+
+async def dispatch_offloaded(
+    queue, handler, executor, key=notification_key, lanes=8, lane_size=256
+):
+    """
+    Run a notification handler in a thread or process pool, keeping per-key order.
+
+    Notifications are hashed by `key` onto a fixed number of lanes. Each lane hands its
+    notifications to the executor one at a time, so notifications with the same key are
+    handled in arrival order while different lanes run in parallel. Undecoded
+    notifications are passed to the handler as raw JSON text, so decoding happens in the
+    worker too.
+
+    Args:
+        queue (NotificationQueue): The queue to consume until it is closed.
+        handler (callable): A plain (not async) function called with each notification.
+            Must be picklable for a process pool.
+        executor (concurrent.futures.Executor): The executor running the handler.
+        key (callable, optional): Returns the ordering key of a notification.
+        lanes (int, optional): Number of notifications handled concurrently.
+        lane_size (int, optional): Number of notifications buffered per lane.
+    """
+    loop = asyncio.get_running_loop()
+    lane_queues = [asyncio.Queue(lane_size) for _ in range(lanes)]
+
+    async def run_lane(lane):
+        while True:
+            data = await lane.get()
+            if data is _CLOSED:
+                return
+            if isinstance(data, RawNotification):
+                data = data.data
+            try:
+                await loop.run_in_executor(executor, handler, data)
+            except Exception as e:
+                print(f"Error handling notification: {e}")
+
+    workers = [asyncio.create_task(run_lane(lane)) for lane in lane_queues]
+    try:
+        while True:
+            data = await queue.get()
+            if data is _CLOSED:
+                break
+            await lane_queues[hash(key(data)) % lanes].put(data)
+    finally:
+        for lane in lane_queues:
+            await lane.put(_CLOSED)
+        await asyncio.gather(*workers)
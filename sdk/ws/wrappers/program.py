@@ -6,7 +6,7 @@ class ProgramSubscriptionWS(BaseWS):
     Handles program-related subscriptions.
     """
 
-    async def program_subscribe(self, program_id, config=None):
+    async def program_subscribe(self, program_id, config=None, handle=False):
         """
         Subscribe to a program to receive notifications when the lamports or data for an account
         owned by the given program changes.
@@ -17,38 +17,32 @@ class ProgramSubscriptionWS(BaseWS):
                 - commitment (str, optional): Commitment level.
                 - encoding (str, optional): Encoding format (base58, base64, base64+zstd, jsonParsed).
                 - filters (list, optional): Filters to refine the results.
+            handle (bool, optional): Return a Subscription handle, an async iterator over the
+                notifications of this subscription only, instead of the subscription ID.
 
         Returns:
-            int: The subscription ID.
+            int or Subscription: The subscription ID, or a Subscription handle if `handle` is set.
         """
         params = [program_id]
         if config:
             params.append(config)
 
-        response = await self._send_request("programSubscribe", params)
-        if "result" in response:
-            subscription_id = response["result"]
-            self.subscriptions[subscription_id] = "program"
-            return subscription_id
-        else:
-            raise Exception(f"Error subscribing to program: {response.get('error')}")
+        return await self._subscribe(
+            "program",
+            "programSubscribe",
+            params,
+            "programUnsubscribe",
+            handle,
+        )
 
     async def program_unsubscribe(self, subscription_id):
         """
         Unsubscribe from program-owned account change notifications.
 
         Args:
-            subscription_id (int): The subscription ID to cancel.
+            subscription_id (int or Subscription): The subscription ID or handle to cancel.
 
         Returns:
             bool: True if unsubscribe was successful, False otherwise.
         """
-        response = await self._send_request("programUnsubscribe", [subscription_id])
-        if "result" in response:
-            if response["result"]:
-                self.subscriptions.pop(subscription_id, None)
-            return response["result"]
-        else:
-            raise Exception(
-                f"Error unsubscribing from program: {response.get('error')}"
-            )
+        return await self._unsubscribe("program", "programUnsubscribe", subscription_id)
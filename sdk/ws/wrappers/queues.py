@@ -0,0 +1,207 @@
+import asyncio
+import time
+from collections import deque
+
+from .notification import RawNotification
+
+BLOCK = "block"
+DROP_OLDEST = "drop_oldest"
+DROP_NEWEST = "drop_newest"
+COALESCE = "coalesce"
+
+POLICIES = (BLOCK, DROP_OLDEST, DROP_NEWEST, COALESCE)
+
+
+def coalesce_key(data):
+    """
+    Returns the key under which a notification replaces older queued ones.
+
+    Account notifications are keyed by subscription (one account each), program
+    notifications by subscription and account pubkey, and slot/root notifications by
+    subscription. Other notifications (logs, signatures, ...) are never coalesced.
+
+    Args:
+        data (dict or RawNotification): The notification.
+
+    Returns:
+        tuple or None: The coalescing key, or None if the notification must be kept.
+    """
+    if isinstance(data, RawNotification):
+        if data.method in (
+            "accountNotification",
+            "slotNotification",
+            "rootNotification",
+        ):
+            return (data.method, data.subscription)
+        if data.method == "programNotification":
+            return (data.method, data.subscription, data.pubkey)
+        return None
+
+    method = data.get("method")
+    params = data.get("params", {})
+
+    if method in ("accountNotification", "slotNotification", "rootNotification"):
+        return (method, params.get("subscription"))
+    if method == "programNotification":
+        value = params.get("result", {}).get("value", {})
+        return (method, params.get("subscription"), value.get("pubkey"))
+    return None
+
+
+class NotificationQueue:
+    """
+    Bounded notification queue with a configurable policy for when it is full.
+
+    Policies:
+        - block: the producer (the socket reader) waits for room.
+        - drop_oldest: the oldest queued notification is discarded.
+        - drop_newest: the incoming notification is discarded.
+        - coalesce: a notification replaces the queued one with the same `key`
+          (latest account state wins); notifications without a key block when full.
+
+    Counters for dropped and coalesced notifications, queue depth and queueing lag are
+    available from `stats()`.
+    """
+
+    def __init__(self, maxsize=1024, policy=BLOCK, key=coalesce_key):
+        """
+        Initialize the NotificationQueue.
+
+        Args:
+            maxsize (int, optional): Maximum number of queued notifications (0 for unbounded).
+            policy (str, optional): One of block, drop_oldest, drop_newest or coalesce.
+            key (callable, optional): Returns the coalescing key of a notification, or None.
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown queue policy: {policy}")
+
+        self.maxsize = maxsize
+        self.policy = policy
+        self.key = key
+
+        self.enqueued = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.blocked = 0
+        self.high_water = 0
+        self.max_lag = 0.0
+
+        self._items = deque()  # (enqueue time, item or coalescing key, coalesced)
+        self._latest = {}  # coalescing key -> latest notification
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+
+    def qsize(self):
+        return len(self._items)
+
+    def empty(self):
+        return not self._items
+
+    def full(self):
+        return 0 < self.maxsize <= len(self._items)
+
+    async def put(self, item):
+        """
+        Queue a notification according to the policy.
+
+        Args:
+            item (dict): The notification.
+        """
+        key = None
+        if self.policy == COALESCE:
+            key = self.key(item)
+            if key is not None and key in self._latest:
+                self._latest[key] = item
+                self.coalesced += 1
+                return
+
+        while self.full():
+            if self.policy == DROP_NEWEST:
+                self.dropped += 1
+                return
+            if self.policy == DROP_OLDEST:
+                self._pop()
+                self.dropped += 1
+                break
+
+            self.blocked += 1
+            self._not_full.clear()
+            await self._not_full.wait()
+
+        self._push(item, key)
+
+    def put_nowait(self, item):
+        """
+        Queue an item regardless of the size limit (used for control items).
+
+        Args:
+            item: The item.
+        """
+        self._push(item, None)
+
+    async def get(self):
+        """
+        Remove and return the oldest notification, waiting until one is available.
+
+        Returns:
+            dict: The notification.
+        """
+        while not self._items:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        return self.get_nowait()
+
+    def get_nowait(self):
+        """
+        Remove and return the oldest notification.
+
+        Returns:
+            dict: The notification.
+        """
+        if not self._items:
+            raise asyncio.QueueEmpty
+
+        enqueued_at, item = self._pop()
+        lag = time.monotonic() - enqueued_at
+        if lag > self.max_lag:
+            self.max_lag = lag
+        return item
+
+    def stats(self):
+        """
+        Returns the queue counters.
+
+        Returns:
+            dict: policy, depth, high_water, enqueued, dropped, coalesced, blocked and
+                max_lag (seconds a notification waited in the queue).
+        """
+        return {
+            "policy": self.policy,
+            "depth": len(self._items),
+            "high_water": self.high_water,
+            "enqueued": self.enqueued,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "blocked": self.blocked,
+            "max_lag": self.max_lag,
+        }
+
+    def _push(self, item, key):
+        if key is None:
+            self._items.append((time.monotonic(), item, False))
+        else:
+            self._latest[key] = item
+            self._items.append((time.monotonic(), key, True))
+
+        self.enqueued += 1
+        if len(self._items) > self.high_water:
+            self.high_water = len(self._items)
+        self._not_empty.set()
+
+    def _pop(self):
+        enqueued_at, item, coalesced = self._items.popleft()
+        if coalesced:
+            item = self._latest.pop(item)
+        self._not_full.set()
+        return enqueued_at, item
@@ -6,7 +6,7 @@ class SignatureSubscriptionWS(BaseWS):
     Handles signature-related subscriptions.
     """
 
-    async def signature_subscribe(self, signature, config=None):
+    async def signature_subscribe(self, signature, config=None, handle=False):
         """
         Subscribe to receive a notification when the transaction with the given signature
         reaches the specified commitment level.
@@ -16,38 +16,34 @@ class SignatureSubscriptionWS(BaseWS):
             config (dict, optional): Configuration options.
                 - commitment (str, optional): Commitment level.
                 - enableReceivedNotification (bool, optional): Whether to subscribe for received notifications.
+            handle (bool, optional): Return a Subscription handle, an async iterator over the
+                notifications of this subscription only, instead of the subscription ID.
 
         Returns:
-            int: The subscription ID.
+            int or Subscription: The subscription ID, or a Subscription handle if `handle` is set.
         """
         params = [signature]
         if config:
             params.append(config)
 
-        response = await self._send_request("signatureSubscribe", params)
-        if "result" in response:
-            subscription_id = response["result"]
-            self.subscriptions[subscription_id] = "signature"
-            return subscription_id
-        else:
-            raise Exception(f"Error subscribing to signature: {response.get('error')}")
+        return await self._subscribe(
+            "signature",
+            "signatureSubscribe",
+            params,
+            "signatureUnsubscribe",
+            handle,
+        )
 
     async def signature_unsubscribe(self, subscription_id):
         """
         Unsubscribe from signature confirmation notification.
 
         Args:
-            subscription_id (int): The subscription ID to cancel.
+            subscription_id (int or Subscription): The subscription ID or handle to cancel.
 
         Returns:
             bool: True if unsubscribe was successful, False otherwise.
         """
-        response = await self._send_request("signatureUnsubscribe", [subscription_id])
-        if "result" in response:
-            if response["result"]:
-                self.subscriptions.pop(subscription_id, None)
-            return response["result"]
-        else:
-            raise Exception(
-                f"Error unsubscribing from signature: {response.get('error')}"
-            )
+        return await self._unsubscribe(
+            "signature", "signatureUnsubscribe", subscription_id
+        )
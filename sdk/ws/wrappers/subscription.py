@@ -0,0 +1,90 @@
+# Placed on a notification queue when it is closed, to wake up consumers.
+_CLOSED = object()
+
+
+class Subscription:
+    """
+    Handle to a single WebSocket subscription.
+
+    Handles returned by the `*_subscribe(..., handle=True)` methods are async iterators
+    over the notifications of that subscription only, fed from their own bounded
+    NotificationQueue.
+
+        async with await client.account_subscribe(pubkey, handle=True) as sub:
+            async for notification in sub:
+                ...
+    """
+
+    def __init__(self, client, kind, method, params, unsubscribe_method, queue=None):
+        """
+        Initialize the Subscription.
+
+        Args:
+            client (BaseWS): The client owning the subscription.
+            kind (str): The subscription type (account, program, logs, ...).
+            method (str): The subscribe method name.
+            params (list): The parameters of the subscribe request.
+            unsubscribe_method (str): The matching unsubscribe method name.
+            queue (NotificationQueue, optional): Queue feeding the handle. Without a queue,
+                notifications go to `handle_notifications` instead.
+        """
+        self.client = client
+        self.kind = kind
+        self.method = method
+        self.params = params
+        self.unsubscribe_method = unsubscribe_method
+        self.id = None  # stable client-side ID
+        self.server_id = None  # ID assigned by the server on the current connection
+        self.gap = None  # gapNotification to deliver before the next notification
+        self.queue = queue
+        self.closed = False
+
+    def __repr__(self):
+        return f"Subscription(kind={self.kind!r}, id={self.id!r})"
+
+    def __aiter__(self):
+        if self.queue is None:
+            raise TypeError("Subscription was created without handle=True")
+        return self
+
+    async def __anext__(self):
+        if self.closed and self.queue.empty():
+            raise StopAsyncIteration
+
+        data = await self.queue.get()
+        if data is _CLOSED:
+            raise StopAsyncIteration
+        return data
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        if not self.closed:
+            await self.unsubscribe()
+
+    async def unsubscribe(self):
+        """
+        Cancel the subscription.
+
+        Returns:
+            bool: True if unsubscribe was successful, False otherwise.
+        """
+        return await self.client._unsubscribe(self.kind, self.unsubscribe_method, self)
+
+    def _close(self, discard=False):
+        """
+        Stop iteration once the queued notifications have been consumed.
+
+        Args:
+            discard (bool, optional): Drop the queued notifications and stop right away.
+        """
+        self.closed = True
+        if self.queue is None:
+            return
+
+        if discard:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+        if self.queue.empty():
+            self.queue.put_nowait(_CLOSED)
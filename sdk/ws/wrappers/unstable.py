@@ -6,80 +6,72 @@ class UnstableSubscriptionWS(BaseWS):
     Handles unstable subscription types that may not be fully supported by .
     """
 
-    async def slots_updates_subscribe(self):
+    async def slots_updates_subscribe(self, handle=False):
         """
         Subscribe to receive a notification from the validator on a variety of updates on every slot.
         NOTE: This method is marked as unstable in Solana documentation and is not supported by .
 
+        Args:
+            handle (bool, optional): Return a Subscription handle, an async iterator over the
+                notifications of this subscription only, instead of the subscription ID.
+
         Returns:
-            int: The subscription ID.
+            int or Subscription: The subscription ID, or a Subscription handle if `handle` is set.
         """
         print(
             "WARNING: slotsUpdatesSubscribe is marked as unstable and is not supported by ."
         )
-        response = await self._send_request("slotsUpdatesSubscribe")
-        if "result" in response:
-            subscription_id = response["result"]
-            self.subscriptions[subscription_id] = "slots_updates"
-            return subscription_id
-        else:
-            raise Exception(
-                f"Error subscribing to slots updates: {response.get('error')}"
-            )
+        return await self._subscribe(
+            "slots_updates",
+            "slotsUpdatesSubscribe",
+            None,
+            "slotsUpdatesUnsubscribe",
+            handle,
+        )
 
     async def slots_updates_unsubscribe(self, subscription_id):
         """
         Unsubscribe from slot-update notifications.
 
         Args:
-            subscription_id (int): The subscription ID to cancel.
+            subscription_id (int or Subscription): The subscription ID or handle to cancel.
 
         Returns:
             bool: True if unsubscribe was successful, False otherwise.
         """
-        response = await self._send_request(
-            "slotsUpdatesUnsubscribe", [subscription_id]
+        return await self._unsubscribe(
+            "slots_updates", "slotsUpdatesUnsubscribe", subscription_id
         )
-        if "result" in response:
-            if response["result"]:
-                self.subscriptions.pop(subscription_id, None)
-            return response["result"]
-        else:
-            raise Exception(
-                f"Error unsubscribing from slots updates: {response.get('error')}"
-            )
 
-    async def vote_subscribe(self):
+    async def vote_subscribe(self, handle=False):
         """
         Subscribe to receive notification anytime a new vote is observed in gossip.
         NOTE: This method is marked as unstable in Solana documentation and is not supported by .
 
+        Args:
+            handle (bool, optional): Return a Subscription handle, an async iterator over the
+                notifications of this subscription only, instead of the subscription ID.
+
         Returns:
-            int: The subscription ID.
+            int or Subscription: The subscription ID, or a Subscription handle if `handle` is set.
         """
         print("WARNING: voteSubscribe is marked as unstable and is not supported by .")
-        response = await self._send_request("voteSubscribe")
-        if "result" in response:
-            subscription_id = response["result"]
-            self.subscriptions[subscription_id] = "vote"
-            return subscription_id
-        else:
-            raise Exception(f"Error subscribing to vote: {response.get('error')}")
+        return await self._subscribe(
+            "vote",
+            "voteSubscribe",
+            None,
+            "voteUnsubscribe",
+            handle,
+        )
 
     async def vote_unsubscribe(self, subscription_id):
         """
         Unsubscribe from vote notifications.
 
         Args:
-            subscription_id (int): The subscription ID to cancel.
+            subscription_id (int or Subscription): The subscription ID or handle to cancel.
 
         Returns:
             bool: True if unsubscribe was successful, False otherwise.
         """
-        response = await self._send_request("voteUnsubscribe", [subscription_id])
-        if "result" in response:
-            if response["result"]:
-                self.subscriptions.pop(subscription_id, None)
-            return response["result"]
-        else:
-            raise Exception(f"Error unsubscribing from vote: {response.get('error')}")
+        return await self._unsubscribe("vote", "voteUnsubscribe", subscription_id)